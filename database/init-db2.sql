@@ -21,6 +21,7 @@ CREATE INDEX IF NOT EXISTS idx_articles_status ON articles(status);
 CREATE INDEX IF NOT EXISTS idx_articles_author ON articles(author);
 CREATE INDEX IF NOT EXISTS idx_articles_category ON articles(category);
 CREATE INDEX IF NOT EXISTS idx_articles_created_at ON articles(created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_articles_updated_at ON articles(updated_at DESC);
 CREATE INDEX IF NOT EXISTS idx_articles_published_at ON articles(published_at DESC) WHERE published_at IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_articles_tags ON articles USING GIN (tags);
 CREATE INDEX IF NOT EXISTS idx_articles_title_content_fts ON articles USING GIN (
@@ -8,7 +8,20 @@ from app.models.article import db
 from app.routes import articles_bp
 from app.services.kafka_producer import KafkaProducerService
 from app.services.article_service import ArticleService
+from app.services.count_strategy import build_count_strategy
+from app.services.view_counter import ViewCounter
+from app.services.article_cache import ArticleCache
+from app.services.article_counts import ArticleCounts
+from app.services.article_facets import ArticleFacets
+from app.services.trending import TrendingRanking
+from app.services.outbox_relay import OutboxRelay
+from app.services.read_routing import ReplicaRouter
+from app.services.readiness import ReadinessProbe
+from app.services.cache_invalidation import CacheInvalidationListener, KafkaEventSource
 from app.utils.metrics import init_metrics
+from app.utils.compression import init_compression
+from app.utils.db_instrumentation import InstrumentedQueuePool, init_db_instrumentation, instrument_engine
+from app.utils.admission import init_admission_control
 
 # Configure logging
 logging.basicConfig(
@@ -38,43 +51,164 @@ def create_app(config_name=None):
     app.config.from_object(config[config_name])
     logger.info(f"Loaded configuration: {config_name}")
 
+    # Pooled engines measure checkout waits (admission control, pool metrics)
+    if 'pool_size' in app.config['SQLALCHEMY_ENGINE_OPTIONS']:
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+            **app.config['SQLALCHEMY_ENGINE_OPTIONS'],
+            'poolclass': InstrumentedQueuePool
+        }
+
     # Initialize extensions
     db.init_app(app)
     CORS(app, resources={r"/api/*": {"origins": app.config['CORS_ORIGINS']}})
     Migrate(app, db)
 
-    # Initialize Kafka producer
+    # Per-statement latency, slow query log and N+1 detection
+    if app.config.get('DB_INSTRUMENTATION_ENABLED', True):
+        init_db_instrumentation(app, db)
+
+    # Shed load before it queues behind the connection pool
+    if app.config.get('ADMISSION_CONTROL_ENABLED', True):
+        init_admission_control(app)
+
+    # Services with background threads, started by start_background_services
+    background_services = []
+
+    # Initialize Kafka producer (connects in the background)
     kafka_producer = None
     if app.config.get('KAFKA_ENABLED', True):
-        try:
-            kafka_producer = KafkaProducerService(
-                bootstrap_servers=app.config['KAFKA_BOOTSTRAP_SERVERS'],
-                topic=app.config['KAFKA_TOPIC_ARTICLES']
-            )
-            logger.info("Kafka producer initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize Kafka producer: {str(e)}")
+        kafka_producer = KafkaProducerService(
+            bootstrap_servers=app.config['KAFKA_BOOTSTRAP_SERVERS'],
+            topic=app.config['KAFKA_TOPIC_ARTICLES'],
+            linger_ms=app.config['KAFKA_PRODUCER_LINGER_MS'],
+            batch_size=app.config['KAFKA_PRODUCER_BATCH_SIZE'],
+            compression_type=app.config['KAFKA_PRODUCER_COMPRESSION'],
+            max_in_flight=app.config['KAFKA_PRODUCER_MAX_IN_FLIGHT'],
+            retry_delay=app.config['KAFKA_CONNECT_RETRY_SECONDS']
+        )
+        background_services.append(kafka_producer)
 
     # Initialize services
-    article_service = ArticleService(kafka_producer=kafka_producer)
+    count_strategy = build_count_strategy(
+        app.config['PAGINATION_COUNT_STRATEGY'],
+        cache_ttl=app.config['PAGINATION_COUNT_CACHE_TTL'],
+        cache_size=app.config['PAGINATION_COUNT_CACHE_SIZE']
+    )
+
+    trending = None
+    if app.config.get('TRENDING_ENABLED', True):
+        trending = TrendingRanking(
+            windows=app.config['TRENDING_WINDOWS'],
+            top_k=app.config['TRENDING_TOP_K'],
+            refresh_interval=app.config['TRENDING_REFRESH_INTERVAL'],
+            bucket_seconds=app.config['TRENDING_BUCKET_SECONDS']
+        )
+        trending.init_app(app)
+        background_services.append(trending)
+
+    view_counter = None
+    if app.config.get('VIEW_COUNTER_ENABLED', True):
+        view_counter = ViewCounter(
+            flush_interval=app.config['VIEW_COUNTER_FLUSH_INTERVAL'],
+            flush_threshold=app.config['VIEW_COUNTER_FLUSH_THRESHOLD'],
+            max_pending=app.config['VIEW_COUNTER_MAX_PENDING'],
+            bucket_seconds=trending.bucket_seconds if trending else None
+        )
+        view_counter.init_app(app)
+        background_services.append(view_counter)
+
+    article_cache = None
+    if app.config.get('ARTICLE_CACHE_ENABLED', True):
+        article_cache = ArticleCache(
+            max_size=app.config['ARTICLE_CACHE_MAX_SIZE'],
+            ttl=app.config['ARTICLE_CACHE_TTL']
+        )
+
+    article_facets = None
+    if app.config.get('ARTICLE_FACETS_ENABLED', True):
+        article_facets = ArticleFacets(
+            rebuild_interval=app.config['ARTICLE_FACETS_REBUILD_INTERVAL']
+        )
+        article_facets.init_app(app)
+        background_services.append(article_facets)
+
+    article_counts = None
+    if app.config.get('ARTICLE_COUNTS_ENABLED', True):
+        article_counts = ArticleCounts(
+            reconcile_interval=app.config['ARTICLE_COUNTS_RECONCILE_INTERVAL'],
+            min_interval=app.config['ARTICLE_COUNTS_MIN_INTERVAL'],
+            article_facets=article_facets
+        )
+        article_counts.init_app(app)
+        background_services.append(article_counts)
+
+    replica_router = None
+    if app.config.get('REPLICA_DATABASE_URL'):
+        replica_router = ReplicaRouter(
+            app.config['REPLICA_DATABASE_URL'],
+            max_lag=app.config['REPLICA_MAX_LAG_SECONDS'],
+            check_interval=app.config['REPLICA_LAG_CHECK_INTERVAL'],
+            read_your_writes=app.config['READ_YOUR_WRITES_SECONDS'],
+            engine_options=app.config['SQLALCHEMY_ENGINE_OPTIONS']
+        )
+        if app.config.get('DB_INSTRUMENTATION_ENABLED', True):
+            instrument_engine(replica_router.engine, app.config['DB_SLOW_QUERY_MS'])
+        replica_router.init_app(app)
+        background_services.append(replica_router)
+
+    outbox_relay = None
+    if kafka_producer and app.config.get('OUTBOX_ENABLED', True):
+        outbox_relay = OutboxRelay(
+            kafka_producer,
+            interval=app.config['OUTBOX_RELAY_INTERVAL'],
+            batch_size=app.config['OUTBOX_BATCH_SIZE']
+        )
+        outbox_relay.init_app(app)
+        background_services.append(outbox_relay)
+
+    article_service = ArticleService(
+        kafka_producer=kafka_producer,
+        count_strategy=count_strategy,
+        view_counter=view_counter,
+        article_cache=article_cache,
+        outbox_relay=outbox_relay,
+        article_counts=article_counts,
+        replica_router=replica_router,
+        article_facets=article_facets,
+        trending=trending
+    )
     app.article_service = article_service
 
+    # Keep caches coherent across workers and replicas
+    if app.config.get('KAFKA_ENABLED', True) and app.config.get('CACHE_INVALIDATION_ENABLED', True):
+        listener = CacheInvalidationListener(
+            source_factory=lambda: KafkaEventSource(
+                bootstrap_servers=app.config['KAFKA_BOOTSTRAP_SERVERS'],
+                topic=app.config['KAFKA_TOPIC_ARTICLES']
+            ),
+            article_service=article_service
+        )
+        background_services.append(listener)
+        app.cache_invalidation_listener = listener
+
+    app.readiness_probe = ReadinessProbe(
+        kafka_producer,
+        kafka_required=outbox_relay is None,
+        cache_ttl=app.config['READINESS_CACHE_SECONDS']
+    )
+
     # Register blueprints
     app.register_blueprint(articles_bp)
     logger.info("Blueprints registered")
 
+    # Negotiated response compression
+    if app.config.get('COMPRESSION_ENABLED', True):
+        init_compression(app)
+
     # Initialize Prometheus metrics
     init_metrics(app)
     logger.info("Prometheus metrics initialized")
 
-    # Create database tables
-    with app.app_context():
-        try:
-            db.create_all()
-            logger.info("Database tables created")
-        except Exception as e:
-            logger.error(f"Error creating database tables: {str(e)}")
-
     @app.route('/')
     def index():
         """Root endpoint"""
@@ -83,11 +217,45 @@ def create_app(config_name=None):
             'version': '1.0.0',
             'endpoints': {
                 'health': '/api/v1/health',
+                'ready': '/api/v1/ready',
                 'articles': '/api/v1/articles',
                 'metrics': '/metrics',
                 'docs': '/docs'
             }
         }
 
+    # The schema is managed by migrations (flask db upgrade), not created here
+    app.extensions['background_services'] = background_services
+    if app.config['START_BACKGROUND_SERVICES']:
+        start_background_services(app)
+
     logger.info("Flask application created successfully")
     return app
+
+
+def start_background_services(app):
+    """
+    Start the background threads of the application's services
+
+    Called by create_app, or once per worker after fork when gunicorn
+    preloads the application in the master process (threads and pooled
+    connections do not survive a fork).
+
+    Args:
+        app: Flask application
+    """
+    if app.extensions.get('background_services_started'):
+        return
+    app.extensions['background_services_started'] = True
+
+    # Drop connections inherited from the master; the pools reconnect lazily
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+    if app.article_service.replica_router:
+        app.article_service.replica_router.engine.dispose(close=False)
+
+    for service in app.extensions['background_services']:
+        service.start()
+
+    logger.info(f"Started {len(app.extensions['background_services'])} background services")
@@ -0,0 +1,78 @@
+"""
+ASGI serving mode
+
+The article routes run natively on an event loop with async SQLAlchemy
+(asyncpg on PostgreSQL); every other route is served by the Flask app
+through a WSGI adapter, so the URL surface is the same in both modes.
+
+Usage:
+    gunicorn -c gunicorn.conf.py -k uvicorn.workers.UvicornWorker "app.asgi:create_asgi_app()"
+"""
+
+import logging
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.wsgi import WSGIMiddleware
+from starlette.routing import Mount
+from app import create_app
+from app.routes.articles_async import article_routes
+from app.services.async_article_service import AsyncArticleService, async_database_url
+from app.utils.compression import build_compressor
+from app.utils.db_instrumentation import instrument_engine
+
+logger = logging.getLogger(__name__)
+
+
+def create_asgi_app(config_name=None):
+    """
+    ASGI application factory
+
+    Args:
+        config_name (str): Configuration name (development, production, testing)
+
+    Returns:
+        Starlette: ASGI application instance
+    """
+    # The Flask app owns the configuration and the background services
+    flask_app = create_app(config_name)
+    config = flask_app.config
+
+    url = config.get('ASYNC_DATABASE_URL') or async_database_url(config['SQLALCHEMY_DATABASE_URI'])
+    engine_options = dict(config['SQLALCHEMY_ENGINE_OPTIONS'])
+    # The async engine needs an asyncio-compatible pool
+    engine_options.pop('poolclass', None)
+    if url.startswith('sqlite'):
+        # aiosqlite file databases use NullPool: pool sizing does not apply
+        engine_options.pop('pool_size', None)
+        engine_options.pop('max_overflow', None)
+
+    engine = create_async_engine(url, **engine_options)
+    if config.get('DB_INSTRUMENTATION_ENABLED', True):
+        instrument_engine(engine.sync_engine, config['DB_SLOW_QUERY_MS'])
+
+    async def dispose_engine():
+        await engine.dispose()
+
+    app = Starlette(
+        routes=[
+            *article_routes,
+            Mount('/', app=WSGIMiddleware(flask_app))
+        ],
+        middleware=[
+            Middleware(CORSMiddleware, allow_origins=config['CORS_ORIGINS'],
+                       allow_methods=['*'], allow_headers=['*'])
+        ],
+        on_shutdown=[dispose_engine]
+    )
+    app.state.flask_app = flask_app
+    app.state.engine = engine
+    app.state.article_service = AsyncArticleService(
+        flask_app.article_service,
+        async_sessionmaker(engine, expire_on_commit=False)
+    )
+    app.state.compressor = build_compressor(config) if config.get('COMPRESSION_ENABLED', True) else None
+
+    logger.info(f"ASGI application created ({engine.dialect.name}+{engine.driver})")
+    return app
@@ -17,14 +17,117 @@ class Config:
         'pool_pre_ping': True,
     }
 
+    # ASGI mode (app.asgi): async driver URL, derived from DATABASE_URL when unset
+    ASYNC_DATABASE_URL = os.getenv('ASYNC_DATABASE_URL')
+
+    # Read replica (DB2, filled by kafka-sync); reads stay on the primary when unset
+    REPLICA_DATABASE_URL = os.getenv('REPLICA_DATABASE_URL')
+    REPLICA_MAX_LAG_SECONDS = float(os.getenv('REPLICA_MAX_LAG_SECONDS', 5))
+    REPLICA_LAG_CHECK_INTERVAL = float(os.getenv('REPLICA_LAG_CHECK_INTERVAL', 5))
+    READ_YOUR_WRITES_SECONDS = float(os.getenv('READ_YOUR_WRITES_SECONDS', 10))
+
+    # Query instrumentation: slow query log and per-request N+1 warning
+    DB_INSTRUMENTATION_ENABLED = os.getenv('DB_INSTRUMENTATION_ENABLED', 'true').lower() == 'true'
+    DB_SLOW_QUERY_MS = float(os.getenv('DB_SLOW_QUERY_MS', 200))
+    DB_N_PLUS_ONE_THRESHOLD = int(os.getenv('DB_N_PLUS_ONE_THRESHOLD', 10))
+
     # Kafka
     KAFKA_BOOTSTRAP_SERVERS = os.getenv('KAFKA_BOOTSTRAP_SERVERS', 'localhost:9092')
     KAFKA_TOPIC_ARTICLES = os.getenv('KAFKA_TOPIC_ARTICLES', 'article-events')
 
+    # Seconds between background connection attempts while the broker is unreachable
+    KAFKA_CONNECT_RETRY_SECONDS = float(os.getenv('KAFKA_CONNECT_RETRY_SECONDS', 5))
+
+    # Kafka producer batching (messages are keyed by article id)
+    KAFKA_PRODUCER_LINGER_MS = int(os.getenv('KAFKA_PRODUCER_LINGER_MS', 5))
+    KAFKA_PRODUCER_BATCH_SIZE = int(os.getenv('KAFKA_PRODUCER_BATCH_SIZE', 65536))
+    KAFKA_PRODUCER_COMPRESSION = os.getenv('KAFKA_PRODUCER_COMPRESSION', 'gzip')
+    KAFKA_PRODUCER_MAX_IN_FLIGHT = int(os.getenv('KAFKA_PRODUCER_MAX_IN_FLIGHT', 1))
+
+    # Transactional outbox: events are written with the article change and
+    # relayed to Kafka in batches by a background thread
+    OUTBOX_ENABLED = os.getenv('OUTBOX_ENABLED', 'true').lower() == 'true'
+    OUTBOX_RELAY_INTERVAL = float(os.getenv('OUTBOX_RELAY_INTERVAL', 1.0))
+    OUTBOX_BATCH_SIZE = int(os.getenv('OUTBOX_BATCH_SIZE', 100))
+
+    # Startup: background threads start with the app unless gunicorn preloads
+    # it, in which case each worker starts them after fork (gunicorn.conf.py)
+    START_BACKGROUND_SERVICES = os.getenv('START_BACKGROUND_SERVICES', 'true').lower() == 'true'
+
+    # Seconds the /ready database and Kafka checks are cached
+    READINESS_CACHE_SECONDS = float(os.getenv('READINESS_CACHE_SECONDS', 5))
+
+    # Admission control: shed requests with 503 + Retry-After when pool
+    # checkouts wait too long or too many requests are in flight (per worker;
+    # writes have higher limits than reads), and rate limit each client with
+    # token buckets shared by the workers of a host (0 disables)
+    ADMISSION_CONTROL_ENABLED = os.getenv('ADMISSION_CONTROL_ENABLED', 'true').lower() == 'true'
+    ADMISSION_READ_MAX_POOL_WAIT_MS = float(os.getenv('ADMISSION_READ_MAX_POOL_WAIT_MS', 100))
+    ADMISSION_WRITE_MAX_POOL_WAIT_MS = float(os.getenv('ADMISSION_WRITE_MAX_POOL_WAIT_MS', 1000))
+    ADMISSION_READ_MAX_IN_FLIGHT = int(os.getenv('ADMISSION_READ_MAX_IN_FLIGHT', 32))
+    ADMISSION_WRITE_MAX_IN_FLIGHT = int(os.getenv('ADMISSION_WRITE_MAX_IN_FLIGHT', 64))
+    ADMISSION_READ_RETRY_AFTER = int(os.getenv('ADMISSION_READ_RETRY_AFTER', 5))
+    ADMISSION_WRITE_RETRY_AFTER = int(os.getenv('ADMISSION_WRITE_RETRY_AFTER', 2))
+    ADMISSION_CLIENT_RATE = float(os.getenv('ADMISSION_CLIENT_RATE', 50))
+    ADMISSION_CLIENT_BURST = float(os.getenv('ADMISSION_CLIENT_BURST', 100))
+    ADMISSION_CLIENT_SLOTS = int(os.getenv('ADMISSION_CLIENT_SLOTS', 4096))
+    ADMISSION_STATE_FILE = os.getenv('ADMISSION_STATE_FILE', '/tmp/blog-api-admission-buckets')
+    # Proxies (IPs, CIDR networks or host names) whose X-Forwarded-For gives the client
+    ADMISSION_TRUSTED_PROXIES = [
+        entry.strip() for entry in os.getenv('ADMISSION_TRUSTED_PROXIES', '').split(',') if entry.strip()
+    ]
+
     # Pagination
     DEFAULT_PAGE_SIZE = 10
     MAX_PAGE_SIZE = 100
 
+    # Pagination totals: exact, cached (per filter, TTL) or estimated
+    # (planner statistics for unfiltered totals, cached counts otherwise)
+    PAGINATION_COUNT_STRATEGY = os.getenv('PAGINATION_COUNT_STRATEGY', 'estimated')
+    PAGINATION_COUNT_CACHE_TTL = int(os.getenv('PAGINATION_COUNT_CACHE_TTL', 30))
+    PAGINATION_COUNT_CACHE_SIZE = int(os.getenv('PAGINATION_COUNT_CACHE_SIZE', 1000))
+
+    # View counter (write-behind batching of views_count increments)
+    VIEW_COUNTER_ENABLED = os.getenv('VIEW_COUNTER_ENABLED', 'true').lower() == 'true'
+    VIEW_COUNTER_FLUSH_INTERVAL = float(os.getenv('VIEW_COUNTER_FLUSH_INTERVAL', 5))
+    VIEW_COUNTER_FLUSH_THRESHOLD = int(os.getenv('VIEW_COUNTER_FLUSH_THRESHOLD', 500))
+    VIEW_COUNTER_MAX_PENDING = int(os.getenv('VIEW_COUNTER_MAX_PENDING', 10000))
+
+    # Article counts behind the articles_total gauges (reloaded after writes and periodically)
+    ARTICLE_COUNTS_ENABLED = os.getenv('ARTICLE_COUNTS_ENABLED', 'true').lower() == 'true'
+    ARTICLE_COUNTS_RECONCILE_INTERVAL = float(os.getenv('ARTICLE_COUNTS_RECONCILE_INTERVAL', 300))
+    ARTICLE_COUNTS_MIN_INTERVAL = float(os.getenv('ARTICLE_COUNTS_MIN_INTERVAL', 5))
+
+    # Facet summary behind /articles/facets (updated with each write, rebuilt periodically)
+    ARTICLE_FACETS_ENABLED = os.getenv('ARTICLE_FACETS_ENABLED', 'true').lower() == 'true'
+    ARTICLE_FACETS_REBUILD_INTERVAL = float(os.getenv('ARTICLE_FACETS_REBUILD_INTERVAL', 3600))
+
+    # Trending ranking: views are added to time buckets by the view counter and
+    # each worker keeps the top K articles per window and category in memory
+    TRENDING_ENABLED = os.getenv('TRENDING_ENABLED', 'true').lower() == 'true'
+    TRENDING_WINDOWS = os.getenv('TRENDING_WINDOWS', '24h,7d').split(',')
+    TRENDING_TOP_K = int(os.getenv('TRENDING_TOP_K', 50))
+    TRENDING_REFRESH_INTERVAL = float(os.getenv('TRENDING_REFRESH_INTERVAL', 60))
+    TRENDING_BUCKET_SECONDS = int(os.getenv('TRENDING_BUCKET_SECONDS', 3600))
+
+    # Article cache (per-worker LRU of serialized articles)
+    ARTICLE_CACHE_ENABLED = os.getenv('ARTICLE_CACHE_ENABLED', 'true').lower() == 'true'
+    ARTICLE_CACHE_MAX_SIZE = int(os.getenv('ARTICLE_CACHE_MAX_SIZE', 1000))
+    ARTICLE_CACHE_TTL = int(os.getenv('ARTICLE_CACHE_TTL', 60))
+
+    # Cross-worker cache invalidation driven by KAFKA_TOPIC_ARTICLES
+    CACHE_INVALIDATION_ENABLED = os.getenv('CACHE_INVALIDATION_ENABLED', 'true').lower() == 'true'
+
+    # Response compression (gzip, brotli when installed)
+    COMPRESSION_ENABLED = os.getenv('COMPRESSION_ENABLED', 'true').lower() == 'true'
+    COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', 1024))
+    COMPRESSION_LEVEL = int(os.getenv('COMPRESSION_LEVEL', 6))
+    COMPRESSION_CACHE_MAX_ENTRIES = int(os.getenv('COMPRESSION_CACHE_MAX_ENTRIES', 512))
+
+    # Bulk operations
+    BULK_MAX_ITEMS = int(os.getenv('BULK_MAX_ITEMS', 500))
+    BULK_EVENT_CHUNK_SIZE = int(os.getenv('BULK_EVENT_CHUNK_SIZE', 100))
+
     # CORS
     CORS_ORIGINS = ['*']
 
@@ -49,12 +152,23 @@ class TestingConfig(Config):
     TESTING = True
     DEBUG = True
 
-    # Use in-memory SQLite for tests
+    # Use in-memory SQLite for tests (pool sizing does not apply to SQLite)
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    SQLALCHEMY_ENGINE_OPTIONS = {}
+    REPLICA_DATABASE_URL = None
 
     # Disable Kafka for tests
     KAFKA_ENABLED = False
 
+    # Deterministic pagination totals and view counts for tests
+    PAGINATION_COUNT_STRATEGY = 'exact'
+    VIEW_COUNTER_ENABLED = False
+    ARTICLE_CACHE_ENABLED = False
+    ARTICLE_COUNTS_ENABLED = False
+    ARTICLE_FACETS_ENABLED = False
+    TRENDING_ENABLED = False
+    ADMISSION_CONTROL_ENABLED = False
+
 
 # Config dictionary
 config = {
@@ -1,3 +1,7 @@
 from .article import Article
+from .outbox import OutboxEvent
+from .facets import ArticleFacetCount
+from .views import ArticleViewBucket, TrendingSnapshot
+from .summary import SummaryState
 
-__all__ = ['Article']
+__all__ = ['Article', 'OutboxEvent', 'ArticleFacetCount', 'ArticleViewBucket', 'TrendingSnapshot', 'SummaryState']
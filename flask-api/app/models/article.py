@@ -1,11 +1,18 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, JSON, Boolean, func, select, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB, array
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import column_property
+from sqlalchemy.sql.expression import ColumnElement
 from flask_sqlalchemy import SQLAlchemy
 import enum
 
 db = SQLAlchemy()
 
+# Length of the server-computed excerpt exposed through sparse fieldsets
+EXCERPT_LENGTH = 200
+
 
 class ArticleStatus(str, enum.Enum):
     """Article status enumeration"""
@@ -14,6 +21,55 @@ class ArticleStatus(str, enum.Enum):
     archived = 'archived'
 
 
+class TagsMatch(ColumnElement):
+    """
+    Condition matching rows whose JSON tags array holds all (or any) of some tags
+
+    Compiled per dialect: JSONB containment (@>) or key existence (?|) on
+    PostgreSQL, both served by the idx_articles_tags GIN index; correlated
+    json_each() lookups elsewhere (SQLite), which are correct but scan.
+    """
+
+    type = Boolean()
+    inherit_cache = False
+
+    def __init__(self, column, tags, match_any=False):
+        """
+        Initialize the condition
+
+        Args:
+            column: JSON column holding an array of strings
+            tags (list): Tags to look for
+            match_any (bool): Match rows with any of the tags instead of all
+        """
+        self.column = column
+        self.tags = list(tags)
+        self.match_any = match_any
+
+
+@compiles(TagsMatch)
+def _compile_tags_match(element, compiler, **kw):
+    values = func.json_each(element.column).table_valued('value')
+    if element.match_any:
+        condition = select(1).select_from(values).where(values.c.value.in_(element.tags)).exists()
+    else:
+        condition = db.and_(*(
+            select(1).select_from(values).where(values.c.value == tag).exists()
+            for tag in element.tags
+        ))
+    return compiler.process(condition, **kw)
+
+
+@compiles(TagsMatch, 'postgresql')
+def _compile_tags_match_postgresql(element, compiler, **kw):
+    column = type_coerce(element.column, JSONB)
+    if element.match_any:
+        condition = column.has_any(array(element.tags))
+    else:
+        condition = column.contains(element.tags)
+    return compiler.process(condition, **kw)
+
+
 class Article(db.Model):
     """Article model"""
     __tablename__ = 'articles'
@@ -23,13 +79,33 @@ class Article(db.Model):
     content = db.Column(db.Text, nullable=False)
     author = db.Column(db.String(100), nullable=False)
     category = db.Column(db.String(50), default='general')
-    tags = db.Column(db.JSON, default=list)
-    status = db.Column(db.Enum(ArticleStatus), default=ArticleStatus.draft, nullable=False)
+    tags = db.Column(db.JSON().with_variant(JSONB(), 'postgresql'), default=list)
+    # Stored as VARCHAR(20) like the init scripts, not as a native PostgreSQL enum
+    status = db.Column(db.Enum(ArticleStatus, native_enum=False, length=20), default=ArticleStatus.draft, nullable=False)
     views_count = db.Column(db.Integer, default=0)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     published_at = db.Column(db.DateTime, nullable=True)
 
+    # Computed in SQL so that feed views never load the full content column
+    excerpt = column_property(db.func.substr(content, 1, EXCERPT_LENGTH), deferred=True)
+
+    # Created by the migrations; declared so that autogenerate keeps them.
+    # The full-text index is an expression index and only exists in migrations.
+    __table_args__ = (
+        db.Index('idx_articles_status', status),
+        db.Index('idx_articles_author', author),
+        db.Index('idx_articles_category', category),
+        db.Index('idx_articles_created_at', created_at.desc()),
+        db.Index('idx_articles_updated_at', updated_at.desc()),
+        db.Index('idx_articles_published_at', published_at.desc(),
+                 postgresql_where=published_at.isnot(None),
+                 sqlite_where=published_at.isnot(None)),
+        # GIN index for the JSONB containment operators, PostgreSQL only
+        # like the migration that creates it
+        db.Index('idx_articles_tags', tags, postgresql_using='gin').ddl_if(dialect='postgresql'),
+    )
+
     def __repr__(self):
         return f'<Article {self.id}: {self.title}>'
 
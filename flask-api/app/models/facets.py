@@ -0,0 +1,18 @@
+from app.models.article import db
+
+
+class ArticleFacetCount(db.Model):
+    """Number of articles per status, category, author and tag (facet summary)"""
+    __tablename__ = 'article_facet_counts'
+
+    status = db.Column(db.String(20), primary_key=True)
+    # '' for articles without a category
+    category = db.Column(db.String(50), primary_key=True)
+    author = db.Column(db.String(100), primary_key=True)
+    # '' on the row counting the articles themselves, else one row per tag
+    tag = db.Column(db.Text, primary_key=True)
+    article_count = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return (f'<ArticleFacetCount {self.status}/{self.category}/{self.author}/'
+                f'{self.tag}: {self.article_count}>')
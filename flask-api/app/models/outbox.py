@@ -0,0 +1,16 @@
+from datetime import datetime
+from app.models.article import db
+
+
+class OutboxEvent(db.Model):
+    """Article event waiting to be relayed to Kafka (transactional outbox)"""
+    __tablename__ = 'outbox_events'
+
+    id = db.Column(db.BigInteger().with_variant(db.Integer, 'sqlite'), primary_key=True, autoincrement=True)
+    event_type = db.Column(db.String(50), nullable=False)
+    aggregate_id = db.Column(db.Integer, nullable=False)
+    payload = db.Column(db.JSON, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f'<OutboxEvent {self.id}: {self.event_type} article={self.aggregate_id}>'
@@ -0,0 +1,13 @@
+from app.models.article import db
+
+
+class SummaryState(db.Model):
+    """Last completed rebuild of a summary table shared by the workers"""
+    __tablename__ = 'summary_states'
+
+    # Summary name, e.g. article_facets
+    name = db.Column(db.String(50), primary_key=True)
+    rebuilt_at = db.Column(db.DateTime, nullable=False)
+
+    def __repr__(self):
+        return f'<SummaryState {self.name}: {self.rebuilt_at}>'
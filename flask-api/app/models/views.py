@@ -0,0 +1,30 @@
+from app.models.article import db
+
+
+class ArticleViewBucket(db.Model):
+    """Views of an article during one time bucket, input of the trending ranking"""
+    __tablename__ = 'article_view_buckets'
+
+    # No foreign key: a view flush must not fail because an article was deleted
+    article_id = db.Column(db.Integer, primary_key=True)
+    bucket_start = db.Column(db.DateTime, primary_key=True)
+    views = db.Column(db.Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        db.Index('idx_article_view_buckets_bucket_start', bucket_start),
+    )
+
+    def __repr__(self):
+        return f'<ArticleViewBucket article={self.article_id} {self.bucket_start}: {self.views}>'
+
+
+class TrendingSnapshot(db.Model):
+    """Latest trending rankings, computed by one worker and loaded by the others"""
+    __tablename__ = 'trending_snapshots'
+
+    name = db.Column(db.String(50), primary_key=True)
+    refreshed_at = db.Column(db.DateTime, nullable=False)
+    rankings = db.Column(db.JSON, nullable=False)
+
+    def __repr__(self):
+        return f'<TrendingSnapshot {self.name}: {self.refreshed_at}>'
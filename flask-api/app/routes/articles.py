@@ -1,13 +1,26 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, current_app, request, jsonify
 from marshmallow import ValidationError
 from app.schemas.article_schema import (
     ArticleCreateSchema,
     ArticleUpdateSchema,
     ArticleResponseSchema,
-    ArticleListSchema
+    BulkApplySchema
 )
-from app.services.article_service import ArticleService
+from app.schemas.fast_serializer import SPARSE_FIELDS, dumps, get_serializer
+from app.services.article_service import DATE_FILTERS, ArticleService
+from app.services.article_facets import FACETS
+from app.services.trending import SORTS
 from app.utils.metrics import track_request
+from app.utils.pagination import InvalidCursorError, parse_datetime
+from app.utils.http_cache import (
+    article_etag,
+    article_version,
+    articles_etag,
+    has_conditional_headers,
+    is_not_modified,
+    not_modified,
+    set_cache_headers
+)
 import logging
 
 logger = logging.getLogger(__name__)
@@ -17,9 +30,10 @@ articles_bp = Blueprint('articles', __name__, url_prefix='/api/v1')
 
 # Initialize schemas
 article_create_schema = ArticleCreateSchema()
+bulk_article_create_schema = ArticleCreateSchema(many=True)
 article_update_schema = ArticleUpdateSchema()
 article_response_schema = ArticleResponseSchema()
-article_list_schema = ArticleListSchema()
+bulk_apply_schema = BulkApplySchema()
 
 
 def get_article_service():
@@ -28,6 +42,62 @@ def get_article_service():
     return current_app.article_service
 
 
+def parse_fields():
+    """
+    Parse the sparse fieldset query parameter
+
+    Returns:
+        tuple: (list of field names or None for all fields, list of unknown names)
+    """
+    raw = request.args.get('fields')
+    if not raw:
+        return None, []
+
+    fields = [name.strip() for name in raw.split(',') if name.strip()]
+    unknown = [name for name in fields if name not in SPARSE_FIELDS]
+    return fields, unknown
+
+
+def parse_filters():
+    """
+    Parse the list filter query parameters
+
+    Returns:
+        dict: status, category, author, tags, any_tags and date range filters that are set
+    """
+    return {
+        key: request.args.get(key)
+        for key in ('status', 'category', 'author', 'tags', 'any_tags', *DATE_FILTERS)
+        if request.args.get(key)
+    }
+
+
+def invalid_date_filters(filters):
+    """
+    List the date range filters that are not ISO 8601 dates
+
+    Args:
+        filters (dict): Parsed list filters
+
+    Returns:
+        list: Names of the invalid date filters
+    """
+    return [key for key in DATE_FILTERS if key in filters and parse_datetime(filters[key]) is None]
+
+
+def json_response(payload):
+    """
+    Build a JSON response with the fast encoder (same output as jsonify)
+
+    Args:
+        payload: JSON-serializable value
+
+    Returns:
+        Response: application/json response
+    """
+    return Response(dumps(payload) + b'\n', mimetype='application/json')
+
+
 @articles_bp.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
@@ -37,6 +107,26 @@ def health_check():
     }), 200
 
 
+@articles_bp.route('/ready', methods=['GET'])
+def readiness_check():
+    """
+    Readiness endpoint
+
+    Unlike /health (the process is up), reports whether the database and
+    Kafka are reachable, from checks cached for READINESS_CACHE_SECONDS.
+
+    Returns:
+        200 with the checks when ready, 503 otherwise
+    """
+    result = current_app.readiness_probe.check()
+    return jsonify({
+        'status': 'ready' if result['ready'] else 'not_ready',
+        'service': 'flask-api',
+        'checked_at': result['checked_at'],
+        'checks': result['checks']
+    }), 200 if result['ready'] else 503
+
+
 @articles_bp.route('/articles', methods=['GET'])
 @track_request
 def list_articles():
@@ -46,36 +136,111 @@ def list_articles():
     Query params:
         - page (int): Page number (default: 1)
         - per_page (int): Items per page (default: 10, max: 100)
+        - cursor (str): Keyset cursor; pass an empty value for the first page
+          and the returned next_cursor for the following ones (no total count)
         - status (str): Filter by status (draft/published/archived)
         - category (str): Filter by category
         - author (str): Filter by author
+        - tags (str): Comma-separated tags the articles must all have
+        - any_tags (str): Comma-separated tags the articles must have at least one of
+        - published_after, published_before (str): ISO 8601 bounds on published_at
+          (after is inclusive, before exclusive)
+        - created_after (str): ISO 8601 lower bound on created_at (inclusive)
+        - fields (str): Comma-separated fields to return (e.g. id,title,excerpt);
+          content is only read from the database when requested
 
     Returns:
         JSON response with articles and pagination info
     """
     # Get query parameters
     page = request.args.get('page', 1, type=int)
-    per_page = min(request.args.get('per_page', 10, type=int), 100)
+    per_page = max(min(request.args.get('per_page', 10, type=int), 100), 1)
 
-    filters = {}
-    if request.args.get('status'):
-        filters['status'] = request.args.get('status')
-    if request.args.get('category'):
-        filters['category'] = request.args.get('category')
-    if request.args.get('author'):
-        filters['author'] = request.args.get('author')
+    filters = parse_filters()
+    invalid_dates = invalid_date_filters(filters)
+    if invalid_dates:
+        return jsonify({'error': f"Invalid dates: {', '.join(invalid_dates)}"}), 400
+
+    cursor = request.args.get('cursor')
+
+    fields, unknown_fields = parse_fields()
+    if unknown_fields:
+        return jsonify({'error': f"Unknown fields: {', '.join(unknown_fields)}"}), 400
 
     # Get articles
     service = get_article_service()
-    articles, page_info = service.list_articles(page=page, per_page=per_page, filters=filters)
+    try:
+        articles, page_info = service.list_articles(
+            page=page,
+            per_page=per_page,
+            filters=filters,
+            cursor=cursor,
+            fields=fields
+        )
+    except InvalidCursorError:
+        return jsonify({'error': 'Invalid cursor'}), 400
+
+    etag = articles_etag(articles, *sorted(page_info.items()))
+    if is_not_modified(etag):
+        return not_modified(etag)
 
     # Serialize response
-    response = article_list_schema.dump({
-        'items': articles,
+    response = {
+        'items': get_serializer(fields).serialize_many(articles),
+        'page_info': page_info
+    }
+
+    return set_cache_headers(json_response(response), etag), 200
+
+
+@articles_bp.route('/articles/feed', methods=['GET'])
+@track_request
+def article_feed():
+    """
+    List published articles by publication date, newest first
+
+    Query params:
+        - per_page (int): Items per page (default: 10, max: 100)
+        - cursor (str): next_cursor of the previous page, empty for the first page
+        - category, author, tags, any_tags, published_after, published_before,
+          created_after: Same filters as list_articles
+        - fields (str): Comma-separated fields to return
+
+    Returns:
+        JSON response with articles and keyset pagination info
+    """
+    per_page = max(min(request.args.get('per_page', 10, type=int), 100), 1)
+
+    filters = parse_filters()
+    invalid_dates = invalid_date_filters(filters)
+    if invalid_dates:
+        return jsonify({'error': f"Invalid dates: {', '.join(invalid_dates)}"}), 400
+
+    fields, unknown_fields = parse_fields()
+    if unknown_fields:
+        return jsonify({'error': f"Unknown fields: {', '.join(unknown_fields)}"}), 400
+
+    service = get_article_service()
+    try:
+        articles, page_info = service.list_feed(
+            per_page=per_page,
+            filters=filters,
+            cursor=request.args.get('cursor', ''),
+            fields=fields
+        )
+    except InvalidCursorError:
+        return jsonify({'error': 'Invalid cursor'}), 400
+
+    etag = articles_etag(articles, *sorted(page_info.items()))
+    if is_not_modified(etag):
+        return not_modified(etag)
+
+    response = {
+        'items': get_serializer(fields).serialize_many(articles),
         'page_info': page_info
-    })
+    }
 
-    return jsonify(response), 200
+    return set_cache_headers(json_response(response), etag), 200
 
 
 @articles_bp.route('/articles/<int:article_id>', methods=['GET'])
@@ -88,19 +253,32 @@ def get_article(article_id):
         article_id (int): Article ID
 
     Returns:
-        JSON response with article data or 404 if not found
+        JSON response with article data, 304 if the client copy is current
+        (If-None-Match / If-Modified-Since) or 404 if not found
     """
     service = get_article_service()
-    article = service.get_article(article_id)
 
-    if not article:
+    # Revalidation only needs the version, not the article body
+    if has_conditional_headers():
+        version = service.get_article_version(article_id)
+        if version is None:
+            return jsonify({'error': 'Article not found'}), 404
+
+        etag = article_etag(article_id, version)
+        if is_not_modified(etag, version):
+            service.increment_views(article_id)
+            return not_modified(etag, version)
+
+    response = service.get_article_payload(article_id)
+
+    if not response:
         return jsonify({'error': 'Article not found'}), 404
 
     # Increment view count
     service.increment_views(article_id)
 
-    response = article_response_schema.dump(article)
-    return jsonify(response), 200
+    version = article_version(response)
+    return set_cache_headers(json_response(response), article_etag(article_id, version), version), 200
 
 
 @articles_bp.route('/articles', methods=['POST'])
@@ -138,6 +316,100 @@ def create_article():
         return jsonify({'error': 'Internal server error'}), 500
 
 
+@articles_bp.route('/articles/bulk', methods=['POST'])
+@track_request
+def bulk_create_articles():
+    """
+    Create several articles in one request
+
+    Request body: JSON list of articles (same fields as create_article)
+
+    Valid items are inserted in one transaction; invalid items are reported
+    by index without aborting the others.
+
+    Returns:
+        201 if every item was created, 207 if some items failed validation,
+        400 if none could be created
+    """
+    items = request.get_json(silent=True)
+    if not isinstance(items, list):
+        return jsonify({'error': 'Request body must be a JSON list of articles'}), 400
+
+    max_items = current_app.config['BULK_MAX_ITEMS']
+    if len(items) > max_items:
+        return jsonify({'error': f'At most {max_items} articles can be created per request'}), 413
+
+    errors = bulk_article_create_schema.validate(items)
+    valid_items = [item for index, item in enumerate(items) if index not in errors]
+
+    try:
+        data = bulk_article_create_schema.load(valid_items)
+
+        service = get_article_service()
+        articles = service.bulk_create_articles(data)
+    except Exception as e:
+        logger.error(f"Error bulk creating articles: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+    response = {
+        'created': [article_response_schema.dump(article) for article in articles],
+        'errors': {str(index): messages for index, messages in errors.items()},
+        'count': len(articles)
+    }
+
+    if not articles and errors:
+        status = 400
+    elif errors:
+        status = 207
+    else:
+        status = 201
+
+    return jsonify(response), status
+
+
+@articles_bp.route('/articles/bulk/<action>', methods=['POST'])
+@track_request
+def bulk_apply(action):
+    """
+    Update, publish, archive or delete every article matching filters
+
+    Args:
+        action (str): update, publish, archive or delete
+
+    Request body:
+        - filters (dict, required): status, category, author, tags and/or any_tags
+        - changes (dict): Fields to set (update only, same as update_article)
+        - dry_run (bool): Only return the number of matching articles
+
+    Returns:
+        JSON summary with the number of affected articles
+    """
+    body = request.get_json(silent=True)
+    if not isinstance(body, dict):
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+
+    try:
+        data = bulk_apply_schema.load(body)
+
+        service = get_article_service()
+        result = service.bulk_apply(
+            action,
+            filters=data['filters'],
+            changes=data['changes'] if action == 'update' else None,
+            dry_run=data['dry_run'],
+            event_chunk_size=current_app.config['BULK_EVENT_CHUNK_SIZE']
+        )
+        return jsonify(result), 200
+
+    except ValidationError as e:
+        return jsonify({'errors': e.messages}), 400
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error applying bulk {action}: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+
 @articles_bp.route('/articles/<int:article_id>', methods=['PUT'])
 @track_request
 def update_article(article_id):
@@ -253,6 +525,9 @@ def search_articles():
 
     Query params:
         - q (str, required): Search query
+        - limit (int): Maximum number of results (default: 20, max: 100)
+        - cursor (str): next_cursor returned by the previous page
+        - fields (str): Comma-separated fields to return (e.g. id,title,excerpt)
 
     Returns:
         JSON response with matching articles
@@ -262,13 +537,105 @@ def search_articles():
     if not query:
         return jsonify({'error': 'Query parameter "q" is required'}), 400
 
+    limit = max(min(request.args.get('limit', 20, type=int), 100), 1)
+    cursor = request.args.get('cursor') or None
+
+    fields, unknown_fields = parse_fields()
+    if unknown_fields:
+        return jsonify({'error': f"Unknown fields: {', '.join(unknown_fields)}"}), 400
+
     service = get_article_service()
-    articles = service.search_articles(query)
+    try:
+        articles, total, next_cursor = service.search_articles(
+            query,
+            limit=limit,
+            cursor=cursor,
+            fields=fields
+        )
+    except InvalidCursorError:
+        return jsonify({'error': 'Invalid cursor'}), 400
+
+    etag = articles_etag(articles, total, next_cursor)
+    if is_not_modified(etag):
+        return not_modified(etag)
 
     response = {
         'query': query,
-        'count': len(articles),
-        'results': [article_response_schema.dump(article) for article in articles]
+        'count': total,
+        'results': get_serializer(fields).serialize_many(articles),
+        'next_cursor': next_cursor
     }
 
-    return jsonify(response), 200
+    return set_cache_headers(json_response(response), etag), 200
+
+
+@articles_bp.route('/articles/facets', methods=['GET'])
+@track_request
+def article_facets():
+    """
+    Count articles per status, category, author and tag
+
+    Query params:
+        - status, category, author, tags, any_tags and the date ranges: Same
+          filters as list_articles
+        - facets (str): Comma-separated facets to return (default: all)
+        - limit (int): Maximum values per facet, most frequent first (default: 20, max: 100)
+
+    Returns:
+        JSON response with the values and counts of each facet
+    """
+    facets = list(FACETS)
+    if request.args.get('facets'):
+        facets = [name.strip() for name in request.args['facets'].split(',') if name.strip()]
+        unknown = [name for name in facets if name not in FACETS]
+        if unknown or not facets:
+            return jsonify({'error': f"Unknown facets: {', '.join(unknown)}"}), 400
+
+    limit = max(min(request.args.get('limit', 20, type=int), 100), 1)
+
+    filters = parse_filters()
+    invalid_dates = invalid_date_filters(filters)
+    if invalid_dates:
+        return jsonify({'error': f"Invalid dates: {', '.join(invalid_dates)}"}), 400
+
+    service = get_article_service()
+    return jsonify(service.get_facets(filters, facets=facets, limit=limit)), 200
+
+
+@articles_bp.route('/articles/trending', methods=['GET'])
+@track_request
+def trending_articles():
+    """
+    Get the top published articles by recent views
+
+    Served from rankings refreshed in the background (TRENDING_REFRESH_INTERVAL).
+
+    Query params:
+        - window (str): One of TRENDING_WINDOWS (default: the first one, e.g. 24h)
+        - category (str): Only rank articles of this category
+        - sort (str): trending (time-decayed score, default) or views (views in the window)
+        - limit (int): Number of articles (default: 10, max: TRENDING_TOP_K)
+
+    Returns:
+        JSON response with the ranked articles
+    """
+    trending = get_article_service().trending
+    if trending is None:
+        return jsonify({'error': 'Trending articles are disabled'}), 404
+
+    window = request.args.get('window') or next(iter(trending.windows))
+    if window not in trending.windows:
+        return jsonify({'error': f"Unknown window: {window} (available: {', '.join(trending.windows)})"}), 400
+
+    sort = request.args.get('sort', 'trending')
+    if sort not in SORTS:
+        return jsonify({'error': f"Unknown sort: {sort}"}), 400
+
+    limit = max(min(request.args.get('limit', 10, type=int), trending.top_k), 1)
+
+    return jsonify(trending.get(
+        window,
+        category=request.args.get('category') or None,
+        sort=sort,
+        limit=limit
+    )), 200
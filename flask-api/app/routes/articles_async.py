@@ -0,0 +1,438 @@
+import json
+import logging
+import time
+from functools import wraps
+from marshmallow import ValidationError
+from starlette.responses import Response
+from starlette.routing import Route
+from werkzeug.http import parse_accept_header, parse_date, parse_etags, unquote_etag
+from app.routes.articles import (
+    article_create_schema,
+    article_response_schema,
+    article_update_schema,
+    invalid_date_filters
+)
+from app.schemas.fast_serializer import SPARSE_FIELDS, dumps, get_serializer
+from app.services.article_service import DATE_FILTERS
+from app.utils.compression import CACHED_ENDPOINTS
+from app.utils.metrics import record_http_request
+from app.utils.pagination import InvalidCursorError
+from app.utils.http_cache import (
+    article_etag,
+    article_version,
+    articles_etag,
+    cache_headers,
+    evaluate_conditional
+)
+
+logger = logging.getLogger(__name__)
+
+
+def json_response(payload, status_code=200, headers=None):
+    """
+    Build a JSON response with the same bytes as the Flask routes
+
+    Args:
+        payload: JSON-serializable value
+        status_code (int): HTTP status
+        headers (dict): Extra headers
+
+    Returns:
+        Response: application/json response
+    """
+    return Response(dumps(payload) + b'\n', status_code=status_code, headers=headers,
+                    media_type='application/json')
+
+
+def not_modified(etag, last_modified=None):
+    """Build an empty 304 Not Modified response"""
+    return Response(status_code=304, headers=cache_headers(etag, last_modified))
+
+
+def is_not_modified(request, etag, last_modified=None):
+    """
+    Evaluate the request's conditional headers
+
+    Args:
+        request: Starlette request
+        etag (str): Current unquoted ETag value
+        last_modified: Last modification datetime or ISO string
+
+    Returns:
+        bool: True if the client copy is still current
+    """
+    return evaluate_conditional(
+        parse_etags(request.headers.get('if-none-match')),
+        parse_date(request.headers.get('if-modified-since')),
+        etag,
+        last_modified
+    )
+
+
+def has_conditional_headers(request):
+    """Check whether the request carries conditional GET headers"""
+    return 'if-none-match' in request.headers or 'if-modified-since' in request.headers
+
+
+def int_arg(request, name, default):
+    """Read an integer query parameter, falling back to default like request.args.get(type=int)"""
+    try:
+        return int(request.query_params[name])
+    except (KeyError, ValueError):
+        return default
+
+
+def parse_filters(request):
+    """
+    Parse the list filter query parameters (see articles.parse_filters)
+
+    Returns:
+        dict: Filters that are set
+    """
+    return {
+        key: request.query_params[key]
+        for key in ('status', 'category', 'author', 'tags', 'any_tags', *DATE_FILTERS)
+        if request.query_params.get(key)
+    }
+
+
+def parse_fields(request):
+    """
+    Parse the sparse fieldset query parameter
+
+    Returns:
+        tuple: (list of field names or None for all fields, list of unknown names)
+    """
+    raw = request.query_params.get('fields')
+    if not raw:
+        return None, []
+
+    fields = [name.strip() for name in raw.split(',') if name.strip()]
+    unknown = [name for name in fields if name not in SPARSE_FIELDS]
+    return fields, unknown
+
+
+async def json_body(request):
+    """Decode the request body, None if it is not valid JSON"""
+    try:
+        return json.loads(await request.body())
+    except ValueError:
+        return None
+
+
+def compress_response(request, response, endpoint):
+    """
+    Compress a JSON response as init_compression does for the Flask app
+
+    Args:
+        request: Starlette request
+        response (Response): Uncompressed response
+        endpoint (str): Endpoint name
+
+    Returns:
+        Response: The response, compressed when negotiated
+    """
+    compressor = request.app.state.compressor
+    if (compressor is None
+            or response.status_code != 200
+            or response.media_type != 'application/json'):
+        return response
+
+    response.headers.append('Vary', 'Accept-Encoding')
+
+    encoding = compressor.negotiate(parse_accept_header(request.headers.get('accept-encoding')))
+    if not encoding:
+        return response
+
+    etag, weak = unquote_etag(response.headers.get('etag'))
+    compressed = compressor.compress(
+        response.body,
+        encoding,
+        cacheable=endpoint in CACHED_ENDPOINTS
+    )
+    if compressed is None:
+        return response
+
+    response.body = compressed
+    response.headers['Content-Length'] = str(len(compressed))
+    response.headers['Content-Encoding'] = encoding
+    if etag is not None:
+        # The ETag identifies one encoded representation
+        response.headers['ETag'] = f'{"W/" if weak else ""}"{etag}-{encoding}"'
+    return response
+
+
+def endpoint(name):
+    """
+    Decorator recording request metrics and compressing responses
+
+    Args:
+        name (str): Endpoint name, the same as the Flask endpoint so that
+            both modes share metric labels
+
+    Returns:
+        Decorator for an async Starlette handler
+    """
+    def decorator(handler):
+        @wraps(handler)
+        async def wrapped(request):
+            start_time = time.time()
+            status = 500
+            try:
+                response = await handler(request)
+                status = response.status_code
+                return compress_response(request, response, name)
+            finally:
+                record_http_request(request.method, name, status, time.time() - start_time)
+
+        return wrapped
+
+    return decorator
+
+
+@endpoint('articles.list_articles')
+async def list_articles(request):
+    """List articles with pagination and filters (see articles.list_articles)"""
+    page = int_arg(request, 'page', 1)
+    per_page = max(min(int_arg(request, 'per_page', 10), 100), 1)
+
+    filters = parse_filters(request)
+    invalid_dates = invalid_date_filters(filters)
+    if invalid_dates:
+        return json_response({'error': f"Invalid dates: {', '.join(invalid_dates)}"}, 400)
+
+    cursor = request.query_params.get('cursor')
+
+    fields, unknown_fields = parse_fields(request)
+    if unknown_fields:
+        return json_response({'error': f"Unknown fields: {', '.join(unknown_fields)}"}, 400)
+
+    service = request.app.state.article_service
+    try:
+        articles, page_info = await service.list_articles(
+            page=page,
+            per_page=per_page,
+            filters=filters,
+            cursor=cursor,
+            fields=fields
+        )
+    except InvalidCursorError:
+        return json_response({'error': 'Invalid cursor'}, 400)
+
+    etag = articles_etag(articles, *sorted(page_info.items()))
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    response = {
+        'items': get_serializer(fields).serialize_many(articles),
+        'page_info': page_info
+    }
+
+    return json_response(response, headers=cache_headers(etag))
+
+
+@endpoint('articles.article_feed')
+async def article_feed(request):
+    """List published articles by publication date (see articles.article_feed)"""
+    per_page = max(min(int_arg(request, 'per_page', 10), 100), 1)
+
+    filters = parse_filters(request)
+    invalid_dates = invalid_date_filters(filters)
+    if invalid_dates:
+        return json_response({'error': f"Invalid dates: {', '.join(invalid_dates)}"}, 400)
+
+    fields, unknown_fields = parse_fields(request)
+    if unknown_fields:
+        return json_response({'error': f"Unknown fields: {', '.join(unknown_fields)}"}, 400)
+
+    service = request.app.state.article_service
+    try:
+        articles, page_info = await service.list_feed(
+            per_page=per_page,
+            filters=filters,
+            cursor=request.query_params.get('cursor', ''),
+            fields=fields
+        )
+    except InvalidCursorError:
+        return json_response({'error': 'Invalid cursor'}, 400)
+
+    etag = articles_etag(articles, *sorted(page_info.items()))
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    response = {
+        'items': get_serializer(fields).serialize_many(articles),
+        'page_info': page_info
+    }
+
+    return json_response(response, headers=cache_headers(etag))
+
+
+@endpoint('articles.get_article')
+async def get_article(request):
+    """Get a single article by ID (see articles.get_article)"""
+    article_id = request.path_params['article_id']
+    service = request.app.state.article_service
+
+    # Revalidation only needs the version, not the article body
+    if has_conditional_headers(request):
+        version = await service.get_article_version(article_id)
+        if version is None:
+            return json_response({'error': 'Article not found'}, 404)
+
+        etag = article_etag(article_id, version)
+        if is_not_modified(request, etag, version):
+            await service.increment_views(article_id)
+            return not_modified(etag, version)
+
+    response = await service.get_article_payload(article_id)
+
+    if not response:
+        return json_response({'error': 'Article not found'}, 404)
+
+    await service.increment_views(article_id)
+
+    version = article_version(response)
+    return json_response(response, headers=cache_headers(article_etag(article_id, version), version))
+
+
+@endpoint('articles.create_article')
+async def create_article(request):
+    """Create a new article (see articles.create_article)"""
+    try:
+        data = article_create_schema.load(await json_body(request))
+
+        service = request.app.state.article_service
+        article = await service.create_article(data)
+
+        return json_response(article_response_schema.dump(article), 201)
+
+    except ValidationError as e:
+        return json_response({'errors': e.messages}, 400)
+    except Exception as e:
+        logger.error(f"Error creating article: {str(e)}")
+        return json_response({'error': 'Internal server error'}, 500)
+
+
+@endpoint('articles.update_article')
+async def update_article(request):
+    """Update an article (see articles.update_article)"""
+    return await _update_article(request)
+
+
+@endpoint('articles.patch_article')
+async def patch_article(request):
+    """Partially update an article (same logic as PUT)"""
+    return await _update_article(request)
+
+
+async def _update_article(request):
+    """Validate and apply an article update"""
+    article_id = request.path_params['article_id']
+    try:
+        data = article_update_schema.load(await json_body(request))
+
+        service = request.app.state.article_service
+        article = await service.update_article(article_id, data)
+
+        if not article:
+            return json_response({'error': 'Article not found'}, 404)
+
+        return json_response(article_response_schema.dump(article))
+
+    except ValidationError as e:
+        return json_response({'errors': e.messages}, 400)
+    except Exception as e:
+        logger.error(f"Error updating article: {str(e)}")
+        return json_response({'error': 'Internal server error'}, 500)
+
+
+@endpoint('articles.delete_article')
+async def delete_article(request):
+    """Delete an article (see articles.delete_article)"""
+    article_id = request.path_params['article_id']
+    try:
+        service = request.app.state.article_service
+        deleted = await service.delete_article(article_id)
+
+        if not deleted:
+            return json_response({'error': 'Article not found'}, 404)
+
+        return Response(status_code=204)
+
+    except Exception as e:
+        logger.error(f"Error deleting article: {str(e)}")
+        return json_response({'error': 'Internal server error'}, 500)
+
+
+@endpoint('articles.publish_article')
+async def publish_article(request):
+    """Publish an article (see articles.publish_article)"""
+    article_id = request.path_params['article_id']
+    try:
+        service = request.app.state.article_service
+        article = await service.publish_article(article_id)
+
+        if not article:
+            return json_response({'error': 'Article not found'}, 404)
+
+        return json_response(article_response_schema.dump(article))
+
+    except Exception as e:
+        logger.error(f"Error publishing article: {str(e)}")
+        return json_response({'error': 'Internal server error'}, 500)
+
+
+@endpoint('articles.search_articles')
+async def search_articles(request):
+    """Search articles by query string (see articles.search_articles)"""
+    query = request.query_params.get('q', '').strip()
+
+    if not query:
+        return json_response({'error': 'Query parameter "q" is required'}, 400)
+
+    limit = max(min(int_arg(request, 'limit', 20), 100), 1)
+    cursor = request.query_params.get('cursor') or None
+
+    fields, unknown_fields = parse_fields(request)
+    if unknown_fields:
+        return json_response({'error': f"Unknown fields: {', '.join(unknown_fields)}"}, 400)
+
+    service = request.app.state.article_service
+    try:
+        articles, total, next_cursor = await service.search_articles(
+            query,
+            limit=limit,
+            cursor=cursor,
+            fields=fields
+        )
+    except InvalidCursorError:
+        return json_response({'error': 'Invalid cursor'}, 400)
+
+    etag = articles_etag(articles, total, next_cursor)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    response = {
+        'query': query,
+        'count': total,
+        'results': get_serializer(fields).serialize_many(articles),
+        'next_cursor': next_cursor
+    }
+
+    return json_response(response, headers=cache_headers(etag))
+
+
+# Article routes served natively in ASGI mode; every other URL (bulk
+# endpoints, health, /metrics) falls through to the Flask app.
+article_routes = [
+    Route('/api/v1/articles', list_articles, methods=['GET']),
+    Route('/api/v1/articles', create_article, methods=['POST']),
+    Route('/api/v1/articles/search', search_articles, methods=['GET']),
+    Route('/api/v1/articles/feed', article_feed, methods=['GET']),
+    Route('/api/v1/articles/{article_id:int}', get_article, methods=['GET']),
+    Route('/api/v1/articles/{article_id:int}', update_article, methods=['PUT']),
+    Route('/api/v1/articles/{article_id:int}', patch_article, methods=['PATCH']),
+    Route('/api/v1/articles/{article_id:int}', delete_article, methods=['DELETE']),
+    Route('/api/v1/articles/{article_id:int}/publish', publish_article, methods=['POST']),
+]
@@ -2,6 +2,7 @@ from .article_schema import (
     ArticleCreateSchema,
     ArticleUpdateSchema,
     ArticleResponseSchema,
+    ArticleSummarySchema,
     ArticleListSchema
 )
 
@@ -9,5 +10,6 @@ __all__ = [
     'ArticleCreateSchema',
     'ArticleUpdateSchema',
     'ArticleResponseSchema',
+    'ArticleSummarySchema',
     'ArticleListSchema'
 ]
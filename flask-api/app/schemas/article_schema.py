@@ -1,3 +1,4 @@
+import enum
 from marshmallow import Schema, fields, validate, validates, ValidationError
 
 
@@ -35,6 +36,26 @@ class ArticleUpdateSchema(Schema):
     status = fields.Str(validate=validate.OneOf(['draft', 'published', 'archived']))
 
 
+class BulkFiltersSchema(Schema):
+    """Schema for the filters selecting the articles of a bulk operation"""
+    status = fields.Str(validate=validate.OneOf(['draft', 'published', 'archived']))
+    category = fields.Str()
+    author = fields.Str()
+    # A list or a comma-separated string, as for list_articles
+    tags = fields.Raw()
+    any_tags = fields.Raw()
+    published_after = fields.Str()
+    published_before = fields.Str()
+    created_after = fields.Str()
+
+
+class BulkApplySchema(Schema):
+    """Schema for bulk operation requests"""
+    filters = fields.Nested(BulkFiltersSchema, required=True)
+    changes = fields.Nested(ArticleUpdateSchema, load_default=dict)
+    dry_run = fields.Bool(load_default=False)
+
+
 class ArticleResponseSchema(Schema):
     """Schema for article response"""
     id = fields.Int(dump_only=True)
@@ -43,12 +64,22 @@ class ArticleResponseSchema(Schema):
     author = fields.Str()
     category = fields.Str()
     tags = fields.List(fields.Str())
-    status = fields.Str()
+    status = fields.Method('get_status')
     views_count = fields.Int()
     created_at = fields.DateTime(dump_only=True)
     updated_at = fields.DateTime(dump_only=True)
     published_at = fields.DateTime(dump_only=True, allow_none=True)
 
+    def get_status(self, obj):
+        """Dump the enum value rather than its repr ('published', not 'ArticleStatus.published')"""
+        status = obj.status
+        return status.value if isinstance(status, enum.Enum) else status
+
+
+class ArticleSummarySchema(ArticleResponseSchema):
+    """Article response plus the server-computed excerpt, for sparse fieldsets"""
+    excerpt = fields.Str(dump_only=True)
+
 
 class PageInfoSchema(Schema):
     """Schema for pagination info"""
@@ -58,6 +89,8 @@ class PageInfoSchema(Schema):
     total_items = fields.Int()
     has_next = fields.Bool()
     has_prev = fields.Bool()
+    total_exact = fields.Bool()
+    next_cursor = fields.Str(allow_none=True)
 
 
 class ArticleListSchema(Schema):
@@ -0,0 +1,94 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from app.utils.metrics import (
+    record_article_cache_hit,
+    record_article_cache_miss,
+    record_article_cache_eviction,
+    update_article_cache_size
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ArticleCache:
+    """Per-worker bounded LRU cache of serialized article payloads with a TTL"""
+
+    def __init__(self, max_size=1000, ttl=60):
+        """
+        Initialize the article cache
+
+        Args:
+            max_size (int): Maximum number of cached articles
+            ttl (float): Seconds an entry stays valid
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, article_id):
+        """
+        Get a cached payload
+
+        Args:
+            article_id (int): Article ID
+
+        Returns:
+            dict: Serialized article, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(article_id)
+            if entry is None:
+                record_article_cache_miss()
+                return None
+
+            payload, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[article_id]
+                update_article_cache_size(len(self._entries))
+                record_article_cache_eviction('expired')
+                record_article_cache_miss()
+                return None
+
+            self._entries.move_to_end(article_id)
+
+        record_article_cache_hit()
+        return payload
+
+    def set(self, article_id, payload):
+        """
+        Cache a payload, evicting the least recently used entries if full
+
+        Args:
+            article_id (int): Article ID
+            payload (dict): Serialized article
+        """
+        with self._lock:
+            self._entries[article_id] = (payload, time.monotonic() + self.ttl)
+            self._entries.move_to_end(article_id)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                record_article_cache_eviction('size')
+
+            update_article_cache_size(len(self._entries))
+
+    def invalidate(self, article_id):
+        """
+        Drop a cached article
+
+        Args:
+            article_id (int): Article ID
+        """
+        with self._lock:
+            if self._entries.pop(article_id, None) is not None:
+                record_article_cache_eviction('invalidated')
+            update_article_cache_size(len(self._entries))
+
+    def clear(self):
+        """Drop every cached article"""
+        with self._lock:
+            self._entries.clear()
+            update_article_cache_size(0)
@@ -0,0 +1,155 @@
+import atexit
+import logging
+import threading
+import time
+from collections import Counter
+from sqlalchemy import func, select
+from app.models.article import Article, ArticleStatus, db
+from app.models.facets import ArticleFacetCount
+from app.utils.metrics import update_article_count, update_category_count
+
+logger = logging.getLogger(__name__)
+
+
+def count_key(status, category):
+    """
+    Build the counter key of an article
+
+    Args:
+        status: ArticleStatus or status value
+        category (str): Article category
+
+    Returns:
+        tuple: (status value, category label)
+    """
+    if isinstance(status, ArticleStatus):
+        status = status.value
+    return status, category or 'none'
+
+
+class ArticleCounts:
+    """
+    Article counts per status and category behind the articles_total gauges
+
+    The gauges are exported by every worker, the last write winning
+    (multiprocess mode mostrecent), so the counts are never adjusted in
+    memory: each worker would export its own view of the writes. They are
+    always read from the shared state instead: the facet summary when it is
+    enabled and complete (kept up to date by every write in its own
+    transaction, a few rows to aggregate), otherwise one GROUP BY over the
+    articles. Writes ask for a reconcile, which the background thread runs
+    at most every min_interval seconds, and scrapes never query the database.
+    """
+
+    def __init__(self, reconcile_interval=300, min_interval=5, article_facets=None):
+        """
+        Initialize the counts
+
+        Args:
+            reconcile_interval (float): Seconds between reconciles without writes
+            min_interval (float): Minimum seconds between two reconciles
+            article_facets (ArticleFacets): Facet summary to read the counts
+                from, None to count the articles
+        """
+        self.reconcile_interval = reconcile_interval
+        self.min_interval = min_interval
+        self.article_facets = article_facets
+
+        self.app = None
+        self._categories = set()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def init_app(self, app):
+        """
+        Bind the counts to an application
+
+        Args:
+            app: Flask application
+        """
+        self.app = app
+
+    def start(self):
+        """Start the reconcile thread"""
+        self._thread = threading.Thread(target=self._run, name='article-counts', daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+        logger.info(f"Article counts started (reconcile every {self.reconcile_interval}s)")
+
+    def request_reconcile(self):
+        """Ask the background thread to reconcile as soon as possible (after a write)"""
+        self._wakeup.set()
+
+    def reconcile(self):
+        """
+        Reload the counts from the database and export them
+
+        Returns:
+            int: Total number of articles
+        """
+        with self.app.app_context():
+            if self.article_facets and self.article_facets.is_complete(db.session):
+                statement = (
+                    select(ArticleFacetCount.status, ArticleFacetCount.category,
+                           func.sum(ArticleFacetCount.article_count))
+                    .where(ArticleFacetCount.tag == '')
+                    .group_by(ArticleFacetCount.status, ArticleFacetCount.category)
+                )
+            else:
+                statement = (
+                    select(Article.status, Article.category, func.count(Article.id))
+                    .group_by(Article.status, Article.category)
+                )
+            rows = db.session.execute(statement).all()
+            db.session.remove()
+
+        counts = Counter()
+        for status, category, count in rows:
+            counts[count_key(status, category)] += int(count)
+
+        with self._lock:
+            self._export(counts)
+
+        return sum(counts.values())
+
+    def _export(self, counts):
+        """Publish counts to the gauges; the caller holds the lock"""
+        by_status = Counter()
+        by_category = Counter()
+        for (status, category), count in counts.items():
+            by_status[status] += count
+            by_category[category] += count
+
+        for status in ArticleStatus:
+            update_article_count(status.value, by_status[status.value])
+
+        # Categories that emptied are exported as 0 rather than left stale
+        self._categories.update(by_category)
+        for category in self._categories:
+            update_category_count(category, by_category[category])
+
+    def _run(self):
+        """Background loop reconciling on the interval or after writes"""
+        while not self._stopped.is_set():
+            started = time.monotonic()
+            interval = self.reconcile_interval
+            try:
+                self.reconcile()
+            except Exception as e:
+                logger.error(f"Error reconciling article counts: {str(e)}")
+                # Retry sooner so the gauges are not left empty after a failed start
+                interval = min(interval, 10)
+
+            self._wakeup.wait(interval)
+            # Writes arriving in a burst share the next reconcile
+            self._stopped.wait(max(self.min_interval - (time.monotonic() - started), 0))
+            self._wakeup.clear()
+
+    def stop(self):
+        """Stop the reconcile thread"""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=5)
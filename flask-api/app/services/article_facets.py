@@ -0,0 +1,432 @@
+import atexit
+import logging
+import threading
+from collections import Counter
+from datetime import datetime
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from app.models.article import Article, ArticleStatus, db
+from app.models.facets import ArticleFacetCount
+from app.models.summary import SummaryState
+
+logger = logging.getLogger(__name__)
+
+# Facets returned by /articles/facets, in response order
+FACETS = ('status', 'category', 'author', 'tags')
+
+# Key of the PostgreSQL advisory lock held while the summary is rebuilt
+FACETS_LOCK_KEY = 0x666163657473
+
+# Name of the summary in summary_states
+FACETS_SUMMARY = 'article_facets'
+
+# Dialects able to upsert the summary rows (INSERT ... ON CONFLICT)
+UPSERT_INSERTS = {
+    'postgresql': postgresql_insert,
+    'sqlite': sqlite_insert
+}
+
+
+def facet_keys(status, category, author, tags):
+    """
+    Build the summary keys an article is counted under
+
+    Args:
+        status: ArticleStatus or status value
+        category (str): Article category
+        author (str): Article author
+        tags (list): Article tags
+
+    Returns:
+        list: (status, category, author, tag) keys; tag is '' on the key
+        counting the article itself, followed by one key per distinct tag
+    """
+    if isinstance(status, ArticleStatus):
+        status = status.value
+    base = (status, category or '', author)
+
+    keys = [base + ('',)]
+    if isinstance(tags, list):
+        keys.extend(base + (tag,) for tag in sorted({tag for tag in tags if isinstance(tag, str) and tag}))
+    return keys
+
+
+def article_facet_keys(articles_data):
+    """
+    Build the summary keys of serialized articles
+
+    Args:
+        articles_data (list): Article data dictionaries
+
+    Returns:
+        list: Summary keys of all the articles
+    """
+    return [
+        key
+        for article_data in articles_data
+        for key in facet_keys(article_data['status'], article_data['category'],
+                              article_data['author'], article_data['tags'])
+    ]
+
+
+def aggregate_facets(counts, facets, limit):
+    """
+    Aggregate summary keys into facet values
+
+    Args:
+        counts (Counter): Article counts per summary key
+        facets (iterable): Facets to return
+        limit (int): Maximum values per facet
+
+    Returns:
+        tuple: (facets dict, total number of articles)
+    """
+    positions = {'status': 0, 'category': 1, 'author': 2}
+    values = {facet: Counter() for facet in facets}
+    total = 0
+
+    for key, count in counts.items():
+        if count <= 0:
+            continue
+        if key[3]:
+            if 'tags' in values:
+                values['tags'][key[3]] += count
+            continue
+        total += count
+        for facet, position in positions.items():
+            if facet in values:
+                values[facet][key[position]] += count
+
+    return {
+        facet: format_facet(sorted(counter.items(), key=lambda item: (-item[1], item[0]))[:limit])
+        for facet, counter in values.items()
+    }, total
+
+
+def format_facet(rows):
+    """
+    Format the values of one facet
+
+    Args:
+        rows (iterable): (value, count) pairs, already ordered
+
+    Returns:
+        list: Values as dictionaries; '' (no category) is returned as None
+    """
+    return [{'value': value or None, 'count': int(count)} for value, count in rows]
+
+
+class ArticleFacets:
+    """
+    Facet summary behind /articles/facets
+
+    The article_facet_counts table holds one row per (status, category,
+    author) with the number of articles, plus one row per tag with the number
+    of those articles having the tag. ArticleService applies each write's
+    delta to the summary with an upsert in the write's transaction, so facet
+    queries aggregate the summary instead of scanning articles. A background
+    rebuild corrects drift from writes made outside the API; it runs in a
+    single worker once per rebuild_interval, the first one at startup, and
+    the summary is only complete (used) once a rebuild has been recorded in
+    summary_states.
+    """
+
+    def __init__(self, rebuild_interval=3600):
+        """
+        Initialize the facets
+
+        Args:
+            rebuild_interval (float): Seconds between rebuilds
+        """
+        self.rebuild_interval = rebuild_interval
+
+        self.app = None
+        self._complete = False
+        self._forced = False
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread = None
+
+    def init_app(self, app):
+        """
+        Bind the facets to an application
+
+        Args:
+            app: Flask application
+        """
+        self.app = app
+
+    def start(self):
+        """Start the rebuild thread"""
+        self._thread = threading.Thread(target=self._run, name='article-facets', daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+        logger.info(f"Article facets started (rebuild every {self.rebuild_interval}s)")
+
+    @staticmethod
+    def delta_statement(before, after, dialect_name):
+        """
+        Build the upsert applying an article change to the summary
+
+        Args:
+            before (list): Summary keys of the articles before the change
+            after (list): Summary keys of the articles after the change
+            dialect_name (str): Dialect of the session
+
+        Returns:
+            Insert statement, or None if the change does not move any count
+
+        Raises:
+            ValueError: If the dialect cannot upsert
+        """
+        delta = Counter(after)
+        delta.subtract(before)
+        return ArticleFacets.upsert_statement(delta, dialect_name)
+
+    @staticmethod
+    def upsert_statement(delta, dialect_name):
+        """
+        Build the upsert adding count deltas to the summary rows
+
+        Args:
+            delta (Counter): Article count delta per summary key
+            dialect_name (str): Dialect of the connection
+
+        Returns:
+            Insert statement, or None if no count moves
+
+        Raises:
+            ValueError: If the dialect cannot upsert
+        """
+        rows = [
+            {'status': key[0], 'category': key[1], 'author': key[2], 'tag': key[3], 'article_count': count}
+            # Sorted so that concurrent writers lock the rows in the same order
+            for key, count in sorted(delta.items())
+            if count
+        ]
+        if not rows:
+            return None
+
+        if dialect_name not in UPSERT_INSERTS:
+            raise ValueError(f"Facet summary not supported on '{dialect_name}'")
+
+        table = ArticleFacetCount.__table__
+        stmt = UPSERT_INSERTS[dialect_name](table).values(rows)
+        return stmt.on_conflict_do_update(
+            index_elements=[table.c.status, table.c.category, table.c.author, table.c.tag],
+            set_={'article_count': table.c.article_count + stmt.excluded.article_count}
+        )
+
+    def apply(self, session, before=(), after=()):
+        """
+        Apply an article change to the summary in the session's transaction
+
+        Args:
+            session: Session of the change
+            before (list): Summary keys of the articles before the change
+            after (list): Summary keys of the articles after the change
+        """
+        stmt = self.delta_statement(before, after, session.get_bind().dialect.name)
+        if stmt is not None:
+            session.execute(stmt)
+
+    def get_facets(self, session, filters, facets, limit):
+        """
+        Get facet values from the summary
+
+        Args:
+            session: Session on the primary database
+            filters (dict): status, category and/or author filters
+            facets (iterable): Facets to return
+            limit (int): Maximum values per facet
+
+        Returns:
+            tuple: (facets dict, total number of articles)
+        """
+        conditions = self._filter_conditions(filters)
+        article_count = func.sum(ArticleFacetCount.article_count)
+
+        total = session.scalar(
+            select(func.coalesce(article_count, 0))
+            .where(ArticleFacetCount.tag == '', *conditions)
+        )
+
+        results = {}
+        for facet in facets:
+            if facet == 'tags':
+                column, scope = ArticleFacetCount.tag, ArticleFacetCount.tag != ''
+            else:
+                column, scope = getattr(ArticleFacetCount, facet), ArticleFacetCount.tag == ''
+
+            rows = session.execute(
+                select(column, article_count)
+                .where(scope, *conditions)
+                .group_by(column)
+                .having(article_count > 0)
+                .order_by(article_count.desc(), column)
+                .limit(limit)
+            ).all()
+            results[facet] = format_facet(rows)
+
+        return results, int(total)
+
+    @staticmethod
+    def _filter_conditions(filters):
+        """Build summary conditions for the status, category and author filters"""
+        conditions = []
+        if filters.get('status'):
+            try:
+                conditions.append(ArticleFacetCount.status == ArticleStatus(filters['status']).value)
+            except ValueError:
+                pass
+        if filters.get('category'):
+            conditions.append(ArticleFacetCount.category == filters['category'])
+        if filters.get('author'):
+            conditions.append(ArticleFacetCount.author == filters['author'])
+        return conditions
+
+    def is_complete(self, session):
+        """
+        Tell whether the summary can be used
+
+        The summary is complete once a rebuild has been recorded; until then
+        it only holds the deltas of the writes made since it was created.
+
+        Args:
+            session: Session on the primary database
+
+        Returns:
+            bool: Whether a rebuild has completed
+        """
+        if not self._complete:
+            # A recorded rebuild is never removed: only look until it is there
+            self._complete = session.scalar(
+                select(SummaryState.rebuilt_at).where(SummaryState.name == FACETS_SUMMARY)
+            ) is not None
+        return self._complete
+
+    def request_rebuild(self):
+        """Ask the background thread to rebuild as soon as possible"""
+        self._forced = True
+        self._wakeup.set()
+
+    def rebuild(self, max_age=None):
+        """
+        Correct the summary from the articles
+
+        The articles and the summary are read in one snapshot (REPEATABLE
+        READ on PostgreSQL). Every API write changes both in one transaction,
+        so the difference between the counts of the snapshot and its summary
+        is the drift; it is added to the live rows as an increment, which
+        commutes with the deltas of concurrent writes. Writers are never
+        blocked, and a summary that only holds some rows is corrected like
+        any other. A session advisory lock keeps a single worker rebuilding,
+        and the rebuild time is recorded in summary_states in the same
+        transaction as the correction.
+
+        Args:
+            max_age (float): Skip the rebuild when the last one completed
+                less than max_age seconds ago, None to always rebuild
+
+        Returns:
+            bool: Whether the summary was rebuilt
+        """
+        with self.app.app_context():
+            with db.engine.connect() as connection:
+                postgresql = connection.dialect.name == 'postgresql'
+                if postgresql:
+                    locked = connection.scalar(select(func.pg_try_advisory_lock(FACETS_LOCK_KEY)))
+                    connection.commit()
+                    if not locked:
+                        return False
+
+                try:
+                    return self._rebuild(connection, max_age)
+                finally:
+                    connection.rollback()
+                    if postgresql:
+                        connection.execute(select(func.pg_advisory_unlock(FACETS_LOCK_KEY)))
+                        connection.commit()
+
+    def _rebuild(self, connection, max_age):
+        """
+        Rebuild on a connection holding the rebuild lock
+
+        Args:
+            connection: Connection without an open transaction
+            max_age (float): See rebuild
+
+        Returns:
+            bool: Whether the summary was rebuilt
+        """
+        state = SummaryState.__table__
+        table = ArticleFacetCount.__table__
+        dialect_name = connection.dialect.name
+
+        rebuilt_at = connection.scalar(select(state.c.rebuilt_at).where(state.c.name == FACETS_SUMMARY))
+        connection.commit()
+        if max_age is not None and rebuilt_at is not None:
+            if (datetime.utcnow() - rebuilt_at).total_seconds() < max_age:
+                return False
+
+        if dialect_name == 'postgresql':
+            connection.execution_options(isolation_level='REPEATABLE READ')
+        previous = Counter({
+            (row.status, row.category, row.author, row.tag): row.article_count
+            for row in connection.execute(select(table))
+        })
+        counts = Counter()
+        articles = connection.execute(
+            select(Article.status, Article.category, Article.author, Article.tags),
+            execution_options={'yield_per': 1000}
+        )
+        for row in articles:
+            counts.update(facet_keys(row.status, row.category, row.author, row.tags))
+        connection.commit()
+        if dialect_name == 'postgresql':
+            connection.execution_options(isolation_level='READ COMMITTED')
+
+        drift = Counter(counts)
+        drift.subtract(previous)
+
+        stmt = self.upsert_statement(drift, dialect_name)
+        if stmt is not None:
+            connection.execute(stmt)
+        # A writer incrementing an emptied row makes it non-zero again before
+        # the delete re-checks it
+        connection.execute(delete(table).where(table.c.article_count <= 0))
+
+        marker = UPSERT_INSERTS[dialect_name](state).values(name=FACETS_SUMMARY, rebuilt_at=datetime.utcnow())
+        connection.execute(marker.on_conflict_do_update(
+            index_elements=[state.c.name],
+            set_={'rebuilt_at': marker.excluded.rebuilt_at}
+        ))
+        connection.commit()
+        self._complete = True
+
+        drift_total = sum(abs(count) for count in drift.values())
+        if drift_total:
+            logger.info(f"Article facets rebuilt ({len(counts)} rows, drift of {drift_total})")
+        return True
+
+    def _run(self):
+        """Background loop: rebuild when the last rebuild is older than the interval, or on request"""
+        while not self._stopping:
+            interval = self.rebuild_interval
+            forced, self._forced = self._forced, False
+            try:
+                self.rebuild(max_age=None if forced else self.rebuild_interval)
+            except Exception as e:
+                logger.error(f"Error rebuilding article facets: {str(e)}")
+                interval = min(interval, 60)
+
+            self._wakeup.wait(interval)
+            self._wakeup.clear()
+
+    def stop(self):
+        """Stop the rebuild thread"""
+        self._stopping = True
+        self._wakeup.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=5)
@@ -1,23 +1,139 @@
 import logging
+import math
+from collections import Counter
 from datetime import datetime
-from sqlalchemy import or_
-from app.models.article import Article, ArticleStatus, db
+from sqlalchemy import REAL, and_, cast, delete, func, insert, literal_column, or_, select, update
+from sqlalchemy.orm import load_only, undefer
+from sqlalchemy.orm.attributes import set_committed_value
+from app.models.article import Article, ArticleStatus, TagsMatch, db
+from app.models.outbox import OutboxEvent
 from app.services.kafka_producer import KafkaProducerService
+from app.services.count_strategy import ExactCountStrategy
+from app.services.article_counts import count_key
+from app.services.article_facets import FACETS, aggregate_facets, article_facet_keys, facet_keys
+from app.services.trending import view_bucket_statement
+from app.schemas.fast_serializer import serialize_article
+from app.utils.pagination import encode_cursor, decode_cursor, parse_datetime
+from app.utils.http_cache import article_version
 
 logger = logging.getLogger(__name__)
 
+# Date range filters: (column, whether the bound is a lower bound);
+# lower bounds are inclusive, upper bounds exclusive
+DATE_FILTERS = {
+    'published_after': (Article.published_at, True),
+    'published_before': (Article.published_at, False),
+    'created_after': (Article.created_at, True)
+}
+
 
 class ArticleService:
     """Service for managing articles"""
 
-    def __init__(self, kafka_producer=None):
+    # Event published for each article touched by a bulk action
+    BULK_EVENT_TYPES = {
+        'update': 'article.updated',
+        'publish': 'article.published',
+        'archive': 'article.updated',
+        'delete': 'article.deleted'
+    }
+
+    def __init__(self, kafka_producer=None, count_strategy=None, view_counter=None,
+                 article_cache=None, outbox_relay=None, article_counts=None,
+                 replica_router=None, article_facets=None, trending=None):
         """
         Initialize ArticleService
 
         Args:
             kafka_producer (KafkaProducerService): Kafka producer service
+            count_strategy: Strategy computing pagination totals
+            view_counter (ViewCounter): Write-behind view counter; views are
+                written synchronously when not set
+            article_cache (ArticleCache): Cache of serialized articles
+            outbox_relay (OutboxRelay): Relay draining the outbox; when set,
+                events are written to the outbox in the same transaction as
+                the change instead of being sent to Kafka after commit
+            article_counts (ArticleCounts): Counts per status and category,
+                reloaded after each committed change that moves them
+            replica_router (ReplicaRouter): Routes read-only queries to the
+                replica; all queries use the primary when not set
+            article_facets (ArticleFacets): Facet summary, updated in the
+                transaction of each change; facets are computed from the
+                articles when not set
+            trending (TrendingRanking): Top articles by recent views; views
+                are also added to its time buckets
         """
         self.kafka_producer = kafka_producer
+        self.count_strategy = count_strategy or ExactCountStrategy()
+        self.view_counter = view_counter
+        self.article_cache = article_cache
+        self.outbox_relay = outbox_relay
+        self.article_counts = article_counts
+        self.replica_router = replica_router
+        self.article_facets = article_facets
+        self.trending = trending
+
+    def _read_session(self):
+        """
+        Get the session for a read-only query
+
+        Returns:
+            Session: Replica session when the router allows it, else db.session
+        """
+        if self.replica_router:
+            return self.replica_router.read_session()
+        return db.session
+
+    def _stage_events(self, event_type, articles_data):
+        """
+        Write events to the outbox in the current transaction
+
+        Does nothing when no outbox relay is configured.
+
+        Args:
+            event_type (str): Type of event
+            articles_data (list): Article data dictionaries
+        """
+        if not self.outbox_relay or not articles_data:
+            return
+
+        db.session.execute(insert(OutboxEvent), self._outbox_rows(event_type, articles_data))
+
+    def _stage_facets(self, before=(), after=()):
+        """
+        Apply a change to the facet summary in the current transaction
+
+        Does nothing when the facet summary is disabled.
+
+        Args:
+            before (list): Summary keys of the articles before the change
+            after (list): Summary keys of the articles after the change
+        """
+        if self.article_facets:
+            self.article_facets.apply(db.session, before, after)
+
+    @staticmethod
+    def _outbox_rows(event_type, articles_data):
+        """
+        Build outbox rows for a list of events
+
+        Args:
+            event_type (str): Type of event
+            articles_data (list): Article data dictionaries
+
+        Returns:
+            list: Row dictionaries for OutboxEvent
+        """
+        now = datetime.utcnow()
+        return [
+            {
+                'event_type': event_type,
+                'aggregate_id': article_data['id'],
+                'payload': article_data,
+                'created_at': now
+            }
+            for article_data in articles_data
+        ]
 
     def create_article(self, data):
         """
@@ -43,12 +159,21 @@ class ArticleService:
             )
 
             db.session.add(article)
+            db.session.flush()
+            self._stage_facets(after=facet_keys(article.status, article.category, article.author, article.tags))
+            self._stage_events('article.created', [article.to_dict()])
             db.session.commit()
 
             logger.info(f"Article created successfully: ID={article.id}, Title={article.title}")
 
+            self.count_strategy.invalidate()
+            if self.article_counts:
+                self.article_counts.request_reconcile()
+
             # Publish to Kafka
-            if self.kafka_producer:
+            if self.outbox_relay:
+                self.outbox_relay.notify()
+            elif self.kafka_producer:
                 self.kafka_producer.publish_article_created(article.to_dict())
 
             return article
@@ -58,63 +183,566 @@ class ArticleService:
             logger.error(f"Error creating article: {str(e)}")
             raise
 
-    def get_article(self, article_id):
+    def bulk_create_articles(self, items):
+        """
+        Create several articles in one transaction
+
+        Rows are inserted with a single multi-row INSERT ... RETURNING and the
+        article.created events are published as one batch after commit (or
+        written to the outbox in the same transaction).
+
+        Args:
+            items (list): Validated article data dictionaries
+
+        Returns:
+            list: Created articles, in input order, detached from the session
+                with the values returned by the INSERT loaded
+
+        Raises:
+            Exception: If the insert fails (nothing is created)
+        """
+        if not items:
+            return []
+
+        rows = [
+            {
+                'title': data.get('title'),
+                'content': data.get('content'),
+                'author': data.get('author'),
+                'category': data.get('category', 'general'),
+                'tags': data.get('tags', []),
+                'status': ArticleStatus.draft
+            }
+            for data in items
+        ]
+
+        try:
+            articles = list(db.session.scalars(
+                insert(Article).returning(Article, sort_by_parameter_order=True),
+                rows
+            ))
+            events = [article.to_dict() for article in articles]
+            self._stage_facets(after=article_facet_keys(events))
+            self._stage_events('article.created', events)
+            # The commit would expire the articles and serializing them would
+            # then reload each one with its own SELECT: RETURNING already gave
+            # every column, so keep them out of the session
+            for article in articles:
+                db.session.expunge(article)
+            db.session.commit()
+
+            logger.info(f"Bulk created {len(articles)} articles")
+
+            self.count_strategy.invalidate()
+            if self.article_counts:
+                self.article_counts.request_reconcile()
+
+            # Publish to Kafka
+            if self.outbox_relay:
+                self.outbox_relay.notify()
+            elif self.kafka_producer:
+                self.kafka_producer.publish_events('article.created', events)
+
+            return articles
+
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error bulk creating articles: {str(e)}")
+            raise
+
+    def get_article(self, article_id, primary=False):
         """
         Get article by ID
 
         Args:
             article_id (int): Article ID
+            primary (bool): Read from the primary, as required before a write
 
         Returns:
             Article: Article object or None if not found
         """
-        return Article.query.get(article_id)
+        session = db.session if primary else self._read_session()
+        return session.get(Article, article_id)
+
+    def get_article_payload(self, article_id):
+        """
+        Get a serialized article, reading through the article cache
+
+        Misses are read from the primary, never from the replica: a lagging
+        replica could put back in the cache a version that an invalidation
+        just evicted, and its views_count is not kept up to date (view
+        counts are not published as events). The lookup is by primary key
+        and its result is shared by the following hits.
+
+        The returned dict may be shared with other requests and must not be
+        modified.
+
+        Args:
+            article_id (int): Article ID
+
+        Returns:
+            dict: Serialized article or None if not found
+        """
+        if self.article_cache:
+            payload = self.article_cache.get(article_id)
+            if payload is not None:
+                return payload
+
+        article = db.session.get(Article, article_id)
+        if not article:
+            return None
+
+        payload = serialize_article(article)
+        if self.article_cache:
+            self.article_cache.set(article_id, payload)
+
+        return payload
+
+    def get_article_version(self, article_id):
+        """
+        Get the version timestamp of an article without loading its content
+
+        Read from the primary like get_article_payload, so that a lagging
+        replica cannot confirm an outdated version with a 304.
+
+        Args:
+            article_id (int): Article ID
 
-    def list_articles(self, page=1, per_page=10, filters=None):
+        Returns:
+            str: ISO timestamp of the last change, or None if not found
+        """
+        if self.article_cache:
+            payload = self.article_cache.get(article_id)
+            if payload is not None:
+                return article_version(payload)
+
+        row = db.session.query(Article.updated_at, Article.created_at).filter(
+            Article.id == article_id
+        ).first()
+        if row is None:
+            return None
+
+        changed_at = row.updated_at or row.created_at
+        return changed_at.isoformat() if changed_at else ''
+
+    def _invalidate_article(self, article_id):
+        """
+        Drop cached data affected by a change to an article
+
+        Args:
+            article_id (int): Article ID
+        """
+        self.count_strategy.invalidate()
+        if self.article_cache:
+            self.article_cache.invalidate(article_id)
+
+    def handle_article_event(self, event_type, article_id):
+        """
+        Invalidate local caches for an article event seen on the event bus
+
+        Args:
+            event_type (str): Type of event
+            article_id (int): Article ID
+        """
+        logger.debug(f"Invalidating caches for {event_type} on article {article_id}")
+        self._invalidate_article(article_id)
+
+    def list_articles(self, page=1, per_page=10, filters=None, cursor=None, fields=None):
         """
         List articles with pagination and filters
 
+        Two pagination modes are supported: page-number pagination (OFFSET/LIMIT
+        with a total count) and keyset pagination when a cursor is given. Keyset
+        pagination seeks on (created_at, id) and skips the count query, so deep
+        pages cost the same as the first one.
+
         Args:
-            page (int): Page number
+            page (int): Page number (page-number mode)
             per_page (int): Items per page
             filters (dict): Filter criteria
+            cursor (str): Opaque cursor; '' requests the first keyset page,
+                None selects page-number mode
+            fields (iterable): Sparse fieldset; only these columns are loaded
 
         Returns:
             tuple: (articles list, pagination info)
+
+        Raises:
+            InvalidCursorError: If the cursor cannot be decoded
         """
-        query = Article.query
+        session = self._read_session()
+        query = session.query(Article)
+        query = self._apply_fieldset(self._apply_filters(query, filters), fields)
 
-        # Apply filters
-        if filters:
-            if filters.get('status'):
-                try:
-                    status = ArticleStatus(filters['status'])
-                    query = query.filter(Article.status == status)
-                except ValueError:
-                    pass
+        if cursor is not None:
+            articles, page_info = self._list_articles_keyset(query, per_page, cursor)
+            return self._with_primary_views(session, articles, fields), page_info
 
-            if filters.get('category'):
-                query = query.filter(Article.category == filters['category'])
+        # Order by created_at descending
+        ordered = query.order_by(Article.created_at.desc(), Article.id.desc())
 
-            if filters.get('author'):
-                query = query.filter(Article.author == filters['author'])
+        page = max(page, 1)
 
-        # Order by created_at descending
-        query = query.order_by(Article.created_at.desc())
+        # Fetch one extra row so has_next does not depend on the count
+        rows = ordered.limit(per_page + 1).offset((page - 1) * per_page).all()
+        has_next = len(rows) > per_page
+        articles = rows[:per_page]
+
+        total_items, exact = self.count_strategy.count(query, filters)
+
+        articles = self._with_primary_views(session, articles, fields)
+        return articles, self._offset_page_info(page, per_page, len(articles), has_next, total_items, exact)
+
+    def list_feed(self, per_page=10, filters=None, cursor='', fields=None):
+        """
+        List published articles by publication date, newest first
+
+        The public feed: keyset pagination on (published_at, id) without a
+        total count. The published_at IS NOT NULL condition is stated even
+        though published articles always have one, so that the planner can
+        match the partial index idx_articles_published_at and read the feed
+        in index order instead of sorting every published article.
+
+        Args:
+            per_page (int): Items per page
+            filters (dict): Filter criteria, same as list_articles; status is
+                always published
+            cursor (str): Opaque cursor returned by a previous page ('' for the first page)
+            fields (iterable): Sparse fieldset; only these columns are loaded
+
+        Returns:
+            tuple: (articles list, pagination info)
+
+        Raises:
+            InvalidCursorError: If the cursor cannot be decoded
+        """
+        session = self._read_session()
+        rows = session.scalars(self._feed_statement(per_page, filters, cursor, fields)).all()
+        articles, page_info = self._keyset_page(rows, per_page, key='published_at')
+        return self._with_primary_views(session, articles, fields), page_info
+
+    def _feed_statement(self, per_page, filters, cursor, fields=None):
+        """
+        Build the select of a feed page
+
+        Args:
+            per_page (int): Items per page; one extra row is selected to
+                know whether another page exists
+            filters (dict): Filter criteria; status is replaced by published
+            cursor (str): Opaque cursor ('' for the first page)
+            fields (iterable): Sparse fieldset
+
+        Returns:
+            Select statement
+
+        Raises:
+            InvalidCursorError: If the cursor cannot be decoded
+        """
+        filters = dict(filters or {}, status=ArticleStatus.published.value)
+        stmt = select(Article).where(
+            Article.published_at.isnot(None),
+            *self._filter_conditions(filters),
+            *self._keyset_conditions(cursor, key='published_at')
+        )
+        stmt = self._apply_fieldset(stmt, fields)
+        return stmt.order_by(Article.published_at.desc(), Article.id.desc()).limit(per_page + 1)
+
+    @staticmethod
+    def _with_primary_views(session, articles, fields=None):
+        """
+        Replace the view counts of articles read from the replica
+
+        The replica is filled from the article events and views are not
+        published as events, so its views_count stays at the value of the last
+        edit. The counts of the page are read from the primary by primary key;
+        they are set as loaded values, the replica session never writes them.
+
+        Args:
+            session: Session the articles were read with
+            articles (list): Article objects
+            fields (iterable): Sparse fieldset of the request, None for all fields
+
+        Returns:
+            list: The same articles
+        """
+        if session is db.session or not articles or (fields is not None and 'views_count' not in fields):
+            return articles
+
+        ids = [article.id for article in articles]
+        views = dict(db.session.execute(
+            select(Article.id, Article.views_count).where(Article.id.in_(ids))
+        ).all())
+        for article in articles:
+            if article.id in views:
+                set_committed_value(article, 'views_count', views[article.id])
+        return articles
+
+    @staticmethod
+    def _offset_page_info(page, per_page, count, has_next, total_items, exact):
+        """
+        Build the pagination info of a page-number page
 
-        # Paginate
-        pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+        Args:
+            page (int): Page number
+            per_page (int): Items per page
+            count (int): Articles on this page
+            has_next (bool): Whether a following page exists
+            total_items (int): Total from the count strategy
+            exact (bool): Whether the total is exact
+
+        Returns:
+            dict: Pagination info
+        """
+        if not exact and count:
+            # Keep an estimated total consistent with what this page observed
+            seen = (page - 1) * per_page + count + (1 if has_next else 0)
+            total_items = max(total_items, seen)
+        total_pages = math.ceil(total_items / per_page) if total_items else 0
+
+        return {
+            'current_page': page,
+            'total_pages': total_pages,
+            'per_page': per_page,
+            'total_items': total_items,
+            'has_next': has_next,
+            'has_prev': page > 1,
+            'total_exact': exact
+        }
+
+    def _list_articles_keyset(self, query, per_page, cursor):
+        """
+        Fetch one keyset page ordered by (created_at DESC, id DESC)
+
+        Args:
+            query: Filtered article query
+            per_page (int): Items per page
+            cursor (str): Opaque cursor ('' for the first page)
+
+        Returns:
+            tuple: (articles list, pagination info)
+        """
+        query = query.filter(*self._keyset_conditions(cursor))
+        query = query.order_by(Article.created_at.desc(), Article.id.desc())
+
+        # Fetch one extra row to know whether another page exists
+        rows = query.limit(per_page + 1).all()
+        return self._keyset_page(rows, per_page)
+
+    @staticmethod
+    def _keyset_conditions(cursor, key='created_at'):
+        """
+        Build the seek conditions of a (key DESC, id DESC) cursor
+
+        Args:
+            cursor (str): Opaque cursor ('' for the first page)
+            key (str): Datetime column the pages are ordered by
+
+        Returns:
+            list: SQLAlchemy conditions
+
+        Raises:
+            InvalidCursorError: If the cursor cannot be decoded
+        """
+        if not cursor:
+            return []
+
+        position = decode_cursor(cursor, {key: datetime, 'id': int})
+        column = getattr(Article, key)
+        last_value = position[key]
+        last_id = position['id']
+        # The leading <= bound keeps the predicate sargable for the index
+        # on the column (idx_articles_created_at, idx_articles_published_at);
+        # the OR resolves ties on id.
+        return [
+            column <= last_value,
+            or_(
+                column < last_value,
+                Article.id < last_id
+            )
+        ]
+
+    @staticmethod
+    def _keyset_page(rows, per_page, key='created_at'):
+        """
+        Split a keyset page fetched with one extra row
+
+        Args:
+            rows (list): Up to per_page + 1 articles
+            per_page (int): Items per page
+            key (str): Datetime column the pages are ordered by
+
+        Returns:
+            tuple: (articles list, pagination info)
+        """
+        articles = rows[:per_page]
+        # An empty page has no last row to continue from
+        has_next = bool(articles) and len(rows) > per_page
+
+        next_cursor = None
+        if has_next:
+            last = articles[-1]
+            next_cursor = encode_cursor({key: getattr(last, key), 'id': last.id})
 
         page_info = {
-            'current_page': pagination.page,
-            'total_pages': pagination.pages,
-            'per_page': pagination.per_page,
-            'total_items': pagination.total,
-            'has_next': pagination.has_next,
-            'has_prev': pagination.has_prev
+            'per_page': per_page,
+            'has_next': has_next,
+            'next_cursor': next_cursor
         }
 
-        return pagination.items, page_info
+        return articles, page_info
+
+    def _apply_fieldset(self, query, fields):
+        """
+        Narrow the loaded columns to a sparse fieldset
+
+        id, created_at, updated_at and published_at are always loaded because
+        cursors and ETags are built from them. The content column is only read when
+        requested; the excerpt is computed in SQL when requested.
+
+        Args:
+            query: Article query
+            fields (iterable): Requested field names, or None for all columns
+
+        Returns:
+            Query with loader options applied
+        """
+        if fields is None:
+            return query
+
+        columns = {'id', 'created_at', 'updated_at', 'published_at'}
+        columns.update(name for name in fields if name in Article.__table__.columns)
+
+        options = [load_only(*(getattr(Article, name) for name in sorted(columns)))]
+        if 'excerpt' in fields:
+            options.append(undefer(Article.excerpt))
+
+        return query.options(*options)
+
+    def _apply_filters(self, query, filters):
+        """
+        Apply list filters to an article query
+
+        Args:
+            query: Article query
+            filters (dict): Filter criteria (status, category, author, tags, any_tags
+                and the date ranges)
+
+        Returns:
+            Filtered query
+        """
+        conditions = self._filter_conditions(filters)
+        return query.filter(*conditions) if conditions else query
+
+    def _filter_conditions(self, filters, strict=False):
+        """
+        Build SQL conditions for list filters
+
+        Args:
+            filters (dict): Filter criteria (status, category, author); tags
+                (all of) and any_tags (any of) take a list or a comma-separated string;
+                published_after, published_before and created_after take a
+                datetime or an ISO 8601 string
+            strict (bool): Raise on invalid values instead of ignoring them
+
+        Returns:
+            list: SQLAlchemy conditions
+
+        Raises:
+            ValueError: If strict and a filter value is invalid
+        """
+        conditions = []
+        if not filters:
+            return conditions
+
+        if filters.get('status'):
+            try:
+                conditions.append(Article.status == ArticleStatus(filters['status']))
+            except ValueError:
+                if strict:
+                    raise ValueError(f"Invalid status filter: {filters['status']}")
+
+        if filters.get('category'):
+            conditions.append(Article.category == filters['category'])
+
+        if filters.get('author'):
+            conditions.append(Article.author == filters['author'])
+
+        for key, match_any in (('tags', False), ('any_tags', True)):
+            if filters.get(key):
+                tags = self._tag_list(filters[key])
+                if tags:
+                    conditions.append(TagsMatch(Article.tags, tags, match_any=match_any))
+                elif strict:
+                    raise ValueError(f"Invalid {key} filter: {filters[key]}")
+
+        for key, (column, lower) in DATE_FILTERS.items():
+            if filters.get(key):
+                moment = parse_datetime(filters[key])
+                if moment is not None:
+                    conditions.append(column >= moment if lower else column < moment)
+                elif strict:
+                    raise ValueError(f"Invalid {key} filter: {filters[key]}")
+
+        return conditions
+
+    @staticmethod
+    def _tag_list(value):
+        """
+        Normalize a tag filter value
+
+        Args:
+            value: List of tags or comma-separated string
+
+        Returns:
+            list: Distinct non-empty tags, empty if the value is invalid
+        """
+        if isinstance(value, str):
+            value = value.split(',')
+        elif not isinstance(value, (list, tuple)):
+            return []
+
+        tags = []
+        for tag in value:
+            if isinstance(tag, str) and tag.strip() and tag.strip() not in tags:
+                tags.append(tag.strip())
+        return tags
+
+    def get_facets(self, filters=None, facets=FACETS, limit=20):
+        """
+        Count articles per status, category, author and tag
+
+        Served from the facet summary once its first rebuild has completed;
+        its size depends on the number of distinct facet values rather than
+        on the number of articles. Tag and date filters cannot be answered
+        from the summary (it does not record which tags occur together, nor
+        dates): they are computed from the matching articles.
+
+        Args:
+            filters (dict): Filter criteria, same as list_articles
+            facets (iterable): Facets to return (status, category, author, tags)
+            limit (int): Maximum values per facet, most frequent first
+
+        Returns:
+            dict: Values and counts per facet, total and source (summary or articles)
+        """
+        filters = filters or {}
+        summary_filters = {'status', 'category', 'author'}
+        if (self.article_facets and self.article_facets.is_complete(db.session)
+                and all(key in summary_filters for key, value in filters.items() if value)):
+            values, total = self.article_facets.get_facets(db.session, filters, facets, limit)
+            source = 'summary'
+        else:
+            rows = self._read_session().execute(
+                select(Article.status, Article.category, Article.author, Article.tags)
+                .where(*self._filter_conditions(filters))
+            )
+            counts = Counter()
+            for row in rows:
+                counts.update(facet_keys(row.status, row.category, row.author, row.tags))
+            values, total = aggregate_facets(counts, facets, limit)
+            source = 'articles'
+
+        return {'facets': values, 'total': total, 'source': source}
 
     def update_article(self, article_id, data):
         """
@@ -130,10 +758,13 @@ class ArticleService:
         Raises:
             Exception: If update fails
         """
-        article = self.get_article(article_id)
+        article = self.get_article(article_id, primary=True)
         if not article:
             return None
 
+        before = count_key(article.status, article.category)
+        facets_before = facet_keys(article.status, article.category, article.author, article.tags)
+
         try:
             # Update fields
             if 'title' in data:
@@ -154,12 +785,20 @@ class ArticleService:
 
             article.updated_at = datetime.utcnow()
 
+            self._stage_facets(facets_before, facet_keys(article.status, article.category, article.author, article.tags))
+            self._stage_events('article.updated', [article.to_dict()])
             db.session.commit()
 
             logger.info(f"Article updated successfully: ID={article.id}")
 
+            self._invalidate_article(article.id)
+            if self.article_counts and before != count_key(article.status, article.category):
+                self.article_counts.request_reconcile()
+
             # Publish to Kafka
-            if self.kafka_producer:
+            if self.outbox_relay:
+                self.outbox_relay.notify()
+            elif self.kafka_producer:
                 self.kafka_producer.publish_article_updated(article.to_dict())
 
             return article
@@ -182,7 +821,7 @@ class ArticleService:
         Raises:
             Exception: If deletion fails
         """
-        article = self.get_article(article_id)
+        article = self.get_article(article_id, primary=True)
         if not article:
             return False
 
@@ -190,12 +829,20 @@ class ArticleService:
             article_data = article.to_dict()
 
             db.session.delete(article)
+            self._stage_facets(before=article_facet_keys([article_data]))
+            self._stage_events('article.deleted', [article_data])
             db.session.commit()
 
             logger.info(f"Article deleted successfully: ID={article_id}")
 
+            self._invalidate_article(article_id)
+            if self.article_counts:
+                self.article_counts.request_reconcile()
+
             # Publish to Kafka
-            if self.kafka_producer:
+            if self.outbox_relay:
+                self.outbox_relay.notify()
+            elif self.kafka_producer:
                 self.kafka_producer.publish_article_deleted(article_data)
 
             return True
@@ -218,21 +865,32 @@ class ArticleService:
         Raises:
             Exception: If publish fails
         """
-        article = self.get_article(article_id)
+        article = self.get_article(article_id, primary=True)
         if not article:
             return None
 
+        before = count_key(article.status, article.category)
+        facets_before = facet_keys(article.status, article.category, article.author, article.tags)
+
         try:
             article.status = ArticleStatus.published
             article.published_at = datetime.utcnow()
             article.updated_at = datetime.utcnow()
 
+            self._stage_facets(facets_before, facet_keys(article.status, article.category, article.author, article.tags))
+            self._stage_events('article.published', [article.to_dict()])
             db.session.commit()
 
             logger.info(f"Article published successfully: ID={article_id}")
 
+            self._invalidate_article(article_id)
+            if self.article_counts and before != count_key(article.status, article.category):
+                self.article_counts.request_reconcile()
+
             # Publish to Kafka
-            if self.kafka_producer:
+            if self.outbox_relay:
+                self.outbox_relay.notify()
+            elif self.kafka_producer:
                 self.kafka_producer.publish_article_published(article.to_dict())
 
             return article
@@ -242,45 +900,302 @@ class ArticleService:
             logger.error(f"Error publishing article {article_id}: {str(e)}")
             raise
 
-    def search_articles(self, query_string):
+    def bulk_apply(self, action, filters, changes=None, dry_run=False, event_chunk_size=100):
+        """
+        Apply an update, publish, archive or delete to every article matching filters
+
+        The change runs as one set-based UPDATE/DELETE ... RETURNING statement
+        and the matching events are published in chunks after commit (or
+        written to the outbox in the same transaction).
+
+        Args:
+            action (str): One of update, publish, archive, delete
+            filters (dict): Filter criteria, same as list_articles (at least one required)
+            changes (dict): Field values to set (update only); setting the
+                status to published also sets published_at and emits
+                article.published, like the publish action
+            dry_run (bool): Only count the matching articles
+            event_chunk_size (int): Events published per Kafka batch
+
+        Returns:
+            dict: Action summary with the number of affected articles
+
+        Raises:
+            ValueError: If the action, filters or changes are invalid
+            Exception: If the statement fails
+        """
+        if action not in self.BULK_EVENT_TYPES:
+            raise ValueError(f"Unknown bulk action: {action}")
+
+        conditions = self._filter_conditions(filters, strict=True)
+        if not conditions:
+            raise ValueError('At least one filter is required for bulk operations')
+
+        if dry_run:
+            affected = db.session.scalar(select(func.count(Article.id)).where(*conditions))
+            return {'action': action, 'dry_run': True, 'affected': affected}
+
+        now = datetime.utcnow()
+        event_type = self.BULK_EVENT_TYPES[action]
+        if action == 'delete':
+            stmt = delete(Article).where(*conditions)
+        else:
+            if action == 'update':
+                values = self._bulk_update_values(changes)
+                if values.get('status') == ArticleStatus.published:
+                    # Same as the publish action: stamp and announce the publication
+                    values['published_at'] = now
+                    event_type = self.BULK_EVENT_TYPES['publish']
+            elif action == 'publish':
+                values = {'status': ArticleStatus.published, 'published_at': now}
+            else:
+                values = {'status': ArticleStatus.archived}
+            values['updated_at'] = now
+            stmt = update(Article).where(*conditions).values(**values)
+
+        try:
+            # RETURNING only gives the new state: lock and read the facet
+            # columns of the matching rows first
+            facets_before = []
+            if self.article_facets and action != 'delete':
+                facets_before = [
+                    key
+                    for row in db.session.execute(
+                        select(Article.status, Article.category, Article.author, Article.tags)
+                        .where(*conditions)
+                        .with_for_update()
+                    )
+                    for key in facet_keys(row.status, row.category, row.author, row.tags)
+                ]
+
+            articles = list(db.session.scalars(
+                stmt.returning(Article),
+                execution_options={'synchronize_session': False}
+            ))
+            events = [article.to_dict() for article in articles]
+            if action == 'delete':
+                self._stage_facets(before=article_facet_keys(events))
+            else:
+                self._stage_facets(facets_before, article_facet_keys(events))
+            self._stage_events(event_type, events)
+            db.session.commit()
+
+            logger.info(f"Bulk {action} applied to {len(articles)} articles")
+
+            for article_data in events:
+                self._invalidate_article(article_data['id'])
+
+            if self.article_counts and events:
+                self.article_counts.request_reconcile()
+
+            # Publish to Kafka in chunks
+            if self.outbox_relay:
+                self.outbox_relay.notify()
+            elif self.kafka_producer:
+                for start in range(0, len(events), event_chunk_size):
+                    self.kafka_producer.publish_events(event_type, events[start:start + event_chunk_size])
+
+            return {
+                'action': action,
+                'dry_run': False,
+                'affected': len(events),
+                'ids': [article_data['id'] for article_data in events]
+            }
+
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error applying bulk {action}: {str(e)}")
+            raise
+
+    @staticmethod
+    def _bulk_update_values(changes):
+        """
+        Map validated update data to column values
+
+        Args:
+            changes (dict): Validated update data
+
+        Returns:
+            dict: Column values
+
+        Raises:
+            ValueError: If there is nothing to update
+        """
+        values = {
+            key: changes[key]
+            for key in ('title', 'content', 'author', 'category', 'tags')
+            if changes and key in changes
+        }
+        if changes and 'status' in changes:
+            values['status'] = ArticleStatus(changes['status'])
+
+        if not values:
+            raise ValueError('No changes given for bulk update')
+
+        return values
+
+    def search_articles(self, query_string, limit=20, cursor=None, fields=None):
         """
         Search articles by title or content
 
+        On PostgreSQL the search runs on the same to_tsvector expression as the
+        idx_articles_title_content_fts GIN index, ordered by ts_rank. Other
+        databases (SQLite in tests) fall back to case-insensitive LIKE matching
+        on title, content and author, ordered by id.
+
+        Args:
+            query_string (str): Search query (websearch syntax on PostgreSQL)
+            limit (int): Maximum number of results
+            cursor (str): Opaque cursor returned by a previous call
+            fields (iterable): Sparse fieldset; only these columns are loaded
+
+        Returns:
+            tuple: (list of matching articles, total match count, next cursor)
+
+        Raises:
+            InvalidCursorError: If the cursor cannot be decoded
+        """
+        session = self._read_session()
+        if db.engine.dialect.name == 'postgresql':
+            search = self._search_articles_fulltext
+        else:
+            search = self._search_articles_like
+        articles, total, next_cursor = search(session, query_string, limit, cursor, fields)
+        return self._with_primary_views(session, articles, fields), total, next_cursor
+
+    def _search_articles_fulltext(self, session, query_string, limit, cursor, fields=None):
+        """Full-text search backed by idx_articles_title_content_fts"""
+        match, rank = self._fulltext_clauses(query_string)
+
+        total = session.query(func.count(Article.id)).filter(match).scalar()
+
+        query = self._apply_fieldset(session.query(Article, rank.label('rank')).filter(match), fields)
+        if cursor:
+            query = query.filter(self._rank_seek_condition(rank, cursor))
+
+        rows = query.order_by(rank.desc(), Article.id.desc()).limit(limit + 1).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            last_article, last_rank = rows[limit - 1]
+            next_cursor = encode_cursor({'rank': last_rank, 'id': last_article.id})
+
+        return [article for article, _ in rows[:limit]], total, next_cursor
+
+    @staticmethod
+    def _rank_seek_condition(rank, cursor):
+        """
+        Build the seek condition of a (rank DESC, id DESC) search cursor
+
+        Args:
+            rank: Rank expression from _fulltext_clauses
+            cursor (str): Opaque cursor returned by a previous page
+
+        Returns:
+            SQLAlchemy condition
+
+        Raises:
+            InvalidCursorError: If the cursor cannot be decoded
+        """
+        position = decode_cursor(cursor, {'rank': float, 'id': int})
+        # ts_rank returns real: compared with the bound float8 the rank of
+        # the row ending the previous page would never be equal, and rows
+        # tied with it would be served again
+        last_rank = cast(position['rank'], REAL)
+        return or_(
+            rank < last_rank,
+            and_(rank == last_rank, Article.id < position['id'])
+        )
+
+    @staticmethod
+    def _fulltext_clauses(query_string):
+        """
+        Build the full-text match condition and rank expression
+
+        Args:
+            query_string (str): Search query (websearch syntax)
+
+        Returns:
+            tuple: (match condition, rank expression)
+        """
+        # Must stay identical to the index expression in init-db1.sql
+        document = func.to_tsvector(
+            literal_column("'english'"),
+            func.coalesce(Article.title, literal_column("''"))
+            .op('||')(literal_column("' '"))
+            .op('||')(func.coalesce(Article.content, literal_column("''")))
+        )
+        ts_query = func.websearch_to_tsquery(literal_column("'english'"), query_string)
+        return document.op('@@')(ts_query), func.ts_rank(document, ts_query)
+
+    @staticmethod
+    def _like_condition(query_string):
+        """
+        Build the portable LIKE search condition
+
         Args:
             query_string (str): Search query
 
         Returns:
-            list: List of matching articles
+            SQLAlchemy condition on title, content and author
         """
         search_pattern = f"%{query_string}%"
-        articles = Article.query.filter(
-            or_(
-                Article.title.ilike(search_pattern),
-                Article.content.ilike(search_pattern),
-                Article.author.ilike(search_pattern)
-            )
-        ).all()
+        return or_(
+            Article.title.ilike(search_pattern),
+            Article.content.ilike(search_pattern),
+            Article.author.ilike(search_pattern)
+        )
 
-        return articles
+    def _search_articles_like(self, session, query_string, limit, cursor, fields=None):
+        """Portable LIKE-based search used when full-text search is unavailable"""
+        query = session.query(Article).filter(self._like_condition(query_string))
+
+        total = query.count()
+
+        query = self._apply_fieldset(query, fields)
+        if cursor:
+            position = decode_cursor(cursor, {'id': int})
+            query = query.filter(Article.id < position['id'])
+
+        rows = query.order_by(Article.id.desc()).limit(limit + 1).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = encode_cursor({'id': rows[limit - 1].id})
+
+        return rows[:limit], total, next_cursor
 
     def increment_views(self, article_id):
         """
         Increment article view count
 
+        With a view counter configured the view is buffered and written in a
+        later batch; otherwise it is written immediately.
+
         Args:
             article_id (int): Article ID
 
         Returns:
             bool: True if successful, False otherwise
         """
-        article = self.get_article(article_id)
-        if not article:
-            return False
+        if self.view_counter:
+            return self.view_counter.record(article_id)
 
         try:
-            article.views_count += 1
+            # Atomic increment; views are not edits, so updated_at (and with
+            # it the article's ETag) is left unchanged
+            result = db.session.execute(
+                update(Article)
+                .where(Article.id == article_id)
+                .values(views_count=Article.views_count + 1, updated_at=Article.updated_at)
+                .execution_options(synchronize_session=False)
+            )
+            if self.trending and result.rowcount:
+                db.session.execute(view_bucket_statement(
+                    {article_id: 1}, self.trending.bucket_seconds, db.session.get_bind().dialect.name
+                ))
             db.session.commit()
-            return True
+            return result.rowcount > 0
         except Exception as e:
             db.session.rollback()
             logger.error(f"Error incrementing views for article {article_id}: {str(e)}")
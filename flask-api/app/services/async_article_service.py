@@ -0,0 +1,509 @@
+import asyncio
+import logging
+from datetime import datetime
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.engine import make_url
+from app.models.article import Article, ArticleStatus
+from app.models.outbox import OutboxEvent
+from app.services.article_counts import count_key
+from app.services.article_facets import facet_keys
+from app.services.trending import view_bucket_statement
+from app.schemas.fast_serializer import serialize_article
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.http_cache import article_version
+
+logger = logging.getLogger(__name__)
+
+# Async drivers used in ASGI mode for each sync dialect
+ASYNC_DRIVERS = {
+    'postgresql': 'postgresql+asyncpg',
+    'sqlite': 'sqlite+aiosqlite'
+}
+
+
+def async_database_url(url):
+    """
+    Map a database URL to the matching async driver
+
+    Args:
+        url (str): SQLAlchemy database URL (sync driver)
+
+    Returns:
+        str: URL using asyncpg or aiosqlite
+
+    Raises:
+        ValueError: If the database has no supported async driver
+    """
+    url = make_url(url)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver for database '{url.get_backend_name()}'")
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+class AsyncArticleService:
+    """
+    Async counterpart of ArticleService for the ASGI serving mode
+
+    Runs the article queries on an AsyncSession so that a worker's event loop
+    keeps serving other requests while PostgreSQL answers. Query building,
+    caches, counters and the outbox are shared with the sync ArticleService,
+    so both modes return the same data and publish the same events. Reads use
+    the primary only; replica routing is a WSGI-mode feature.
+    """
+
+    def __init__(self, article_service, session_factory):
+        """
+        Initialize AsyncArticleService
+
+        Args:
+            article_service (ArticleService): Sync service whose collaborators are reused
+            session_factory (async_sessionmaker): Factory of AsyncSession on the primary
+        """
+        self.sync = article_service
+        self.session_factory = session_factory
+
+    async def _publish(self, method, *args):
+        """
+        Hand events to the relay, or to Kafka off the event loop
+
+        Args:
+            method (str): KafkaProducerService method used without an outbox
+            *args: Arguments of that method
+        """
+        if self.sync.outbox_relay:
+            self.sync.outbox_relay.notify()
+        elif self.sync.kafka_producer:
+            await asyncio.to_thread(getattr(self.sync.kafka_producer, method), *args)
+
+    async def _stage_events(self, session, event_type, articles_data):
+        """
+        Write events to the outbox in the session's transaction
+
+        Args:
+            session (AsyncSession): Session of the change
+            event_type (str): Type of event
+            articles_data (list): Article data dictionaries
+        """
+        if self.sync.outbox_relay and articles_data:
+            await session.execute(insert(OutboxEvent), self.sync._outbox_rows(event_type, articles_data))
+
+    async def _stage_facets(self, session, before=(), after=()):
+        """
+        Apply a change to the facet summary in the session's transaction
+
+        Args:
+            session (AsyncSession): Session of the change
+            before (list): Summary keys of the article before the change
+            after (list): Summary keys of the article after the change
+        """
+        if self.sync.article_facets:
+            stmt = self.sync.article_facets.delta_statement(before, after, session.bind.dialect.name)
+            if stmt is not None:
+                await session.execute(stmt)
+
+    async def create_article(self, data):
+        """
+        Create a new article
+
+        Args:
+            data (dict): Validated article data
+
+        Returns:
+            Article: Created article
+
+        Raises:
+            Exception: If creation fails
+        """
+        async with self.session_factory() as session:
+            try:
+                article = Article(
+                    title=data.get('title'),
+                    content=data.get('content'),
+                    author=data.get('author'),
+                    category=data.get('category', 'general'),
+                    tags=data.get('tags', []),
+                    status=ArticleStatus.draft
+                )
+
+                session.add(article)
+                await session.flush()
+                await self._stage_facets(
+                    session, after=facet_keys(article.status, article.category, article.author, article.tags)
+                )
+                article_data = article.to_dict()
+                await self._stage_events(session, 'article.created', [article_data])
+                await session.commit()
+            except Exception as e:
+                await session.rollback()
+                logger.error(f"Error creating article: {str(e)}")
+                raise
+
+        logger.info(f"Article created successfully: ID={article.id}, Title={article.title}")
+
+        self.sync.count_strategy.invalidate()
+        if self.sync.article_counts:
+            self.sync.article_counts.request_reconcile()
+
+        await self._publish('publish_article_created', article_data)
+        return article
+
+    async def _modify_article(self, article_id, event_type, apply):
+        """
+        Load an article, change it and stage its event in one transaction
+
+        Args:
+            article_id (int): Article ID
+            event_type (str): Event written for the change
+            apply (callable): Mutates the loaded article
+
+        Returns:
+            tuple: (article, event data, count key before the change), or None if not found
+        """
+        async with self.session_factory() as session:
+            article = await session.get(Article, article_id)
+            if not article:
+                return None
+
+            before = count_key(article.status, article.category)
+            facets_before = facet_keys(article.status, article.category, article.author, article.tags)
+            try:
+                apply(article)
+                await self._stage_facets(
+                    session, facets_before,
+                    facet_keys(article.status, article.category, article.author, article.tags)
+                )
+                article_data = article.to_dict()
+                await self._stage_events(session, event_type, [article_data])
+                await session.commit()
+            except Exception as e:
+                await session.rollback()
+                logger.error(f"Error applying {event_type} to article {article_id}: {str(e)}")
+                raise
+
+        self.sync._invalidate_article(article_id)
+        if self.sync.article_counts and before != count_key(article.status, article.category):
+            self.sync.article_counts.request_reconcile()
+
+        return article, article_data, before
+
+    async def update_article(self, article_id, data):
+        """
+        Update an article
+
+        Args:
+            article_id (int): Article ID
+            data (dict): Validated update data
+
+        Returns:
+            Article: Updated article or None if not found
+
+        Raises:
+            Exception: If update fails
+        """
+        def apply(article):
+            for key in ('title', 'content', 'author', 'category', 'tags'):
+                if key in data:
+                    setattr(article, key, data[key])
+            if 'status' in data:
+                try:
+                    article.status = ArticleStatus(data['status'])
+                except ValueError:
+                    logger.warning(f"Invalid status value: {data['status']}")
+            article.updated_at = datetime.utcnow()
+
+        result = await self._modify_article(article_id, 'article.updated', apply)
+        if result is None:
+            return None
+
+        article, article_data, _ = result
+        logger.info(f"Article updated successfully: ID={article_id}")
+        await self._publish('publish_article_updated', article_data)
+        return article
+
+    async def publish_article(self, article_id):
+        """
+        Publish an article (change status to PUBLISHED)
+
+        Args:
+            article_id (int): Article ID
+
+        Returns:
+            Article: Published article or None if not found
+
+        Raises:
+            Exception: If publish fails
+        """
+        def apply(article):
+            now = datetime.utcnow()
+            article.status = ArticleStatus.published
+            article.published_at = now
+            article.updated_at = now
+
+        result = await self._modify_article(article_id, 'article.published', apply)
+        if result is None:
+            return None
+
+        article, article_data, _ = result
+        logger.info(f"Article published successfully: ID={article_id}")
+        await self._publish('publish_article_published', article_data)
+        return article
+
+    async def delete_article(self, article_id):
+        """
+        Delete an article
+
+        Args:
+            article_id (int): Article ID
+
+        Returns:
+            bool: True if deleted, False if not found
+
+        Raises:
+            Exception: If deletion fails
+        """
+        async with self.session_factory() as session:
+            article = await session.get(Article, article_id)
+            if not article:
+                return False
+
+            try:
+                article_data = article.to_dict()
+                await session.delete(article)
+                await self._stage_facets(
+                    session, before=facet_keys(article.status, article.category, article.author, article.tags)
+                )
+                await self._stage_events(session, 'article.deleted', [article_data])
+                await session.commit()
+            except Exception as e:
+                await session.rollback()
+                logger.error(f"Error deleting article {article_id}: {str(e)}")
+                raise
+
+        logger.info(f"Article deleted successfully: ID={article_id}")
+
+        self.sync._invalidate_article(article_id)
+        if self.sync.article_counts:
+            self.sync.article_counts.request_reconcile()
+
+        await self._publish('publish_article_deleted', article_data)
+        return True
+
+    async def get_article_payload(self, article_id):
+        """
+        Get a serialized article, reading through the article cache
+
+        Args:
+            article_id (int): Article ID
+
+        Returns:
+            dict: Serialized article or None if not found
+        """
+        article_cache = self.sync.article_cache
+        if article_cache:
+            payload = article_cache.get(article_id)
+            if payload is not None:
+                return payload
+
+        async with self.session_factory() as session:
+            article = await session.get(Article, article_id)
+            if not article:
+                return None
+            payload = serialize_article(article)
+
+        if article_cache:
+            article_cache.set(article_id, payload)
+        return payload
+
+    async def get_article_version(self, article_id):
+        """
+        Get the version timestamp of an article without loading its content
+
+        Args:
+            article_id (int): Article ID
+
+        Returns:
+            str: ISO timestamp of the last change, or None if not found
+        """
+        if self.sync.article_cache:
+            payload = self.sync.article_cache.get(article_id)
+            if payload is not None:
+                return article_version(payload)
+
+        async with self.session_factory() as session:
+            row = (await session.execute(
+                select(Article.updated_at, Article.created_at).where(Article.id == article_id)
+            )).first()
+
+        if row is None:
+            return None
+
+        changed_at = row.updated_at or row.created_at
+        return changed_at.isoformat() if changed_at else ''
+
+    async def increment_views(self, article_id):
+        """
+        Increment article view count
+
+        Args:
+            article_id (int): Article ID
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if self.sync.view_counter:
+            return self.sync.view_counter.record(article_id)
+
+        async with self.session_factory() as session:
+            try:
+                result = await session.execute(
+                    update(Article)
+                    .where(Article.id == article_id)
+                    .values(views_count=Article.views_count + 1, updated_at=Article.updated_at)
+                    .execution_options(synchronize_session=False)
+                )
+                if self.sync.trending and result.rowcount:
+                    await session.execute(view_bucket_statement(
+                        {article_id: 1}, self.sync.trending.bucket_seconds, session.bind.dialect.name
+                    ))
+                await session.commit()
+                return result.rowcount > 0
+            except Exception as e:
+                await session.rollback()
+                logger.error(f"Error incrementing views for article {article_id}: {str(e)}")
+                return False
+
+    async def list_articles(self, page=1, per_page=10, filters=None, cursor=None, fields=None):
+        """
+        List articles with pagination and filters
+
+        Same pagination modes and page info as ArticleService.list_articles.
+
+        Args:
+            page (int): Page number (page-number mode)
+            per_page (int): Items per page
+            filters (dict): Filter criteria
+            cursor (str): Opaque cursor; '' requests the first keyset page,
+                None selects page-number mode
+            fields (iterable): Sparse fieldset; only these columns are loaded
+
+        Returns:
+            tuple: (articles list, pagination info)
+
+        Raises:
+            InvalidCursorError: If the cursor cannot be decoded
+        """
+        conditions = self.sync._filter_conditions(filters)
+        stmt = self.sync._apply_fieldset(select(Article).where(*conditions), fields)
+        stmt = stmt.order_by(Article.created_at.desc(), Article.id.desc())
+
+        async with self.session_factory() as session:
+            if cursor is not None:
+                stmt = stmt.where(*self.sync._keyset_conditions(cursor))
+                rows = (await session.scalars(stmt.limit(per_page + 1))).all()
+                return self.sync._keyset_page(rows, per_page)
+
+            page = max(page, 1)
+            rows = (await session.scalars(
+                stmt.limit(per_page + 1).offset((page - 1) * per_page)
+            )).all()
+            has_next = len(rows) > per_page
+            articles = rows[:per_page]
+
+            # Count strategies work on a sync Query; run them on the session's greenlet
+            total_items, exact = await session.run_sync(
+                lambda sync_session: self.sync.count_strategy.count(
+                    sync_session.query(Article).filter(*conditions), filters
+                )
+            )
+
+        return articles, self.sync._offset_page_info(page, per_page, len(articles), has_next, total_items, exact)
+
+    async def list_feed(self, per_page=10, filters=None, cursor='', fields=None):
+        """
+        List published articles by publication date, newest first
+
+        Same conditions and keyset pagination as ArticleService.list_feed.
+
+        Args:
+            per_page (int): Items per page
+            filters (dict): Filter criteria; status is always published
+            cursor (str): Opaque cursor returned by a previous page ('' for the first page)
+            fields (iterable): Sparse fieldset; only these columns are loaded
+
+        Returns:
+            tuple: (articles list, pagination info)
+
+        Raises:
+            InvalidCursorError: If the cursor cannot be decoded
+        """
+        stmt = self.sync._feed_statement(per_page, filters, cursor, fields)
+
+        async with self.session_factory() as session:
+            rows = (await session.scalars(stmt)).all()
+
+        return self.sync._keyset_page(rows, per_page, key='published_at')
+
+    async def search_articles(self, query_string, limit=20, cursor=None, fields=None):
+        """
+        Search articles by title or content
+
+        Full-text search on PostgreSQL, LIKE matching elsewhere, as in
+        ArticleService.search_articles.
+
+        Args:
+            query_string (str): Search query
+            limit (int): Maximum number of results
+            cursor (str): Opaque cursor returned by a previous call
+            fields (iterable): Sparse fieldset; only these columns are loaded
+
+        Returns:
+            tuple: (list of matching articles, total match count, next cursor)
+
+        Raises:
+            InvalidCursorError: If the cursor cannot be decoded
+        """
+        async with self.session_factory() as session:
+            if session.bind.dialect.name == 'postgresql':
+                return await self._search_fulltext(session, query_string, limit, cursor, fields)
+            return await self._search_like(session, query_string, limit, cursor, fields)
+
+    async def _search_fulltext(self, session, query_string, limit, cursor, fields=None):
+        """Full-text search backed by idx_articles_title_content_fts"""
+        match, rank = self.sync._fulltext_clauses(query_string)
+
+        total = await session.scalar(select(func.count(Article.id)).where(match))
+
+        stmt = self.sync._apply_fieldset(select(Article, rank.label('rank')).where(match), fields)
+        if cursor:
+            stmt = stmt.where(self.sync._rank_seek_condition(rank, cursor))
+
+        rows = (await session.execute(
+            stmt.order_by(rank.desc(), Article.id.desc()).limit(limit + 1)
+        )).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            last_article, last_rank = rows[limit - 1]
+            next_cursor = encode_cursor({'rank': last_rank, 'id': last_article.id})
+
+        return [article for article, _ in rows[:limit]], total, next_cursor
+
+    async def _search_like(self, session, query_string, limit, cursor, fields=None):
+        """Portable LIKE-based search used when full-text search is unavailable"""
+        match = self.sync._like_condition(query_string)
+
+        total = await session.scalar(select(func.count(Article.id)).where(match))
+
+        stmt = self.sync._apply_fieldset(select(Article).where(match), fields)
+        if cursor:
+            position = decode_cursor(cursor, {'id': int})
+            stmt = stmt.where(Article.id < position['id'])
+
+        rows = (await session.scalars(stmt.order_by(Article.id.desc()).limit(limit + 1))).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = encode_cursor({'id': rows[limit - 1].id})
+
+        return rows[:limit], total, next_cursor
@@ -0,0 +1,205 @@
+import json
+import logging
+import queue
+import threading
+from app.utils.metrics import record_cache_invalidation_event
+
+logger = logging.getLogger(__name__)
+
+
+class KafkaEventSource:
+    """Event source reading article events from Kafka"""
+
+    def __init__(self, bootstrap_servers, topic):
+        """
+        Initialize the Kafka event source
+
+        Every worker uses its own consumer without a group so that each one
+        receives every event, starting from the latest offset.
+
+        Args:
+            bootstrap_servers (str): Kafka bootstrap servers
+            topic (str): Kafka topic name
+        """
+        from kafka import KafkaConsumer
+
+        self.consumer = KafkaConsumer(
+            topic,
+            bootstrap_servers=bootstrap_servers.split(','),
+            group_id=None,
+            auto_offset_reset='latest',
+            enable_auto_commit=False,
+            value_deserializer=lambda m: json.loads(m.decode('utf-8'))
+        )
+
+    def poll(self, timeout):
+        """
+        Fetch available events
+
+        Args:
+            timeout (float): Maximum seconds to wait
+
+        Returns:
+            list: Event dictionaries
+        """
+        records = self.consumer.poll(timeout_ms=int(timeout * 1000))
+        return [record.value for batch in records.values() for record in batch]
+
+    def close(self):
+        """Close the consumer"""
+        self.consumer.close()
+
+
+class InMemoryEventSource:
+    """Subscription to an InMemoryEventBus"""
+
+    def __init__(self, bus):
+        self._bus = bus
+        self._queue = queue.Queue()
+
+    def poll(self, timeout):
+        """
+        Fetch available events
+
+        Args:
+            timeout (float): Maximum seconds to wait for the first event
+
+        Returns:
+            list: Event dictionaries
+        """
+        try:
+            events = [self._queue.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+
+        while True:
+            try:
+                events.append(self._queue.get_nowait())
+            except queue.Empty:
+                return events
+
+    def close(self):
+        """Unsubscribe from the bus"""
+        self._bus.unsubscribe(self)
+
+
+class InMemoryEventBus:
+    """In-process stand-in for the article events topic"""
+
+    def __init__(self):
+        self._subscribers = []
+        self._lock = threading.Lock()
+
+    def subscribe(self):
+        """
+        Create a subscription receiving every event published from now on
+
+        Returns:
+            InMemoryEventSource: New subscription
+        """
+        source = InMemoryEventSource(self)
+        with self._lock:
+            self._subscribers.append(source)
+        return source
+
+    def unsubscribe(self, source):
+        """
+        Remove a subscription
+
+        Args:
+            source (InMemoryEventSource): Subscription to remove
+        """
+        with self._lock:
+            if source in self._subscribers:
+                self._subscribers.remove(source)
+
+    def publish(self, event):
+        """
+        Deliver an event to every subscriber
+
+        Args:
+            event (dict): Article event
+        """
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for source in subscribers:
+            source._queue.put(event)
+
+
+class CacheInvalidationListener:
+    """
+    Background listener evicting cached articles on article events
+
+    Each worker runs its own listener, so a write handled by one worker or
+    replica invalidates the local caches of all of them.
+    """
+
+    def __init__(self, source_factory, article_service, poll_timeout=1.0, retry_delay=5.0):
+        """
+        Initialize the listener
+
+        Args:
+            source_factory (callable): Returns an event source with poll()/close()
+            article_service (ArticleService): Service owning the caches
+            poll_timeout (float): Seconds to wait for events per poll
+            retry_delay (float): Seconds to wait before reconnecting after an error
+        """
+        self.source_factory = source_factory
+        self.article_service = article_service
+        self.poll_timeout = poll_timeout
+        self.retry_delay = retry_delay
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start the listener thread"""
+        self._thread = threading.Thread(target=self._run, name='cache-invalidation', daemon=True)
+        self._thread.start()
+        logger.info("Cache invalidation listener started")
+
+    def stop(self):
+        """Stop the listener thread"""
+        self._stop.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=self.poll_timeout + 1)
+
+    def _run(self):
+        """Consume events until stopped, reconnecting on errors"""
+        while not self._stop.is_set():
+            source = None
+            try:
+                source = self.source_factory()
+                while not self._stop.is_set():
+                    for event in source.poll(self.poll_timeout):
+                        self.handle_event(event)
+            except Exception as e:
+                logger.error(f"Cache invalidation listener error: {str(e)}")
+                self._stop.wait(self.retry_delay)
+            finally:
+                if source is not None:
+                    try:
+                        source.close()
+                    except Exception:
+                        pass
+
+    def handle_event(self, event):
+        """
+        Apply a single article event to the local caches
+
+        Args:
+            event (dict): Article event
+
+        Returns:
+            bool: True if the event referenced an article
+        """
+        event_type = event.get('event_type', 'unknown')
+        article_id = (event.get('data') or {}).get('id')
+
+        record_cache_invalidation_event(event_type)
+
+        if article_id is None:
+            logger.warning(f"Ignoring article event without an article id: {event_type}")
+            return False
+
+        self.article_service.handle_article_event(event_type, article_id)
+        return True
@@ -0,0 +1,196 @@
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+
+class ExactCountStrategy:
+    """Always run COUNT(*) for the filtered query"""
+
+    name = 'exact'
+
+    def count(self, query, filters=None):
+        """
+        Count rows matching a query
+
+        Args:
+            query: Filtered article query
+            filters (dict): Filter criteria used to build the query
+
+        Returns:
+            tuple: (total count, whether the count is exact)
+        """
+        return query.order_by(None).count(), True
+
+    def invalidate(self):
+        """Nothing is cached"""
+
+
+class CachedCountStrategy:
+    """Cache exact counts per filter combination in a bounded LRU with a TTL"""
+
+    name = 'cached'
+
+    def __init__(self, ttl=30, fallback=None, max_size=1000):
+        """
+        Initialize the cached count strategy
+
+        Args:
+            ttl (float): Seconds a cached count stays valid
+            fallback: Strategy used to compute counts on a cache miss
+            max_size (int): Maximum number of cached filter combinations
+        """
+        self.ttl = ttl
+        self.fallback = fallback or ExactCountStrategy()
+        self.max_size = max_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _cache_key(filters):
+        return json.dumps(filters or {}, sort_keys=True, default=str)
+
+    def count(self, query, filters=None):
+        """
+        Return a cached count, computing it on a miss
+
+        A cached value may lag behind writes made by other workers until it
+        expires, so cache hits are reported as not exact.
+
+        Args:
+            query: Filtered article query
+            filters (dict): Filter criteria used to build the query
+
+        Returns:
+            tuple: (total count, whether the count is exact)
+        """
+        key = self._cache_key(filters)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry:
+                if entry[1] > now:
+                    self._cache.move_to_end(key)
+                    return entry[0], False
+                del self._cache[key]
+
+        total, exact = self.fallback.count(query, filters)
+
+        with self._lock:
+            self._cache[key] = (total, now + self.ttl)
+            self._cache.move_to_end(key)
+            # Filter values are client input: keep the least recently used out
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+        return total, exact
+
+    def invalidate(self):
+        """Drop every cached count"""
+        with self._lock:
+            self._cache.clear()
+
+
+class EstimatedCountStrategy:
+    """Use planner statistics for unfiltered totals"""
+
+    name = 'estimated'
+
+    def __init__(self, fallback=None, table_name='articles'):
+        """
+        Initialize the estimated count strategy
+
+        Args:
+            fallback: Strategy used for filtered queries or non-PostgreSQL databases
+            table_name (str): Table whose statistics are read
+        """
+        self.fallback = fallback or CachedCountStrategy()
+        self.table_name = table_name
+
+    def count(self, query, filters=None):
+        """
+        Estimate the unfiltered total from pg_class.reltuples
+
+        Filtered queries are delegated to the fallback strategy, as are
+        databases other than PostgreSQL.
+
+        Args:
+            query: Filtered article query
+            filters (dict): Filter criteria used to build the query
+
+        Returns:
+            tuple: (total count, whether the count is exact)
+        """
+        session = query.session
+        if filters or session.get_bind().dialect.name != 'postgresql':
+            return self.fallback.count(query, filters)
+
+        try:
+            estimate = self._estimate_rows(session)
+        except Exception as e:
+            logger.warning(f"Could not read planner estimate for {self.table_name}: {str(e)}")
+            estimate = None
+
+        if estimate is None:
+            return self.fallback.count(query, filters)
+
+        return estimate, False
+
+    def _estimate_rows(self, session):
+        """
+        Read the planner row estimate for the table
+
+        Args:
+            session: Session the counted query runs on
+
+        Returns:
+            int: Estimated row count, or None if unavailable
+        """
+        reltuples = session.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table"),
+            {'table': self.table_name}
+        ).scalar()
+
+        # reltuples is -1 (or 0 on older servers) until the table is analyzed
+        if reltuples is not None and reltuples > 0:
+            return int(reltuples)
+
+        plan = session.execute(
+            text(f"EXPLAIN (FORMAT JSON) SELECT 1 FROM {self.table_name}")
+        ).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        rows = plan[0]['Plan'].get('Plan Rows') if plan else None
+        return int(rows) if rows is not None else None
+
+    def invalidate(self):
+        """Invalidate the fallback cache"""
+        self.fallback.invalidate()
+
+
+def build_count_strategy(name, cache_ttl=30, cache_size=1000):
+    """
+    Build a count strategy by name
+
+    Args:
+        name (str): Strategy name (exact, cached, estimated)
+        cache_ttl (float): TTL for cached counts
+        cache_size (int): Maximum number of cached filter combinations
+
+    Returns:
+        Count strategy instance
+    """
+    if name == 'exact':
+        return ExactCountStrategy()
+    if name == 'cached':
+        return CachedCountStrategy(ttl=cache_ttl, max_size=cache_size)
+    if name == 'estimated':
+        return EstimatedCountStrategy(fallback=CachedCountStrategy(ttl=cache_ttl, max_size=cache_size))
+
+    logger.warning(f"Unknown count strategy '{name}', falling back to exact counts")
+    return ExactCountStrategy()
@@ -1,40 +1,171 @@
+import atexit
 import json
 import logging
+import threading
 from datetime import datetime
-from kafka import KafkaProducer
-from kafka.errors import KafkaError
 import time
+from app.utils.metrics import record_kafka_batch, update_kafka_producer_stats
 
 logger = logging.getLogger(__name__)
 
+# Compression codecs supported by the client (some need an optional library)
+COMPRESSION_CODECS = ('gzip', 'snappy', 'lz4', 'zstd')
+
+
+def codec_available(compression_type):
+    """
+    Check whether the library of a compression codec is installed
+
+    Args:
+        compression_type (str): Codec name
+
+    Returns:
+        bool: True if the client can use the codec
+    """
+    # kafka-python is imported on first use to keep application startup cheap
+    from kafka import codec
+
+    check = getattr(codec, f'has_{compression_type}', None)
+    return bool(check and check())
+
+
+def resolve_compression(compression_type):
+    """
+    Validate a compression codec, falling back to gzip if its library is missing
+
+    Args:
+        compression_type (str): gzip, snappy, lz4, zstd or none
+
+    Returns:
+        str: Codec to configure, or None for no compression
+    """
+    if not compression_type or compression_type == 'none':
+        return None
+
+    if compression_type not in COMPRESSION_CODECS:
+        logger.warning(f"Unknown Kafka compression type '{compression_type}', using gzip")
+        return 'gzip'
+    if not codec_available(compression_type):
+        logger.warning(f"Library for Kafka compression '{compression_type}' not installed, using gzip")
+        return 'gzip'
+    return compression_type
+
+
+def event_key(event):
+    """
+    Get the message key of an event: the article id
+
+    Keying by article keeps every event of an article on one partition, in order.
+
+    Args:
+        event (dict): Event envelope
+
+    Returns:
+        bytes: Encoded key, or None if the event has no article id
+    """
+    article_id = (event.get('data') or {}).get('id')
+    return None if article_id is None else str(article_id).encode('utf-8')
+
 
 class KafkaProducerService:
     """Service for publishing events to Kafka"""
 
-    def __init__(self, bootstrap_servers, topic):
+    def __init__(self, bootstrap_servers, topic, linger_ms=5, batch_size=65536,
+                 compression_type='gzip', max_in_flight=1, retry_delay=5.0):
         """
-        Initialize Kafka producer
+        Initialize Kafka producer settings
+
+        No connection is made here: call connect() or start() to connect in
+        the background. Until connected, publishing reports failure and
+        events stay in the outbox.
+
+        Messages are keyed by article id and batched per partition: the client
+        waits up to linger_ms to fill batches of up to batch_size bytes, which
+        are compressed as a whole.
 
         Args:
             bootstrap_servers (str): Kafka bootstrap servers
             topic (str): Kafka topic name
+            linger_ms (int): Milliseconds to wait for more messages before sending a batch
+            batch_size (int): Maximum batch size in bytes per partition
+            compression_type (str): gzip, snappy, lz4, zstd or none
+            max_in_flight (int): Unacknowledged requests per connection; values
+                above 1 may reorder events of an article when a send is retried
+            retry_delay (float): Seconds between background connection attempts
         """
+        self.bootstrap_servers = bootstrap_servers
         self.topic = topic
+        self.linger_ms = linger_ms
+        self.batch_size = batch_size
+        self.compression_type = compression_type
+        self.max_in_flight = max_in_flight
+        self.retry_delay = retry_delay
+
         self.producer = None
-        self.enabled = True
+        self.enabled = False
+        self._stop = threading.Event()
+        self._thread = None
+
+    def connect(self):
+        """
+        Create the Kafka client (blocks until the broker answers or times out)
+
+        Returns:
+            bool: True if the producer is connected
+        """
+        if self.producer:
+            return True
+
+        from kafka import KafkaProducer
+
+        compression_type = resolve_compression(self.compression_type)
 
         try:
             self.producer = KafkaProducer(
-                bootstrap_servers=bootstrap_servers.split(','),
+                bootstrap_servers=self.bootstrap_servers.split(','),
                 value_serializer=lambda v: json.dumps(v).encode('utf-8'),
                 acks='all',
                 retries=3,
-                max_in_flight_requests_per_connection=1
+                max_in_flight_requests_per_connection=self.max_in_flight,
+                linger_ms=self.linger_ms,
+                batch_size=self.batch_size,
+                compression_type=compression_type
+            )
+            self.enabled = True
+            logger.info(
+                f"Kafka producer initialized successfully for topic: {self.topic} "
+                f"(linger_ms={self.linger_ms}, batch_size={self.batch_size}, "
+                f"compression={compression_type or 'none'}, max_in_flight={self.max_in_flight})"
             )
-            logger.info(f"Kafka producer initialized successfully for topic: {topic}")
+            return True
         except Exception as e:
             logger.error(f"Failed to initialize Kafka producer: {str(e)}")
-            self.enabled = False
+            return False
+
+    def start(self):
+        """Connect in a background thread, retrying until the broker is reachable"""
+        self._thread = threading.Thread(target=self._run, name='kafka-producer-connect', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _run(self):
+        """Background loop retrying the connection"""
+        while not self._stop.is_set() and not self.connect():
+            self._stop.wait(self.retry_delay)
+
+    def is_connected(self):
+        """
+        Check whether the producer reaches the broker
+
+        Returns:
+            bool: True if connected to a bootstrap server
+        """
+        if not self.enabled or not self.producer:
+            return False
+        try:
+            return self.producer.bootstrap_connected()
+        except Exception:
+            return False
 
     def publish_event(self, event_type, article_data, max_retries=3):
         """
@@ -52,16 +183,14 @@ class KafkaProducerService:
             logger.warning("Kafka producer is disabled or not initialized")
             return False
 
-        event = {
-            'event_type': event_type,
-            'timestamp': datetime.utcnow().isoformat(),
-            'data': article_data
-        }
+        from kafka.errors import KafkaError
+
+        event = self.build_event(event_type, article_data)
 
         for attempt in range(max_retries):
             try:
                 # Send message
-                future = self.producer.send(self.topic, value=event)
+                future = self.producer.send(self.topic, key=event_key(event), value=event)
 
                 # Wait for message to be sent (with timeout)
                 record_metadata = future.get(timeout=10)
@@ -90,6 +219,95 @@ class KafkaProducerService:
 
         return False
 
+    def publish_events(self, event_type, articles_data, timeout=10):
+        """
+        Publish a batch of events with a single flush
+
+        Messages are handed to the producer without waiting on each one, then
+        flushed together so the batch costs one round of broker acks.
+
+        Args:
+            event_type (str): Type of event
+            articles_data (list): Article data dictionaries
+            timeout (float): Seconds to wait for the flush
+
+        Returns:
+            int: Number of events acknowledged by the broker
+        """
+        events = [self.build_event(event_type, article_data) for article_data in articles_data]
+        delivered = sum(self.send_events(events, timeout=timeout))
+
+        if delivered < len(events):
+            logger.error(f"Published {delivered}/{len(events)} {event_type} events")
+        else:
+            logger.info(f"Published {delivered} {event_type} events")
+
+        return delivered
+
+    def send_events(self, events, timeout=10):
+        """
+        Send prebuilt events and wait for them with a single flush
+
+        Args:
+            events (list): Event envelopes (see build_event)
+            timeout (float): Seconds to wait for the flush
+
+        Returns:
+            list: One bool per event, True if acknowledged by the broker
+        """
+        if not self.enabled or not self.producer:
+            logger.warning("Kafka producer is disabled or not initialized")
+            return [False] * len(events)
+
+        started = time.perf_counter()
+        futures = []
+        for event in events:
+            try:
+                futures.append(self.producer.send(self.topic, key=event_key(event), value=event))
+            except Exception as e:
+                logger.error(f"Error queueing {event.get('event_type')} event: {str(e)}")
+                futures.append(None)
+
+        try:
+            self.producer.flush(timeout=timeout)
+        except Exception as e:
+            logger.error(f"Error flushing events: {str(e)}")
+
+        delivered = [future is not None and future.succeeded() for future in futures]
+
+        record_kafka_batch(sum(delivered), time.perf_counter() - started)
+        self._update_stats()
+
+        return delivered
+
+    def _update_stats(self):
+        """Export the client's batching statistics to Prometheus"""
+        try:
+            stats = self.producer.metrics().get('producer-metrics', {})
+        except Exception as e:
+            logger.debug(f"Could not read Kafka producer metrics: {str(e)}")
+            return
+        update_kafka_producer_stats(stats)
+
+    @staticmethod
+    def build_event(event_type, article_data, timestamp=None):
+        """
+        Build the event envelope
+
+        Args:
+            event_type (str): Type of event
+            article_data (dict): Article data
+            timestamp (datetime): Event time (defaults to now)
+
+        Returns:
+            dict: Event
+        """
+        return {
+            'event_type': event_type,
+            'timestamp': (timestamp or datetime.utcnow()).isoformat(),
+            'data': article_data
+        }
+
     def publish_article_created(self, article_data):
         """Publish article.created event"""
         return self.publish_event('article.created', article_data)
@@ -107,7 +325,10 @@ class KafkaProducerService:
         return self.publish_event('article.published', article_data)
 
     def close(self):
-        """Close the Kafka producer"""
+        """Stop connecting and close the Kafka producer"""
+        self._stop.set()
         if self.producer:
+            self.enabled = False
             self.producer.close()
+            self.producer = None
             logger.info("Kafka producer closed")
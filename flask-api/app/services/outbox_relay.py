@@ -0,0 +1,238 @@
+import atexit
+import logging
+import threading
+from datetime import datetime
+from sqlalchemy import delete, func, select
+from app.models.article import db
+from app.models.outbox import OutboxEvent
+from app.utils.metrics import (
+    record_outbox_coalesced,
+    record_outbox_relay,
+    record_outbox_relay_error,
+    update_outbox_backlog
+)
+
+logger = logging.getLogger(__name__)
+
+# Key of the PostgreSQL advisory lock held while a relay drains the outbox
+OUTBOX_LOCK_KEY = 0x6f7574626f78
+
+# Event types carrying the full article state, which makes an earlier
+# article.updated for the same article redundant
+SUPERSEDING_EVENT_TYPES = {'article.updated', 'article.published', 'article.deleted'}
+
+
+def coalesce_events(rows):
+    """
+    Find outbox events superseded by a later event for the same article
+
+    An article.updated event is dropped when a later event in the batch for
+    the same article is an update, publish or delete: every event carries the
+    full article, so the consumer ends up in the same state.
+
+    Args:
+        rows (list): Outbox rows ordered by id
+
+    Returns:
+        set: IDs of the rows that do not need to be sent
+    """
+    superseded = set()
+    seen = set()
+    for row in reversed(rows):
+        if row.event_type == 'article.updated' and row.aggregate_id in seen:
+            superseded.add(row.id)
+        if row.event_type in SUPERSEDING_EVENT_TYPES:
+            seen.add(row.aggregate_id)
+    return superseded
+
+
+class OutboxRelay:
+    """
+    Background relay publishing outbox events to Kafka
+
+    Article changes write their events to the outbox table in the same
+    transaction, so no event is lost when the broker is down or the worker
+    dies after commit. The relay drains the table in id order, sends each
+    batch with a single flush and deletes the rows the broker acknowledged.
+    Delivery is at-least-once; the event timestamp is the outbox row's
+    created_at, so a resent event keeps the same event id for the consumer.
+    """
+
+    def __init__(self, kafka_producer, interval=1.0, batch_size=100, send_timeout=10):
+        """
+        Initialize the relay
+
+        Args:
+            kafka_producer (KafkaProducerService): Producer used to send events
+            interval (float): Seconds between polls of the outbox
+            batch_size (int): Maximum events sent per batch
+            send_timeout (float): Seconds to wait for a batch to be acknowledged
+        """
+        self.kafka_producer = kafka_producer
+        self.interval = interval
+        self.batch_size = batch_size
+        self.send_timeout = send_timeout
+
+        self.app = None
+        self._wakeup = threading.Event()
+        self._relay_lock = threading.Lock()
+        self._stopping = False
+        self._thread = None
+
+    def init_app(self, app):
+        """
+        Bind the relay to an application
+
+        Args:
+            app: Flask application
+        """
+        self.app = app
+
+    def start(self):
+        """Start the relay thread"""
+        self._thread = threading.Thread(target=self._run, name='outbox-relay', daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+        logger.info(f"Outbox relay started (interval={self.interval}s, batch_size={self.batch_size})")
+
+    def notify(self):
+        """Wake the relay up after events were committed"""
+        self._wakeup.set()
+
+    def relay(self):
+        """
+        Send one batch of outbox events
+
+        Returns:
+            int: Number of outbox rows removed (sent or coalesced)
+        """
+        with self._relay_lock:
+            with self.app.app_context():
+                with db.engine.begin() as connection:
+                    return self._relay_batch(connection)
+
+    def _relay_batch(self, connection):
+        """
+        Send one batch inside the given transaction
+
+        On PostgreSQL a transaction-scoped advisory lock keeps a single relay
+        draining the outbox across workers, which preserves event order.
+
+        Args:
+            connection: Connection with an open transaction
+
+        Returns:
+            int: Number of outbox rows removed
+        """
+        if connection.dialect.name == 'postgresql':
+            if not connection.scalar(select(func.pg_try_advisory_xact_lock(OUTBOX_LOCK_KEY))):
+                return 0
+
+        table = OutboxEvent.__table__
+        rows = connection.execute(
+            select(table).order_by(table.c.id).limit(self.batch_size)
+        ).all()
+        if not rows:
+            return 0
+
+        superseded = coalesce_events(rows)
+        outgoing = [row for row in rows if row.id not in superseded]
+        events = [
+            self.kafka_producer.build_event(row.event_type, row.payload, timestamp=row.created_at)
+            for row in outgoing
+        ]
+        delivered = dict(zip(
+            (row.id for row in outgoing),
+            self.kafka_producer.send_events(events, timeout=self.send_timeout)
+        ))
+
+        # Remove the acknowledged prefix; a failed event and everything after
+        # it stays in the outbox so per-article order is preserved
+        done = []
+        sent = {}
+        failed = {}
+        for row in rows:
+            if row.id in superseded:
+                done.append(row.id)
+            elif delivered[row.id]:
+                done.append(row.id)
+                sent[row.event_type] = sent.get(row.event_type, 0) + 1
+            else:
+                break
+        for row in outgoing:
+            if not delivered[row.id]:
+                failed[row.event_type] = failed.get(row.event_type, 0) + 1
+
+        if done:
+            connection.execute(delete(table).where(table.c.id.in_(done)))
+
+        for event_type, count in sent.items():
+            record_outbox_relay(event_type, success=True, count=count)
+        for event_type, count in failed.items():
+            record_outbox_relay(event_type, success=False, count=count)
+        coalesced = len(superseded.intersection(done))
+        if coalesced:
+            record_outbox_coalesced(coalesced)
+
+        if failed:
+            logger.error(f"Outbox relay: {sum(failed.values())} events not acknowledged, will retry")
+        logger.debug(f"Outbox relay: sent {sum(sent.values())} events, coalesced {coalesced}")
+
+        return len(done)
+
+    def update_backlog(self):
+        """
+        Refresh the outbox depth and age gauges
+
+        Returns:
+            int: Events waiting in the outbox
+        """
+        with self.app.app_context():
+            depth, oldest = db.session.execute(
+                select(func.count(OutboxEvent.id), func.min(OutboxEvent.created_at))
+            ).one()
+            db.session.remove()
+
+        age = (datetime.utcnow() - oldest).total_seconds() if oldest else 0
+        update_outbox_backlog(depth, max(age, 0))
+        return depth
+
+    def _run(self):
+        """Background loop draining the outbox on the interval or when notified"""
+        while not self._stopping:
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            if self._stopping:
+                break
+            self._drain()
+
+    def _drain(self):
+        """Relay full batches until the outbox is empty or a batch fails"""
+        try:
+            # Events wait in the outbox until the producer has connected
+            while not self._stopping and self.kafka_producer.enabled:
+                removed = self.relay()
+                if removed < self.batch_size:
+                    break
+            self.update_backlog()
+        except Exception as e:
+            logger.error(f"Outbox relay error: {str(e)}")
+            record_outbox_relay_error()
+            self._wakeup.wait(self.interval)
+
+    def stop(self):
+        """Stop the relay thread and try to send what is left"""
+        if self._stopping:
+            return
+
+        self._stopping = True
+        self._wakeup.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=self.interval + self.send_timeout)
+
+        try:
+            if self.kafka_producer.enabled:
+                self.relay()
+        except Exception as e:
+            logger.error(f"Error draining outbox on shutdown: {str(e)}")
+        logger.info("Outbox relay stopped")
@@ -0,0 +1,176 @@
+import atexit
+import logging
+import threading
+import time
+from flask import has_request_context, request
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import scoped_session, sessionmaker
+from app.models.article import Article, db
+from app.utils.metrics import record_read_routing, update_replica_status
+
+logger = logging.getLogger(__name__)
+
+# Cookie marking a client that wrote recently and must read from the primary
+READ_PRIMARY_COOKIE = 'read_primary_until'
+
+WRITE_METHODS = {'POST', 'PUT', 'PATCH', 'DELETE'}
+
+
+class ReplicaRouter:
+    """
+    Routes read-only queries to the DB2 replica while it is fresh enough
+
+    DB2 is filled by kafka-sync from the article events. Its lag is estimated
+    in the background by comparing the latest updated_at on both databases.
+    Reads use the primary when the replica is unreachable or lagging, and for
+    a short window after the same client wrote (read-your-writes), tracked
+    with a cookie set on successful write responses.
+    """
+
+    def __init__(self, replica_url, max_lag=5.0, check_interval=5.0, read_your_writes=10.0,
+                 engine_options=None):
+        """
+        Initialize the router
+
+        Args:
+            replica_url (str): Replica database URL
+            max_lag (float): Maximum replica lag in seconds for routing reads to it
+            check_interval (float): Seconds between lag checks
+            read_your_writes (float): Seconds a client reads from the primary after a write
+            engine_options (dict): Engine options for the replica pool
+        """
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.read_your_writes = read_your_writes
+
+        self.engine = create_engine(replica_url, **(engine_options or {}))
+        self.session = scoped_session(sessionmaker(bind=self.engine))
+
+        self.app = None
+        self._lag = None
+        self._stopping = False
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def init_app(self, app):
+        """
+        Bind the router to an application and register its request hooks
+
+        Args:
+            app: Flask application
+        """
+        self.app = app
+
+        @app.teardown_appcontext
+        def remove_replica_session(exception=None):
+            self.session.remove()
+
+        @app.after_request
+        def mark_recent_write(response):
+            if (request.method in WRITE_METHODS
+                    and request.path.startswith('/api/v1/')
+                    and 200 <= response.status_code < 300):
+                until = time.time() + self.read_your_writes
+                response.set_cookie(
+                    READ_PRIMARY_COOKIE,
+                    f'{until:.3f}',
+                    max_age=int(self.read_your_writes) + 1,
+                    httponly=True,
+                    samesite='Lax'
+                )
+            return response
+
+    def start(self):
+        """Start the background lag checks"""
+        self._thread = threading.Thread(target=self._run, name='replica-lag-check', daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+        logger.info(f"Replica read routing enabled (max lag {self.max_lag}s, "
+                    f"read-your-writes {self.read_your_writes}s)")
+
+    @property
+    def healthy(self):
+        """bool: True if the last lag check found the replica within max_lag"""
+        return self._lag is not None and self._lag <= self.max_lag
+
+    def read_session(self):
+        """
+        Choose the session for a read-only query
+
+        Returns:
+            Session: Replica session, or the primary session (db.session)
+        """
+        if has_request_context() and self._wrote_recently():
+            record_read_routing('primary', 'read_your_writes')
+            return db.session
+
+        if not self.healthy:
+            record_read_routing('primary', 'lag' if self._lag is not None else 'unavailable')
+            return db.session
+
+        record_read_routing('replica', 'fresh')
+        return self.session
+
+    def _wrote_recently(self):
+        """Check the read-your-writes cookie of the current request"""
+        value = request.cookies.get(READ_PRIMARY_COOKIE)
+        if not value:
+            return False
+        try:
+            return float(value) > time.time()
+        except ValueError:
+            return False
+
+    def check_lag(self):
+        """
+        Estimate the replica lag
+
+        The lag is the difference between the latest change on the primary
+        and the latest change replicated to DB2. It is conservative: right
+        after a write following an idle period it reports the idle time until
+        the replica catches up.
+
+        Returns:
+            float: Lag in seconds, or None if the replica is unreachable
+        """
+        latest_change = select(func.max(Article.updated_at))
+        try:
+            with self.app.app_context():
+                primary_latest = db.session.scalar(latest_change)
+                db.session.remove()
+            replica_latest = self.session.scalar(latest_change)
+        except Exception as e:
+            logger.warning(f"Replica lag check failed: {str(e)}")
+            self._lag = None
+            update_replica_status(None)
+            return None
+        finally:
+            self.session.remove()
+
+        if primary_latest is None or (replica_latest is not None and replica_latest >= primary_latest):
+            lag = 0.0
+        elif replica_latest is None:
+            lag = float('inf')
+        else:
+            lag = (primary_latest - replica_latest).total_seconds()
+
+        if self.healthy != (lag <= self.max_lag):
+            logger.info(f"Replica lag is {lag:.1f}s; reads go to the "
+                        f"{'replica' if lag <= self.max_lag else 'primary'}")
+        self._lag = lag
+        update_replica_status(lag)
+        return lag
+
+    def _run(self):
+        """Background loop checking the replica lag"""
+        while not self._stopping:
+            self.check_lag()
+            self._wakeup.wait(self.check_interval)
+
+    def stop(self):
+        """Stop the lag checks and close the replica pool"""
+        self._stopping = True
+        self._wakeup.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=5)
+        self.engine.dispose()
@@ -0,0 +1,84 @@
+import logging
+import threading
+import time
+from datetime import datetime
+from sqlalchemy import text
+from app.models.article import db
+
+logger = logging.getLogger(__name__)
+
+
+class ReadinessProbe:
+    """
+    Cached readiness checks of the database and Kafka for /ready
+
+    Results are kept for cache_ttl seconds so that frequent probes from the
+    orchestrator (one per container and per interval) cost at most one
+    SELECT 1 per worker and period.
+    """
+
+    def __init__(self, kafka_producer=None, kafka_required=True, cache_ttl=5.0):
+        """
+        Initialize the probe
+
+        Args:
+            kafka_producer (KafkaProducerService): Producer to check, None if Kafka is disabled
+            kafka_required (bool): Whether the API is unready while Kafka is
+                unreachable; not needed when events wait in the outbox
+            cache_ttl (float): Seconds a check result is reused
+        """
+        self.kafka_producer = kafka_producer
+        self.kafka_required = kafka_required
+        self.cache_ttl = cache_ttl
+
+        self._result = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def check(self):
+        """
+        Get the readiness of the API, running the checks when the cache expired
+
+        Returns:
+            dict: 'ready' flag and the result of each check
+        """
+        with self._lock:
+            if self._result is None or time.monotonic() >= self._expires_at:
+                self._result = self._run_checks()
+                self._expires_at = time.monotonic() + self.cache_ttl
+            return self._result
+
+    def _run_checks(self):
+        """Run the database and Kafka checks"""
+        checked_at = datetime.utcnow().isoformat()
+        checks = {
+            'database': self._check_database(),
+            'kafka': self._check_kafka()
+        }
+        ready = all(check['ready'] or not check['required'] for check in checks.values())
+
+        if not ready:
+            logger.warning(f"Not ready: {checks}")
+        return {'ready': ready, 'checked_at': checked_at, 'checks': checks}
+
+    def _check_database(self):
+        """Check that the primary database answers"""
+        try:
+            db.session.execute(text('SELECT 1'))
+            return {'ready': True, 'required': True}
+        except Exception as e:
+            return {'ready': False, 'required': True, 'error': str(e)}
+        finally:
+            db.session.remove()
+
+    def _check_kafka(self):
+        """Check that the producer is connected to the broker"""
+        if self.kafka_producer is None:
+            return {'ready': True, 'required': False, 'status': 'disabled'}
+
+        connected = self.kafka_producer.is_connected()
+        return {
+            'ready': connected,
+            'required': self.kafka_required,
+            'status': 'connected' if connected else 'connecting'
+        }
@@ -0,0 +1,396 @@
+import atexit
+import heapq
+import logging
+import threading
+from collections import defaultdict
+from datetime import datetime, timedelta
+from sqlalchemy import case, delete, func, select
+from app.models.article import Article, ArticleStatus, db
+from app.models.views import ArticleViewBucket, TrendingSnapshot
+from app.services.article_facets import UPSERT_INSERTS
+
+logger = logging.getLogger(__name__)
+
+# Key of the PostgreSQL advisory lock held while the rankings are refreshed
+TRENDING_LOCK_KEY = 0x7472656e64
+
+# Name of the stored rankings in trending_snapshots
+TRENDING_SNAPSHOT = 'trending'
+
+# Seconds per unit of a window name such as 24h or 7d
+WINDOW_UNITS = {'h': 3600, 'd': 86400}
+
+# Orders served by /articles/trending: decayed score or raw views in the window
+SORTS = ('trending', 'views')
+
+
+def parse_window(name):
+    """
+    Parse a window name
+
+    Args:
+        name (str): Number of hours or days, e.g. 24h or 7d
+
+    Returns:
+        int: Window length in seconds
+
+    Raises:
+        ValueError: If the name is not a positive number of hours or days
+    """
+    unit = WINDOW_UNITS.get(name[-1:])
+    if unit is None or not name[:-1].isdigit() or int(name[:-1]) <= 0:
+        raise ValueError(f"Invalid trending window: {name}")
+    return int(name[:-1]) * unit
+
+
+def bucket_start(moment, bucket_seconds):
+    """
+    Get the start of the view bucket containing a moment
+
+    Args:
+        moment (datetime): Naive UTC datetime
+        bucket_seconds (int): Bucket length
+
+    Returns:
+        datetime: Start of the bucket
+    """
+    epoch = datetime(1970, 1, 1)
+    seconds = int((moment - epoch).total_seconds())
+    return epoch + timedelta(seconds=seconds - seconds % bucket_seconds)
+
+
+def view_bucket_statement(batch, bucket_seconds, dialect_name, now=None):
+    """
+    Build the upsert adding view deltas to the current bucket
+
+    Args:
+        batch (dict): Mapping of article ID to view delta
+        bucket_seconds (int): Bucket length
+        dialect_name (str): Dialect of the connection
+        now (datetime): Time of the views, defaults to now
+
+    Returns:
+        Insert statement
+
+    Raises:
+        ValueError: If the dialect cannot upsert
+    """
+    if dialect_name not in UPSERT_INSERTS:
+        raise ValueError(f"View buckets not supported on '{dialect_name}'")
+
+    start = bucket_start(now or datetime.utcnow(), bucket_seconds)
+    table = ArticleViewBucket.__table__
+    stmt = UPSERT_INSERTS[dialect_name](table).values([
+        {'article_id': article_id, 'bucket_start': start, 'views': delta}
+        for article_id, delta in sorted(batch.items())
+    ])
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.article_id, table.c.bucket_start],
+        set_={'views': table.c.views + stmt.excluded.views}
+    )
+
+
+class TrendingRanking:
+    """
+    Precomputed top-K rankings of published articles behind /articles/trending
+
+    View deltas are added to per-article time buckets (article_view_buckets)
+    when the view counter flushes. A background refresh aggregates the buckets
+    of each window into two rankings, overall and per category, and keeps the
+    top K of each in memory, so requests only slice a list:
+
+    - trending: views weighted by age (half-life of a quarter of the window),
+      halved again for each window elapsed since the article was published;
+    - views: raw views during the window.
+
+    A single worker at a time computes the rankings (PostgreSQL advisory
+    lock), when the stored ones are older than the refresh interval, deletes
+    the buckets older than the longest window and stores the result in
+    trending_snapshots; the other workers load it. Requests never compute:
+    before the first rankings are available they get empty lists.
+    """
+
+    def __init__(self, windows=('24h', '7d'), top_k=50, refresh_interval=60, bucket_seconds=3600):
+        """
+        Initialize the ranking
+
+        Args:
+            windows (iterable): Window names (hours or days, e.g. 24h, 7d)
+            top_k (int): Articles kept per ranking
+            refresh_interval (float): Seconds between refreshes
+            bucket_seconds (int): Length of a view bucket
+
+        Raises:
+            ValueError: If a window name is invalid
+        """
+        self.windows = {name: parse_window(name) for name in windows}
+        self.top_k = top_k
+        self.refresh_interval = refresh_interval
+        self.bucket_seconds = bucket_seconds
+
+        self.app = None
+        self._snapshot = None
+        self._refresh_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread = None
+
+    def init_app(self, app):
+        """
+        Bind the ranking to an application
+
+        Args:
+            app: Flask application
+        """
+        self.app = app
+
+    def start(self):
+        """Start the refresh thread"""
+        self._thread = threading.Thread(target=self._run, name='trending-refresh', daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+        logger.info(f"Trending ranking started (windows={', '.join(self.windows)}, "
+                    f"top_k={self.top_k}, interval={self.refresh_interval}s)")
+
+    def get(self, window, category=None, sort='trending', limit=10):
+        """
+        Get the top articles of a ranking
+
+        Args:
+            window (str): Window name, one of the configured windows
+            category (str): Category, None for all categories
+            sort (str): trending or views
+            limit (int): Maximum number of articles (at most top_k)
+
+        Returns:
+            dict: Ranked articles and the time of the refresh they come from
+            (None and no articles before the first refresh)
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            return {'window': window, 'category': category, 'sort': sort, 'items': [], 'refreshed_at': None}
+
+        return {
+            'window': window,
+            'category': category,
+            'sort': sort,
+            'items': snapshot['rankings'].get(window, {}).get(sort, {}).get(category, [])[:limit],
+            'refreshed_at': snapshot['refreshed_at']
+        }
+
+    def refresh(self):
+        """
+        Bring the rankings up to date
+
+        Computes and stores them when this worker holds the refresh lock and
+        the stored rankings are older than the refresh interval, otherwise
+        loads the stored rankings when they changed.
+
+        Returns:
+            dict: Current snapshot, None if no rankings were computed yet
+        """
+        table = TrendingSnapshot.__table__
+
+        with self._refresh_lock:
+            now = datetime.utcnow()
+            with self.app.app_context():
+                with db.engine.begin() as connection:
+                    elected = True
+                    if connection.dialect.name == 'postgresql':
+                        elected = connection.scalar(select(func.pg_try_advisory_xact_lock(TRENDING_LOCK_KEY)))
+
+                    stored_at = connection.scalar(
+                        select(table.c.refreshed_at).where(table.c.name == TRENDING_SNAPSHOT)
+                    )
+                    if elected and (stored_at is None or (now - stored_at).total_seconds() >= self.refresh_interval):
+                        self._snapshot = self._compute(connection, now)
+                        stmt = UPSERT_INSERTS[connection.dialect.name](table).values(
+                            name=TRENDING_SNAPSHOT,
+                            refreshed_at=now,
+                            rankings=self._encode(self._snapshot['rankings'])
+                        )
+                        connection.execute(stmt.on_conflict_do_update(
+                            index_elements=[table.c.name],
+                            set_={'refreshed_at': stmt.excluded.refreshed_at, 'rankings': stmt.excluded.rankings}
+                        ))
+                    elif stored_at is not None and (self._snapshot is None
+                                                    or self._snapshot['refreshed_at'] != stored_at.isoformat()):
+                        rankings = connection.scalar(
+                            select(table.c.rankings).where(table.c.name == TRENDING_SNAPSHOT)
+                        )
+                        self._snapshot = {'refreshed_at': stored_at.isoformat(), 'rankings': self._decode(rankings)}
+
+            return self._snapshot
+
+    def _compute(self, connection, now):
+        """
+        Recompute every ranking from the view buckets, dropping expired buckets
+
+        Args:
+            connection: Connection on the primary database, holding the refresh lock
+            now (datetime): Reference time
+
+        Returns:
+            dict: New snapshot
+        """
+        oldest = bucket_start(now - timedelta(seconds=max(self.windows.values())), self.bucket_seconds)
+        connection.execute(delete(ArticleViewBucket).where(ArticleViewBucket.bucket_start < oldest))
+
+        rankings = {
+            name: self._rank_window(connection, seconds, now)
+            for name, seconds in self.windows.items()
+        }
+        articles = self._load_articles(connection, {
+            entry[1]
+            for by_sort in rankings.values()
+            for by_category in by_sort.values()
+            for entries in by_category.values()
+            for entry in entries
+        })
+
+        logger.debug(f"Trending rankings refreshed ({len(articles)} articles)")
+        return {
+            'refreshed_at': now.isoformat(),
+            'rankings': {
+                name: {
+                    sort: {
+                        category: [
+                            dict(articles[article_id], score=round(score, 4), window_views=views)
+                            for score, article_id, views in entries
+                            if article_id in articles
+                        ]
+                        for category, entries in by_category.items()
+                    }
+                    for sort, by_category in by_sort.items()
+                }
+                for name, by_sort in rankings.items()
+            }
+        }
+
+    @staticmethod
+    def _encode(rankings):
+        """Make rankings storable as JSON: the overall ranking's category key is None"""
+        return {
+            name: {sort: list(by_category.items()) for sort, by_category in by_sort.items()}
+            for name, by_sort in rankings.items()
+        }
+
+    @staticmethod
+    def _decode(stored):
+        """Rebuild rankings stored by _encode"""
+        return {
+            name: {sort: {category: entries for category, entries in pairs} for sort, pairs in by_sort.items()}
+            for name, by_sort in stored.items()
+        }
+
+    def _rank_window(self, connection, window_seconds, now):
+        """
+        Rank the published articles viewed during a window
+
+        Args:
+            connection: Connection on the primary database
+            window_seconds (int): Window length
+            now (datetime): Reference time
+
+        Returns:
+            dict: Per sort, per category (None for all) list of
+            (score, article ID, window views), best first
+        """
+        window_start = bucket_start(now - timedelta(seconds=window_seconds), self.bucket_seconds)
+        half_life = window_seconds / 4
+
+        # One weight per bucket, from the age of the bucket's middle
+        weights = {}
+        start = window_start
+        while start <= now:
+            age = max((now - start).total_seconds() - self.bucket_seconds / 2, 0)
+            weights[start] = 0.5 ** (age / half_life)
+            start += timedelta(seconds=self.bucket_seconds)
+
+        buckets = ArticleViewBucket.__table__
+        rows = connection.execute(
+            select(
+                Article.id,
+                Article.category,
+                Article.published_at,
+                func.sum(buckets.c.views * case(weights, value=buckets.c.bucket_start, else_=0.0)),
+                func.sum(buckets.c.views)
+            )
+            .select_from(buckets.join(Article.__table__, Article.id == buckets.c.article_id))
+            .where(buckets.c.bucket_start >= window_start, Article.status == ArticleStatus.published)
+            .group_by(Article.id, Article.category, Article.published_at)
+        ).all()
+
+        scored = defaultdict(list)
+        for article_id, category, published_at, decayed, views in rows:
+            published_age = (now - published_at).total_seconds() if published_at else 0
+            score = float(decayed or 0) * 0.5 ** (max(published_age, 0) / window_seconds)
+            entry = (score, article_id, int(views))
+            scored[None].append(entry)
+            if category is not None:
+                scored[category].append(entry)
+
+        return {
+            'trending': {
+                category: heapq.nlargest(self.top_k, entries, key=lambda entry: (entry[0], entry[1]))
+                for category, entries in scored.items()
+            },
+            'views': {
+                category: heapq.nlargest(self.top_k, entries, key=lambda entry: (entry[2], entry[1]))
+                for category, entries in scored.items()
+            }
+        }
+
+    @staticmethod
+    def _load_articles(connection, article_ids):
+        """
+        Load the fields served for the ranked articles
+
+        Args:
+            connection: Connection on the primary database
+            article_ids (set): IDs of the ranked articles
+
+        Returns:
+            dict: Article dictionaries by ID
+        """
+        if not article_ids:
+            return {}
+
+        rows = connection.execute(
+            select(
+                Article.id, Article.title, Article.author, Article.category, Article.tags,
+                Article.excerpt.label('excerpt'), Article.views_count, Article.published_at
+            ).where(Article.id.in_(article_ids))
+        ).all()
+
+        return {
+            row.id: {
+                'id': row.id,
+                'title': row.title,
+                'author': row.author,
+                'category': row.category,
+                'tags': row.tags or [],
+                'excerpt': row.excerpt,
+                'views_count': row.views_count,
+                'published_at': row.published_at.isoformat() if row.published_at else None
+            }
+            for row in rows
+        }
+
+    def _run(self):
+        """Background loop refreshing on the interval"""
+        while not self._stopping:
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"Error refreshing trending rankings: {str(e)}")
+
+            self._wakeup.wait(self.refresh_interval)
+            self._wakeup.clear()
+
+    def stop(self):
+        """Stop the refresh thread"""
+        self._stopping = True
+        self._wakeup.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=5)
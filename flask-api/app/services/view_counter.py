@@ -0,0 +1,207 @@
+import atexit
+import logging
+import threading
+from collections import defaultdict
+from sqlalchemy import case, func, update
+from app.models.article import Article, db
+from app.services.trending import view_bucket_statement
+from app.utils.metrics import (
+    record_view_flush,
+    record_views_dropped,
+    update_pending_views
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCounter:
+    """
+    Write-behind accumulator for article view counts
+
+    Views are aggregated in memory per worker and written in batches with a
+    single UPDATE ... SET views_count = views_count + delta statement, so
+    reading an article no longer opens a write transaction. The same
+    transaction adds the deltas to the time buckets of the trending ranking.
+    """
+
+    def __init__(self, flush_interval=5.0, flush_threshold=500, max_pending=10000, bucket_seconds=None):
+        """
+        Initialize the view counter
+
+        Args:
+            flush_interval (float): Seconds between background flushes
+            flush_threshold (int): Pending views that trigger an early flush
+            max_pending (int): Maximum number of distinct articles held in memory
+            bucket_seconds (int): Length of the view buckets, None to not record them
+        """
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self.max_pending = max_pending
+        self.bucket_seconds = bucket_seconds
+
+        self.app = None
+        self._pending = defaultdict(int)
+        self._pending_total = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread = None
+
+    def init_app(self, app):
+        """
+        Bind the counter to an application
+
+        Args:
+            app: Flask application
+        """
+        self.app = app
+
+    def start(self):
+        """Start the flush thread"""
+        self._thread = threading.Thread(target=self._run, name='view-counter-flush', daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+        logger.info(
+            f"View counter started (interval={self.flush_interval}s, "
+            f"threshold={self.flush_threshold}, max_pending={self.max_pending})"
+        )
+
+    def record(self, article_id, count=1):
+        """
+        Record views for an article
+
+        Args:
+            article_id (int): Article ID
+            count (int): Number of views
+
+        Returns:
+            bool: True if recorded, False if dropped because the buffer is full
+        """
+        with self._lock:
+            if article_id not in self._pending and len(self._pending) >= self.max_pending:
+                self._wakeup.set()
+                record_views_dropped(count)
+                return False
+
+            self._pending[article_id] += count
+            self._pending_total += count
+            pending_total = self._pending_total
+
+        update_pending_views(pending_total)
+
+        if pending_total >= self.flush_threshold:
+            self._wakeup.set()
+
+        return True
+
+    def pending(self, article_id):
+        """
+        Get the number of views not yet written for an article
+
+        Args:
+            article_id (int): Article ID
+
+        Returns:
+            int: Pending views
+        """
+        with self._lock:
+            return self._pending.get(article_id, 0)
+
+    def flush(self):
+        """
+        Write all pending view deltas in one UPDATE
+
+        Returns:
+            int: Number of views written
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                batch = dict(self._pending)
+                self._pending.clear()
+                self._pending_total = 0
+
+            update_pending_views(0)
+            total = sum(batch.values())
+
+            try:
+                self._write_batch(batch)
+                record_view_flush(total, success=True)
+                logger.debug(f"Flushed {total} views for {len(batch)} articles")
+                return total
+            except Exception as e:
+                logger.error(f"Error flushing view counts: {str(e)}")
+                record_view_flush(total, success=False)
+                self._requeue(batch)
+                return 0
+
+    def _write_batch(self, batch):
+        """
+        Apply a batch of view deltas
+
+        Args:
+            batch (dict): Mapping of article ID to view delta
+        """
+        table = Article.__table__
+        stmt = (
+            update(table)
+            .where(table.c.id.in_(list(batch)))
+            .values(
+                views_count=func.coalesce(table.c.views_count, 0) + case(batch, value=table.c.id),
+                # Views are not edits; keep the onupdate hook from touching updated_at
+                updated_at=table.c.updated_at
+            )
+        )
+
+        with self.app.app_context():
+            with db.engine.begin() as connection:
+                connection.execute(stmt)
+                if self.bucket_seconds:
+                    connection.execute(
+                        view_bucket_statement(batch, self.bucket_seconds, connection.dialect.name)
+                    )
+
+    def _requeue(self, batch):
+        """
+        Put a failed batch back, respecting the memory bound
+
+        Args:
+            batch (dict): Mapping of article ID to view delta
+        """
+        dropped = 0
+        with self._lock:
+            for article_id, delta in batch.items():
+                if article_id not in self._pending and len(self._pending) >= self.max_pending:
+                    dropped += delta
+                    continue
+                self._pending[article_id] += delta
+                self._pending_total += delta
+            pending_total = self._pending_total
+
+        update_pending_views(pending_total)
+        if dropped:
+            record_views_dropped(dropped)
+
+    def _run(self):
+        """Background loop flushing on the interval or when woken up"""
+        while not self._stopping:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            if self._stopping:
+                break
+            self.flush()
+
+    def stop(self):
+        """Stop the background thread and flush what is left"""
+        if self._stopping:
+            return
+
+        self._stopping = True
+        self._wakeup.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=self.flush_interval)
+
+        self.flush()
+        logger.info("View counter stopped")
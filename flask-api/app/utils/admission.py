@@ -0,0 +1,390 @@
+import fcntl
+import hashlib
+import ipaddress
+import logging
+import math
+import mmap
+import os
+import socket
+import struct
+import threading
+import time
+from flask import g, jsonify, request
+from app.utils.db_instrumentation import current_pool_wait
+from app.utils.metrics import record_admission, update_requests_in_flight
+
+logger = logging.getLogger(__name__)
+
+# Endpoints never shed nor throttled: probes and scrapes must keep working under load
+HEALTH_ENDPOINTS = {'articles.health_check', 'articles.readiness_check', 'metrics', 'index'}
+
+WRITE_METHODS = {'POST', 'PUT', 'PATCH', 'DELETE'}
+
+# Bucket slot: client key hash, tokens left, last refill (epoch seconds)
+_SLOT = struct.Struct('<Qdd')
+
+
+class SharedTokenBuckets:
+    """
+    Per-client token buckets shared by the workers of one host
+
+    The buckets live in a memory-mapped file: every gunicorn worker maps the
+    same file, so a client's rate is enforced across workers instead of per
+    worker. Slots are addressed by a hash of the client key with linear
+    probing; when the probed slots are all taken, the least recently used
+    one is recycled (its client starts over with a full bucket).
+    """
+
+    # Slots probed for a key before recycling one
+    PROBES = 8
+
+    def __init__(self, path, rate, burst, slots=4096):
+        """
+        Initialize the buckets
+
+        Args:
+            path (str): File holding the buckets, created if missing
+            rate (float): Tokens added per second to each bucket
+            burst (float): Bucket capacity
+            slots (int): Number of client slots
+        """
+        self.path = path
+        self.rate = rate
+        self.burst = burst
+        self.slots = slots
+
+        size = _SLOT.size * slots
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        if os.fstat(self._fd).st_size < size:
+            os.ftruncate(self._fd, size)
+        self._map = mmap.mmap(self._fd, size)
+
+        # fcntl record locks exclude other processes, not other threads
+        self._lock = threading.Lock()
+
+    def take(self, client, cost=1.0):
+        """
+        Take tokens from a client's bucket
+
+        Args:
+            client (str): Client key
+            cost (float): Tokens the request costs
+
+        Returns:
+            tuple: (allowed, seconds until enough tokens are available)
+        """
+        key = int.from_bytes(hashlib.blake2b(client.encode('utf-8'), digest_size=8).digest(), 'little') or 1
+        now = time.time()
+
+        with self._lock:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX)
+            try:
+                offset, tokens, updated_at = self._find_slot(key, now)
+                tokens = min(self.burst, tokens + max(0.0, now - updated_at) * self.rate)
+
+                allowed = tokens >= cost
+                if allowed:
+                    tokens -= cost
+                _SLOT.pack_into(self._map, offset, key, tokens, now)
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN)
+
+        if allowed:
+            return True, 0.0
+        return False, (cost - tokens) / self.rate
+
+    def _find_slot(self, key, now):
+        """
+        Find the slot of a key, claiming a free or the least recently used one
+
+        Args:
+            key (int): Hash of the client key
+            now (float): Current epoch time
+
+        Returns:
+            tuple: (slot offset, tokens, last refill time)
+        """
+        # A bucket idle this long is full again: its slot can be reused
+        idle_after = self.burst / self.rate
+        start = key % self.slots
+        oldest = None
+
+        for probe in range(self.PROBES):
+            offset = ((start + probe) % self.slots) * _SLOT.size
+            slot_key, tokens, updated_at = _SLOT.unpack_from(self._map, offset)
+            if slot_key == key:
+                return offset, tokens, updated_at
+            if slot_key == 0 or now - updated_at >= idle_after:
+                return offset, self.burst, now
+            if oldest is None or updated_at < oldest[1]:
+                oldest = (offset, updated_at)
+
+        return oldest[0], self.burst, now
+
+    def close(self):
+        """Unmap and close the bucket file"""
+        self._map.close()
+        os.close(self._fd)
+
+
+class TrustedProxies:
+    """
+    Proxies whose X-Forwarded-For header is believed
+
+    Entries are IP addresses, networks (CIDR) or host names. Host names,
+    such as the graphql-gateway service of docker-compose, are resolved
+    lazily and again every refresh_interval seconds: a recreated container
+    gets a new address, and the gateway starts after this API.
+    """
+
+    def __init__(self, entries, refresh_interval=60):
+        """
+        Initialize the proxies
+
+        Args:
+            entries (list): IP addresses, networks or host names
+            refresh_interval (float): Seconds between host name resolutions
+        """
+        self.refresh_interval = refresh_interval
+        self.networks = []
+        self.hostnames = []
+        for entry in entries:
+            try:
+                self.networks.append(ipaddress.ip_network(entry, strict=False))
+            except ValueError:
+                self.hostnames.append(entry)
+
+        self._resolved = set()
+        self._resolved_at = None
+        self._lock = threading.Lock()
+
+    def __bool__(self):
+        return bool(self.networks or self.hostnames)
+
+    def __contains__(self, address):
+        try:
+            ip = ipaddress.ip_address(address)
+        except (TypeError, ValueError):
+            return False
+
+        if any(ip in network for network in self.networks):
+            return True
+        return bool(self.hostnames) and ip in self._resolve()
+
+    def _resolve(self):
+        """Get the addresses of the host names, resolving them when stale"""
+        with self._lock:
+            now = time.monotonic()
+            if self._resolved_at is None or now - self._resolved_at >= self.refresh_interval:
+                resolved = set()
+                for hostname in self.hostnames:
+                    try:
+                        resolved.update(
+                            ipaddress.ip_address(info[4][0].split('%')[0])
+                            for info in socket.getaddrinfo(hostname, None)
+                        )
+                    except (OSError, ValueError) as e:
+                        logger.warning(f"Cannot resolve trusted proxy {hostname}: {str(e)}")
+                self._resolved = resolved
+                self._resolved_at = now
+            return self._resolved
+
+
+def client_identity(remote_addr, forwarded_for, trusted_proxies):
+    """
+    Get the client key of a request for the per-client rate limit
+
+    X-Forwarded-For is only believed when the peer is a trusted proxy. It is
+    read from the right, skipping trusted proxies, so that a client cannot
+    pick its key by sending the header itself.
+
+    Args:
+        remote_addr (str): Address of the peer
+        forwarded_for (str): X-Forwarded-For header, None if absent
+        trusted_proxies (TrustedProxies): Proxies whose header is believed
+
+    Returns:
+        str: Client key, or None for a trusted proxy that did not forward
+        a client (its requests are not rate limited per client)
+    """
+    if not trusted_proxies or remote_addr not in trusted_proxies:
+        return remote_addr
+
+    hops = [hop.strip() for hop in (forwarded_for or '').split(',') if hop.strip()]
+    for hop in reversed(hops):
+        if hop not in trusted_proxies:
+            return hop
+    return None
+
+
+class AdmissionController:
+    """
+    Admission control and load shedding for the Flask API
+
+    Requests are classified as health (probes, metrics: always admitted),
+    write or read. A request is shed with 503 and Retry-After when the
+    worker's database pool is saturated, measured by how long checkouts
+    wait for a connection, or when too many requests are in flight. Writes
+    have higher thresholds than reads, so reads are shed first and writes
+    keep going while the pool drains. Independently, each client has a token
+    bucket shared across workers; empty buckets get 429 and Retry-After.
+
+    Shedding needs several requests in flight per worker: gthread workers
+    (GUNICORN_THREADS > 1) or ASGI mode, where Flask runs in a thread pool.
+    A sync worker serves one request at a time and queues the others in the
+    listen backlog, so only the per-client rate limit applies there.
+    """
+
+    def __init__(self, limits, buckets=None, trusted_proxies=None):
+        """
+        Initialize the controller
+
+        Args:
+            limits (dict): Per class ('read', 'write') dict with 'max_wait'
+                (seconds of pool checkout wait), 'max_in_flight' (requests
+                per worker) and 'retry_after' (seconds)
+            buckets (SharedTokenBuckets): Per-client rate limit, None to disable
+            trusted_proxies (TrustedProxies): Proxies whose X-Forwarded-For
+                header gives the client, None to key clients on the peer address
+        """
+        self.limits = limits
+        self.buckets = buckets
+        self.trusted_proxies = trusted_proxies
+
+        self._in_flight = {'health': 0, 'read': 0, 'write': 0}
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        """
+        Register the admission hooks
+
+        Args:
+            app: Flask application
+        """
+        # Registered first: nothing else runs for a rejected request
+        app.before_request_funcs.setdefault(None, []).insert(0, self._before_request)
+        app.teardown_request(self._teardown_request)
+
+    @staticmethod
+    def classify(method, endpoint):
+        """
+        Get the endpoint class of a request
+
+        Args:
+            method (str): HTTP method
+            endpoint (str): Flask endpoint
+
+        Returns:
+            str: health, read or write
+        """
+        if endpoint in HEALTH_ENDPOINTS or method == 'OPTIONS':
+            return 'health'
+        return 'write' if method in WRITE_METHODS else 'read'
+
+    def decide(self, endpoint_class, client):
+        """
+        Decide whether to admit a request
+
+        Args:
+            endpoint_class (str): health, read or write
+            client (str): Client key for the rate limit
+
+        Returns:
+            tuple: (decision, reason, retry_after) with decision admitted,
+            shed or throttled
+        """
+        if endpoint_class == 'health':
+            return 'admitted', 'exempt', 0
+
+        limits = self.limits[endpoint_class]
+        if current_pool_wait() > limits['max_wait']:
+            return 'shed', 'pool_wait', limits['retry_after']
+
+        with self._lock:
+            in_flight = sum(self._in_flight.values())
+        if in_flight >= limits['max_in_flight']:
+            return 'shed', 'in_flight', limits['retry_after']
+
+        if self.buckets and client:
+            allowed, wait = self.buckets.take(client)
+            if not allowed:
+                return 'throttled', 'client_rate', max(1, math.ceil(wait))
+
+        return 'admitted', 'ok', 0
+
+    def _before_request(self):
+        endpoint_class = self.classify(request.method, request.endpoint)
+        client = client_identity(request.remote_addr, request.headers.get('X-Forwarded-For'),
+                                 self.trusted_proxies)
+        decision, reason, retry_after = self.decide(endpoint_class, client)
+        record_admission(endpoint_class, decision, reason)
+
+        if decision == 'admitted':
+            self._track(endpoint_class, 1)
+            g.admission_class = endpoint_class
+            return None
+
+        if decision == 'shed':
+            logger.warning(f"Shedding {request.method} {request.path} ({reason})")
+            response = jsonify({'error': 'Service overloaded, please retry later'})
+            response.status_code = 503
+        else:
+            response = jsonify({'error': 'Too many requests'})
+            response.status_code = 429
+        response.headers['Retry-After'] = str(retry_after)
+        return response
+
+    def _teardown_request(self, exc):
+        endpoint_class = g.pop('admission_class', None)
+        if endpoint_class:
+            self._track(endpoint_class, -1)
+
+    def _track(self, endpoint_class, delta):
+        """Update the in-flight count of a class"""
+        with self._lock:
+            self._in_flight[endpoint_class] += delta
+            count = self._in_flight[endpoint_class]
+        update_requests_in_flight(endpoint_class, count)
+
+
+def init_admission_control(app):
+    """
+    Enable admission control from the application config
+
+    Args:
+        app: Flask application
+
+    Returns:
+        AdmissionController: Registered controller
+    """
+    config = app.config
+
+    buckets = None
+    if config['ADMISSION_CLIENT_RATE'] > 0:
+        buckets = SharedTokenBuckets(
+            config['ADMISSION_STATE_FILE'],
+            rate=config['ADMISSION_CLIENT_RATE'],
+            burst=config['ADMISSION_CLIENT_BURST'],
+            slots=config['ADMISSION_CLIENT_SLOTS']
+        )
+
+    controller = AdmissionController({
+        'read': {
+            'max_wait': config['ADMISSION_READ_MAX_POOL_WAIT_MS'] / 1000,
+            'max_in_flight': config['ADMISSION_READ_MAX_IN_FLIGHT'],
+            'retry_after': config['ADMISSION_READ_RETRY_AFTER']
+        },
+        'write': {
+            'max_wait': config['ADMISSION_WRITE_MAX_POOL_WAIT_MS'] / 1000,
+            'max_in_flight': config['ADMISSION_WRITE_MAX_IN_FLIGHT'],
+            'retry_after': config['ADMISSION_WRITE_RETRY_AFTER']
+        }
+    }, buckets, TrustedProxies(config['ADMISSION_TRUSTED_PROXIES']))
+    controller.init_app(app)
+    app.admission_controller = controller
+
+    logger.info(f"Admission control enabled (read/write pool wait "
+                f"{config['ADMISSION_READ_MAX_POOL_WAIT_MS']:.0f}/{config['ADMISSION_WRITE_MAX_POOL_WAIT_MS']:.0f} ms, "
+                f"client rate {config['ADMISSION_CLIENT_RATE']}/s)")
+    return controller
@@ -0,0 +1,228 @@
+import gzip
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from flask import request
+from app.utils.metrics import record_response_compression
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Endpoints whose compressed bodies are cached
+CACHED_ENDPOINTS = {'articles.get_article'}
+
+
+def available_encodings():
+    """
+    List supported content codings, preferred first
+
+    Returns:
+        list: Content coding names
+    """
+    return ['br', 'gzip'] if brotli is not None else ['gzip']
+
+
+def compress(body, encoding, level=6):
+    """
+    Compress a response body
+
+    Args:
+        body (bytes): Uncompressed body
+        encoding (str): Content coding (br or gzip)
+        level (int): Compression level (gzip scale, 1-9)
+
+    Returns:
+        bytes: Compressed body
+    """
+    if encoding == 'br':
+        return brotli.compress(body, quality=min(level, 11))
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+class CompressedBodyCache:
+    """
+    Bounded LRU of compressed bodies keyed by a digest of the uncompressed body
+
+    The key is the body itself rather than its ETag: article ETags do not
+    cover views_count, so bodies sharing an ETag may still differ.
+    """
+
+    def __init__(self, max_entries=512):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries (int): Maximum number of cached bodies
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(body, encoding):
+        """
+        Build the cache key of a body
+
+        Args:
+            body (bytes): Uncompressed body
+            encoding (str): Content coding
+
+        Returns:
+            tuple: (body digest, content coding)
+        """
+        return hashlib.blake2b(body, digest_size=16).digest(), encoding
+
+    def get(self, key):
+        """
+        Get a cached compressed body
+
+        Args:
+            key (tuple): Key from CompressedBodyCache.key
+
+        Returns:
+            bytes: Compressed body, or None on a miss
+        """
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+            return body
+
+    def set(self, key, body):
+        """
+        Cache a compressed body
+
+        Args:
+            key (tuple): Key from CompressedBodyCache.key
+            body (bytes): Compressed body
+        """
+        with self._lock:
+            self._entries[key] = body
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class ResponseCompressor:
+    """Content negotiation and compression shared by the WSGI and ASGI apps"""
+
+    def __init__(self, min_size=1024, level=6, cache_max_entries=512):
+        """
+        Initialize the compressor
+
+        Args:
+            min_size (int): Smallest body worth compressing, in bytes
+            level (int): Compression level (gzip scale, 1-9)
+            cache_max_entries (int): Compressed bodies kept per worker
+        """
+        self.min_size = min_size
+        self.level = level
+        self.body_cache = CompressedBodyCache(cache_max_entries)
+
+    @staticmethod
+    def negotiate(accept_encodings):
+        """
+        Pick the content coding for a request
+
+        Args:
+            accept_encodings: Parsed Accept-Encoding header (werkzeug Accept)
+
+        Returns:
+            str: Content coding, or None to send the body uncompressed
+        """
+        return accept_encodings.best_match(available_encodings())
+
+    def compress(self, body, encoding, cacheable=False):
+        """
+        Compress a body, reusing the cached result of an identical body
+
+        Args:
+            body (bytes): Uncompressed body
+            encoding (str): Content coding
+            cacheable (bool): Whether the compressed body may be cached
+
+        Returns:
+            bytes: Compressed body, or None if the body is too small
+        """
+        if len(body) < self.min_size:
+            return None
+
+        key = self.body_cache.key(body, encoding) if cacheable else None
+        compressed = self.body_cache.get(key) if cacheable else None
+        cached = compressed is not None
+        if compressed is None:
+            compressed = compress(body, encoding, self.level)
+            if cacheable:
+                self.body_cache.set(key, compressed)
+
+        record_response_compression(encoding, cached)
+        return compressed
+
+
+def build_compressor(config):
+    """
+    Build the response compressor from the application config
+
+    Args:
+        config (dict): Application config
+
+    Returns:
+        ResponseCompressor: Configured compressor
+    """
+    return ResponseCompressor(
+        min_size=config.get('COMPRESSION_MIN_SIZE', 1024),
+        level=config.get('COMPRESSION_LEVEL', 6),
+        cache_max_entries=config.get('COMPRESSION_CACHE_MAX_ENTRIES', 512)
+    )
+
+
+def init_compression(app):
+    """
+    Register negotiated gzip/brotli compression for /api/v1 responses
+
+    Args:
+        app: Flask application
+    """
+    compressor = build_compressor(app.config)
+
+    @app.after_request
+    def compress_response(response):
+        if not request.path.startswith('/api/v1/'):
+            return response
+
+        if (response.status_code != 200
+                or response.direct_passthrough
+                or 'Content-Encoding' in response.headers
+                or response.mimetype != 'application/json'):
+            return response
+
+        response.vary.add('Accept-Encoding')
+
+        encoding = compressor.negotiate(request.accept_encodings)
+        if not encoding:
+            return response
+
+        etag, weak = response.get_etag()
+        compressed = compressor.compress(
+            response.get_data(),
+            encoding,
+            cacheable=request.endpoint in CACHED_ENDPOINTS
+        )
+        if compressed is None:
+            return response
+
+        response.set_data(compressed)
+        response.headers['Content-Encoding'] = encoding
+        if etag is not None:
+            # The ETag identifies one encoded representation
+            response.set_etag(f'{etag}-{encoding}', weak=weak)
+
+        return response
+
+    logger.info(f"Response compression enabled ({', '.join(available_encodings())}, "
+                f"min size {compressor.min_size} bytes)")
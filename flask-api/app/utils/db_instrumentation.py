@@ -0,0 +1,244 @@
+import hashlib
+import logging
+import re
+import threading
+import time
+import weakref
+from collections import Counter
+from functools import lru_cache
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.pool import QueuePool
+from app.utils.metrics import (
+    record_db_pool_checkout_wait,
+    record_db_query,
+    record_db_query_duration,
+    record_db_slow_query,
+    record_n_plus_one,
+    record_request_queries
+)
+
+logger = logging.getLogger(__name__)
+
+# Distinct fingerprints exported as metric labels; later ones are reported as 'other'
+MAX_FINGERPRINTS = 500
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PLACEHOLDER = re.compile(r'%\(\w+\)s|%s|\?|:\w+|\$\d+')
+_VALUE_LIST = re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)')
+_VALUES_ROWS = re.compile(r'(VALUES\s*\(\?\))(?:\s*,\s*\(\?\))+', re.IGNORECASE)
+_WHITESPACE = re.compile(r'\s+')
+_TABLE = re.compile(r'\b(?:FROM|INTO|UPDATE|JOIN)\s+"?(\w+)"?', re.IGNORECASE)
+
+_fingerprints = set()
+_instrumented_engines = weakref.WeakSet()
+_instrumented_pools = weakref.WeakSet()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool measuring how long checkouts wait for a free connection
+
+    Set as the engine's poolclass. Besides the wait histogram it exposes the
+    current wait (age of the oldest pending checkout, or a decaying average of
+    recent waits), which the admission controller compares to its thresholds.
+    The average also decays with time, so that it recovers while shed
+    requests make no checkouts.
+    """
+
+    # Weight of the latest checkout in the average wait
+    EWMA_ALPHA = 0.2
+
+    # Seconds without checkouts halving the average wait
+    DECAY_HALF_LIFE = 1.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.average_wait = 0.0
+        self.average_at = time.perf_counter()
+        self._waiting = {}
+        self._waiting_lock = threading.Lock()
+        _instrumented_pools.add(self)
+
+    def _do_get(self):
+        token = object()
+        started = time.perf_counter()
+        with self._waiting_lock:
+            self._waiting[token] = started
+        try:
+            return super()._do_get()
+        finally:
+            now = time.perf_counter()
+            waited = now - started
+            with self._waiting_lock:
+                del self._waiting[token]
+                average = self._decayed_average(now)
+                self.average_wait = average + self.EWMA_ALPHA * (waited - average)
+                self.average_at = now
+            record_db_pool_checkout_wait(waited)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.average_wait = self.average_wait
+        pool.average_at = self.average_at
+        return pool
+
+    def _decayed_average(self, now):
+        """Average wait decayed by the time elapsed since the last checkout"""
+        return self.average_wait * 0.5 ** ((now - self.average_at) / self.DECAY_HALF_LIFE)
+
+    def current_wait(self):
+        """
+        Estimate how long a checkout waits right now
+
+        Returns:
+            float: Seconds; the oldest pending checkout when some are
+            blocked, else the average of recent waits
+        """
+        now = time.perf_counter()
+        with self._waiting_lock:
+            oldest = min(self._waiting.values(), default=None)
+            average = self._decayed_average(now)
+        if oldest is not None:
+            return max(now - oldest, average)
+        return average
+
+
+def current_pool_wait():
+    """
+    Get the largest current checkout wait over the instrumented pools
+
+    Returns:
+        float: Seconds
+    """
+    return max((pool.current_wait() for pool in list(_instrumented_pools)), default=0.0)
+
+
+@lru_cache(maxsize=2048)
+def normalize_statement(statement):
+    """
+    Normalize a SQL statement so that queries differing only by values match
+
+    Literals and bind placeholders become '?', IN lists and multi-row VALUES
+    collapse to a single element and whitespace is folded.
+
+    Args:
+        statement (str): SQL statement
+
+    Returns:
+        tuple: (normalized statement, fingerprint, operation, table)
+    """
+    normalized = _STRING_LITERAL.sub('?', statement)
+    normalized = _PLACEHOLDER.sub('?', normalized)
+    normalized = _NUMBER_LITERAL.sub('?', normalized)
+    normalized = _WHITESPACE.sub(' ', normalized).strip()
+    normalized = _VALUE_LIST.sub('(?)', normalized)
+    normalized = _VALUES_ROWS.sub(r'\1', normalized)
+
+    operation = normalized.split(' ', 1)[0].lower() if normalized else 'other'
+    if operation not in ('select', 'insert', 'update', 'delete'):
+        operation = 'other'
+
+    match = _TABLE.search(normalized)
+    table = match.group(1).lower() if match else 'none'
+
+    fingerprint = hashlib.sha1(normalized.encode('utf-8')).hexdigest()[:12]
+    return normalized, fingerprint, operation, table
+
+
+def _fingerprint_label(fingerprint):
+    """Bound the number of fingerprint label values"""
+    if fingerprint in _fingerprints:
+        return fingerprint
+    if len(_fingerprints) < MAX_FINGERPRINTS:
+        _fingerprints.add(fingerprint)
+        return fingerprint
+    return 'other'
+
+
+def instrument_engine(engine, slow_query_ms=200):
+    """
+    Record count and latency of every statement run on an engine
+
+    Args:
+        engine: SQLAlchemy engine
+        slow_query_ms (float): Statements slower than this are logged (0 disables)
+    """
+    if engine in _instrumented_engines:
+        return
+    _instrumented_engines.add(engine)
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        # Kept on the execution context so that a failed statement, which
+        # never reaches after_cursor_execute, leaves nothing behind
+        context._query_start_time = time.perf_counter()
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        duration = time.perf_counter() - context._query_start_time
+        normalized, fingerprint, operation, table = normalize_statement(statement)
+
+        record_db_query(operation)
+        record_db_query_duration(operation, table, _fingerprint_label(fingerprint), duration)
+
+        if has_request_context():
+            g.db_query_count = g.get('db_query_count', 0) + 1
+            g.db_query_seconds = g.get('db_query_seconds', 0.0) + duration
+            tables = g.get('db_query_tables')
+            if tables is None:
+                tables = g.db_query_tables = Counter()
+            tables[table] += 1
+
+        if slow_query_ms and duration * 1000 >= slow_query_ms:
+            record_db_slow_query(operation, table)
+            endpoint = request.endpoint if has_request_context() else None
+            logger.warning(
+                f"Slow query ({duration * 1000:.1f} ms, fingerprint={fingerprint}, "
+                f"endpoint={endpoint}): {normalized[:500]}"
+            )
+
+
+def init_db_instrumentation(app, db):
+    """
+    Instrument the application's engines and track queries per request
+
+    Args:
+        app: Flask application
+        db: Flask-SQLAlchemy extension
+    """
+    slow_query_ms = app.config.get('DB_SLOW_QUERY_MS', 200)
+    threshold = app.config.get('DB_N_PLUS_ONE_THRESHOLD', 10)
+
+    with app.app_context():
+        for engine in db.engines.values():
+            instrument_engine(engine, slow_query_ms)
+
+    @app.before_request
+    def reset_request_query_count():
+        # g outlives the request when an application context was already
+        # pushed (CLI commands, tests), so start every request from zero
+        g.db_query_count = 0
+        g.db_query_seconds = 0.0
+        g.db_query_tables = Counter()
+
+    @app.after_request
+    def record_request_query_count(response):
+        count = g.get('db_query_count', 0)
+        endpoint = request.endpoint or 'unknown'
+        record_request_queries(endpoint, count)
+
+        tables = g.get('db_query_tables')
+        if threshold and tables:
+            for table, table_count in tables.items():
+                if table_count > threshold:
+                    record_n_plus_one(endpoint, table)
+                    logger.warning(
+                        f"Possible N+1: {request.method} {request.path} ran {table_count} "
+                        f"queries on table '{table}' ({count} queries in total)"
+                    )
+        return response
+
+    logger.info(f"Database instrumentation enabled (slow query threshold {slow_query_ms} ms, "
+                f"N+1 threshold {threshold} queries per table)")
@@ -0,0 +1,188 @@
+import hashlib
+from datetime import datetime, timezone
+from flask import request, Response
+from werkzeug.http import http_date, quote_etag
+
+
+def compute_etag(*parts):
+    """
+    Compute an ETag value from version parts
+
+    Args:
+        *parts: Values identifying the representation version
+
+    Returns:
+        str: Unquoted ETag value
+    """
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(str(part).encode('utf-8'))
+        digest.update(b'\x1f')
+    return digest.hexdigest()
+
+
+def article_version(data):
+    """
+    Get the version timestamp of a serialized article
+
+    Args:
+        data (dict): Serialized article
+
+    Returns:
+        str: ISO timestamp of the last change
+    """
+    return data.get('updated_at') or data.get('created_at')
+
+
+def article_etag(article_id, version):
+    """
+    Compute the ETag of a single article
+
+    Views do not move updated_at, so bodies differing only by views_count
+    share this ETag: it is sent as a weak validator (see cache_headers), and
+    a revalidating client may keep a stale view count until the next change.
+
+    Args:
+        article_id (int): Article ID
+        version (str): ISO timestamp of the last change
+
+    Returns:
+        str: Unquoted ETag value
+    """
+    return compute_etag('article', article_id, version)
+
+
+def articles_etag(articles, *extra):
+    """
+    Compute the ETag of a page of articles from the keys of its items
+
+    Pages carry no Last-Modified: the newest updated_at of the items does not
+    move when an article leaves the page (deleted, filtered out), so
+    If-Modified-Since would answer 304 for a page that changed. The ETag
+    covers the item IDs and is the only validator of a list.
+
+    Args:
+        articles (list): Article objects
+        *extra: Additional values describing the page (pagination info, ...)
+
+    Returns:
+        str: Unquoted ETag value
+    """
+    parts = []
+    for article in articles:
+        changed_at = article.updated_at or article.created_at
+        parts.append(f"{article.id}:{changed_at.isoformat() if changed_at else ''}")
+    return compute_etag('articles', *parts, *extra)
+
+
+def _as_utc(value):
+    """Normalize a naive UTC or ISO timestamp to an aware datetime without microseconds"""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.replace(microsecond=0)
+
+
+def is_not_modified(etag, last_modified=None):
+    """
+    Evaluate the request's conditional headers
+
+    If-None-Match takes precedence over If-Modified-Since, as required by
+    RFC 9110.
+
+    Args:
+        etag (str): Current unquoted ETag value
+        last_modified: Last modification datetime or ISO string
+
+    Returns:
+        bool: True if the client copy is still current
+    """
+    return evaluate_conditional(request.if_none_match, request.if_modified_since, etag, last_modified)
+
+
+def evaluate_conditional(if_none_match, if_modified_since, etag, last_modified=None):
+    """
+    Evaluate parsed conditional headers against the current representation
+
+    Args:
+        if_none_match (ETags): Parsed If-None-Match header (may be empty)
+        if_modified_since (datetime): Parsed If-Modified-Since header or None
+        etag (str): Current unquoted ETag value
+        last_modified: Last modification datetime or ISO string
+
+    Returns:
+        bool: True if the client copy is still current
+    """
+    if if_none_match:
+        # Compressed representations carry the coding as an ETag suffix
+        return any(
+            if_none_match.contains_weak(candidate)
+            for candidate in (etag, f'{etag}-br', f'{etag}-gzip')
+        )
+
+    if if_modified_since and last_modified is not None:
+        return _as_utc(last_modified) <= if_modified_since
+
+    return False
+
+
+def has_conditional_headers():
+    """
+    Check whether the request carries conditional GET headers
+
+    Returns:
+        bool: True if If-None-Match or If-Modified-Since is present
+    """
+    return bool(request.if_none_match) or request.if_modified_since is not None
+
+
+def cache_headers(etag, last_modified=None):
+    """
+    Build (weak) ETag and Last-Modified header values
+
+    Args:
+        etag (str): Unquoted ETag value
+        last_modified: Last modification datetime or ISO string
+
+    Returns:
+        dict: Header names and values
+    """
+    headers = {'ETag': quote_etag(etag, weak=True)}
+    if last_modified is not None:
+        headers['Last-Modified'] = http_date(_as_utc(last_modified))
+    return headers
+
+
+def set_cache_headers(response, etag, last_modified=None):
+    """
+    Set a weak ETag and Last-Modified on a response
+
+    Args:
+        response (Response): Flask response
+        etag (str): Unquoted ETag value
+        last_modified: Last modification datetime or ISO string
+
+    Returns:
+        Response: The same response
+    """
+    response.set_etag(etag, weak=True)
+    if last_modified is not None:
+        response.last_modified = _as_utc(last_modified)
+    return response
+
+
+def not_modified(etag, last_modified=None):
+    """
+    Build an empty 304 Not Modified response
+
+    Args:
+        etag (str): Unquoted ETag value
+        last_modified: Last modification datetime or ISO string
+
+    Returns:
+        Response: 304 response
+    """
+    return set_cache_headers(Response(status=304), etag, last_modified)
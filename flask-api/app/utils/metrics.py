@@ -1,10 +1,21 @@
-from prometheus_client import Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST
+from prometheus_client import (
+    CollectorRegistry, Counter, Histogram, Gauge, generate_latest, multiprocess, CONTENT_TYPE_LATEST, REGISTRY
+)
 from flask import request, Response
 from functools import wraps
+import os
 import time
 
 
 # Define metrics
+#
+# Gunicorn workers are separate processes: with PROMETHEUS_MULTIPROC_DIR set,
+# each one writes its samples to mmap files in that directory and /metrics
+# aggregates them. Every Gauge declares how its per-worker values combine.
+if os.getenv('PROMETHEUS_MULTIPROC_DIR'):
+    # Processes started outside gunicorn (flask db upgrade) run before it creates the directory
+    os.makedirs(os.environ['PROMETHEUS_MULTIPROC_DIR'], exist_ok=True)
+
 http_requests_total = Counter(
     'http_requests_total',
     'Total HTTP requests',
@@ -20,7 +31,15 @@ http_request_duration_seconds = Histogram(
 articles_total = Gauge(
     'articles_total',
     'Total number of articles',
-    ['status']
+    ['status'],
+    multiprocess_mode='mostrecent'
+)
+
+articles_by_category = Gauge(
+    'articles_by_category',
+    'Number of articles per category',
+    ['category'],
+    multiprocess_mode='mostrecent'
 )
 
 db_queries_total = Counter(
@@ -29,6 +48,50 @@ db_queries_total = Counter(
     ['operation']
 )
 
+db_query_duration_seconds = Histogram(
+    'db_query_duration_seconds',
+    'Database statement latency in seconds',
+    ['operation', 'table', 'fingerprint'],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+
+db_queries_per_request = Histogram(
+    'db_queries_per_request',
+    'Database statements run while handling one request',
+    ['endpoint'],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100)
+)
+
+db_slow_queries_total = Counter(
+    'db_slow_queries_total',
+    'Database statements slower than DB_SLOW_QUERY_MS',
+    ['operation', 'table']
+)
+
+db_n_plus_one_total = Counter(
+    'db_n_plus_one_total',
+    'Requests running more than DB_N_PLUS_ONE_THRESHOLD statements on one table',
+    ['endpoint', 'table']
+)
+
+db_read_routing_total = Counter(
+    'db_read_routing_total',
+    'Read-only queries by target database and routing reason',
+    ['target', 'reason']
+)
+
+db_replica_lag_seconds = Gauge(
+    'db_replica_lag_seconds',
+    'Estimated replication lag of DB2 behind the primary',
+    multiprocess_mode='livemax'
+)
+
+db_replica_available = Gauge(
+    'db_replica_available',
+    'Whether the last lag check reached the replica (1) or not (0)',
+    multiprocess_mode='livemin'
+)
+
 kafka_messages_sent_total = Counter(
     'kafka_messages_sent_total',
     'Total Kafka messages sent',
@@ -40,6 +103,134 @@ kafka_message_send_errors_total = Counter(
     'Total Kafka message send errors'
 )
 
+kafka_producer_batch_events = Histogram(
+    'kafka_producer_batch_events',
+    'Events acknowledged per producer flush',
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000)
+)
+
+kafka_producer_batch_duration_seconds = Histogram(
+    'kafka_producer_batch_duration_seconds',
+    'Time to send and flush a batch of events'
+)
+
+kafka_producer_events_per_second = Gauge(
+    'kafka_producer_events_per_second',
+    'Throughput of the last flushed batch',
+    multiprocess_mode='liveall'
+)
+
+kafka_producer_client_stats = Gauge(
+    'kafka_producer_client_stats',
+    'Batching statistics reported by the Kafka client',
+    ['stat'],
+    multiprocess_mode='liveall'
+)
+
+article_views_pending = Gauge(
+    'article_views_pending',
+    'Article views buffered in memory and not yet written',
+    multiprocess_mode='livesum'
+)
+
+article_views_flushed_total = Counter(
+    'article_views_flushed_total',
+    'Article views written to the database by the view counter',
+    ['success']
+)
+
+article_view_flushes_total = Counter(
+    'article_view_flushes_total',
+    'View counter batch flushes',
+    ['success']
+)
+
+article_views_dropped_total = Counter(
+    'article_views_dropped_total',
+    'Article views dropped because the view buffer was full'
+)
+
+article_cache_hits_total = Counter(
+    'article_cache_hits_total',
+    'Article cache hits'
+)
+
+article_cache_misses_total = Counter(
+    'article_cache_misses_total',
+    'Article cache misses'
+)
+
+article_cache_evictions_total = Counter(
+    'article_cache_evictions_total',
+    'Article cache evictions',
+    ['reason']
+)
+
+article_cache_size = Gauge(
+    'article_cache_size',
+    'Articles currently held in the article cache',
+    multiprocess_mode='livesum'
+)
+
+response_compression_total = Counter(
+    'response_compression_total',
+    'Compressed API responses',
+    ['encoding', 'cached']
+)
+
+cache_invalidation_events_total = Counter(
+    'cache_invalidation_events_total',
+    'Article events applied to local caches',
+    ['event_type']
+)
+
+outbox_depth = Gauge(
+    'outbox_depth',
+    'Article events waiting in the outbox',
+    multiprocess_mode='livemax'
+)
+
+outbox_oldest_event_age_seconds = Gauge(
+    'outbox_oldest_event_age_seconds',
+    'Age of the oldest article event waiting in the outbox',
+    multiprocess_mode='livemax'
+)
+
+outbox_events_relayed_total = Counter(
+    'outbox_events_relayed_total',
+    'Outbox events relayed to Kafka',
+    ['event_type', 'success']
+)
+
+outbox_events_coalesced_total = Counter(
+    'outbox_events_coalesced_total',
+    'Outbox events dropped because a later event for the same article supersedes them'
+)
+
+outbox_relay_errors_total = Counter(
+    'outbox_relay_errors_total',
+    'Outbox relay iterations that failed'
+)
+
+db_pool_checkout_wait_seconds = Histogram(
+    'db_pool_checkout_wait_seconds',
+    'Time spent waiting for a connection from the SQLAlchemy pool',
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+)
+
+admission_decisions_total = Counter(
+    'admission_decisions_total',
+    'Admission control decisions by endpoint class',
+    ['endpoint_class', 'decision', 'reason']
+)
+
+http_requests_in_flight = Gauge(
+    'http_requests_in_flight',
+    'Admitted requests currently being handled',
+    ['endpoint_class'],
+    multiprocess_mode='livesum'
+)
+
 
 def init_metrics(app):
     """
@@ -51,7 +242,25 @@ def init_metrics(app):
     @app.route('/metrics')
     def metrics():
         """Prometheus metrics endpoint"""
-        return Response(generate_latest(), mimetype=CONTENT_TYPE_LATEST)
+        return Response(generate_latest(metrics_registry()), mimetype=CONTENT_TYPE_LATEST)
+
+
+def metrics_registry():
+    """
+    Get the registry to expose on /metrics
+
+    In multiprocess mode a fresh registry collects the samples of every
+    worker (live and dead) from PROMETHEUS_MULTIPROC_DIR.
+
+    Returns:
+        CollectorRegistry: Registry to expose
+    """
+    if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+
+    return REGISTRY
 
 
 def track_request(f):
@@ -100,16 +309,103 @@ def track_request(f):
     return decorated_function
 
 
+def record_http_request(method, endpoint, status, duration):
+    """
+    Record an HTTP request handled outside Flask (ASGI mode)
+
+    Args:
+        method (str): HTTP method
+        endpoint (str): Endpoint name, same as the Flask endpoint
+        status (int): Response status code
+        duration (float): Seconds spent handling the request
+    """
+    http_requests_total.labels(method=method, endpoint=endpoint, status=status).inc()
+    http_request_duration_seconds.labels(method=method, endpoint=endpoint).observe(duration)
+
+
 def record_db_query(operation):
     """
     Record a database query
 
     Args:
-        operation (str): Type of operation (select, insert, update, delete)
+        operation (str): Type of operation (select, insert, update, delete, other)
     """
     db_queries_total.labels(operation=operation).inc()
 
 
+def record_db_query_duration(operation, table, fingerprint, duration):
+    """
+    Record the latency of a database statement
+
+    Args:
+        operation (str): Type of operation (select, insert, update, delete, other)
+        table (str): First table referenced by the statement
+        fingerprint (str): Hash of the normalized statement
+        duration (float): Seconds spent executing the statement
+    """
+    db_query_duration_seconds.labels(
+        operation=operation,
+        table=table,
+        fingerprint=fingerprint
+    ).observe(duration)
+
+
+def record_request_queries(endpoint, count):
+    """
+    Record the number of database statements run by a request
+
+    Args:
+        endpoint (str): Flask endpoint
+        count (int): Number of statements
+    """
+    db_queries_per_request.labels(endpoint=endpoint).observe(count)
+
+
+def record_db_slow_query(operation, table):
+    """
+    Record a slow database statement
+
+    Args:
+        operation (str): Type of operation
+        table (str): First table referenced by the statement
+    """
+    db_slow_queries_total.labels(operation=operation, table=table).inc()
+
+
+def record_n_plus_one(endpoint, table):
+    """
+    Record a request that queried one table more than the N+1 threshold
+
+    Args:
+        endpoint (str): Flask endpoint
+        table (str): Table queried repeatedly
+    """
+    db_n_plus_one_total.labels(endpoint=endpoint, table=table).inc()
+
+
+def record_read_routing(target, reason):
+    """
+    Record where a read-only query was routed
+
+    Args:
+        target (str): primary or replica
+        reason (str): fresh, lag, unavailable or read_your_writes
+    """
+    db_read_routing_total.labels(target=target, reason=reason).inc()
+
+
+def update_replica_status(lag):
+    """
+    Update the replica lag gauges
+
+    Args:
+        lag (float): Estimated lag in seconds, or None if the replica is unreachable
+    """
+    db_replica_available.set(0 if lag is None else 1)
+    if lag is not None:
+        db_replica_lag_seconds.set(lag)
+
+
 def record_kafka_message(event_type, success=True):
     """
     Record a Kafka message sent
@@ -127,6 +423,43 @@ def record_kafka_message(event_type, success=True):
         kafka_message_send_errors_total.inc()
 
 
+def record_kafka_batch(events, duration):
+    """
+    Record a flushed batch of Kafka events
+
+    Args:
+        events (int): Events acknowledged by the broker
+        duration (float): Seconds spent sending and flushing
+    """
+    kafka_producer_batch_events.observe(events)
+    kafka_producer_batch_duration_seconds.observe(duration)
+    if duration > 0:
+        kafka_producer_events_per_second.set(events / duration)
+
+
+# Kafka client statistics exported by update_kafka_producer_stats
+KAFKA_CLIENT_STATS = (
+    'batch-size-avg',
+    'compression-rate-avg',
+    'records-per-request-avg',
+    'record-send-rate',
+    'request-latency-avg'
+)
+
+
+def update_kafka_producer_stats(stats):
+    """
+    Update the Kafka client statistics gauges
+
+    Args:
+        stats (dict): producer-metrics group of KafkaProducer.metrics()
+    """
+    for name in KAFKA_CLIENT_STATS:
+        value = stats.get(name)
+        if isinstance(value, (int, float)) and value == value:
+            kafka_producer_client_stats.labels(stat=name).set(value)
+
+
 def update_article_count(status, count):
     """
     Update article count gauge
@@ -136,3 +469,181 @@ def update_article_count(status, count):
         count (int): Number of articles
     """
     articles_total.labels(status=status).set(count)
+
+
+def update_category_count(category, count):
+    """
+    Update article count per category gauge
+
+    Args:
+        category (str): Article category
+        count (int): Number of articles
+    """
+    articles_by_category.labels(category=category).set(count)
+
+
+def update_pending_views(count):
+    """
+    Update the pending article views gauge
+
+    Args:
+        count (int): Views buffered in memory
+    """
+    article_views_pending.set(count)
+
+
+def record_view_flush(views, success=True):
+    """
+    Record a view counter flush
+
+    Args:
+        views (int): Number of views in the batch
+        success (bool): Whether the batch was written
+    """
+    label = 'true' if success else 'false'
+    article_view_flushes_total.labels(success=label).inc()
+    article_views_flushed_total.labels(success=label).inc(views)
+
+
+def record_views_dropped(views):
+    """
+    Record views dropped by the view counter
+
+    Args:
+        views (int): Number of views dropped
+    """
+    article_views_dropped_total.inc(views)
+
+
+def record_article_cache_hit():
+    """Record an article cache hit"""
+    article_cache_hits_total.inc()
+
+
+def record_article_cache_miss():
+    """Record an article cache miss"""
+    article_cache_misses_total.inc()
+
+
+def record_article_cache_eviction(reason):
+    """
+    Record an article cache eviction
+
+    Args:
+        reason (str): Why the entry was evicted (size, expired, invalidated)
+    """
+    article_cache_evictions_total.labels(reason=reason).inc()
+
+
+def update_article_cache_size(size):
+    """
+    Update the article cache size gauge
+
+    Args:
+        size (int): Number of cached articles
+    """
+    article_cache_size.set(size)
+
+
+def record_cache_invalidation_event(event_type):
+    """
+    Record an article event received by the cache invalidation listener
+
+    Args:
+        event_type (str): Type of event
+    """
+    cache_invalidation_events_total.labels(event_type=event_type).inc()
+
+
+def record_response_compression(encoding, cached=False):
+    """
+    Record a compressed response
+
+    Args:
+        encoding (str): Content coding used
+        cached (bool): Whether the compressed body came from the cache
+    """
+    response_compression_total.labels(
+        encoding=encoding,
+        cached='true' if cached else 'false'
+    ).inc()
+
+
+def update_outbox_backlog(depth, oldest_age):
+    """
+    Update the outbox depth and age gauges
+
+    Args:
+        depth (int): Events waiting in the outbox
+        oldest_age (float): Age of the oldest waiting event in seconds
+    """
+    outbox_depth.set(depth)
+    outbox_oldest_event_age_seconds.set(oldest_age)
+
+
+def record_outbox_relay(event_type, success=True, count=1):
+    """
+    Record outbox events relayed to Kafka
+
+    Args:
+        event_type (str): Type of event
+        success (bool): Whether the broker acknowledged the events
+        count (int): Number of events
+    """
+    label = 'true' if success else 'false'
+    outbox_events_relayed_total.labels(event_type=event_type, success=label).inc(count)
+    kafka_messages_sent_total.labels(event_type=event_type, success=label).inc(count)
+    if not success:
+        kafka_message_send_errors_total.inc(count)
+
+
+def record_outbox_coalesced(count):
+    """
+    Record outbox events superseded by later events
+
+    Args:
+        count (int): Number of events dropped
+    """
+    outbox_events_coalesced_total.inc(count)
+
+
+def record_outbox_relay_error():
+    """Record a failed outbox relay iteration"""
+    outbox_relay_errors_total.inc()
+
+
+def record_db_pool_checkout_wait(duration):
+    """
+    Record the wait for a pooled database connection
+
+    Args:
+        duration (float): Seconds spent waiting for the connection
+    """
+    db_pool_checkout_wait_seconds.observe(duration)
+
+
+def record_admission(endpoint_class, decision, reason):
+    """
+    Record an admission control decision
+
+    Args:
+        endpoint_class (str): health, read or write
+        decision (str): admitted, shed or throttled
+        reason (str): exempt, ok, pool_wait, in_flight or client_rate
+    """
+    admission_decisions_total.labels(
+        endpoint_class=endpoint_class,
+        decision=decision,
+        reason=reason
+    ).inc()
+
+
+def update_requests_in_flight(endpoint_class, count):
+    """
+    Update the in-flight requests gauge
+
+    Args:
+        endpoint_class (str): health, read or write
+        count (int): Requests of the class being handled by this worker
+    """
+    http_requests_in_flight.labels(endpoint_class=endpoint_class).set(count)
@@ -0,0 +1,89 @@
+import base64
+import json
+from datetime import datetime, timezone
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded"""
+
+
+def encode_cursor(values):
+    """
+    Encode keyset values into an opaque cursor string
+
+    Args:
+        values (dict): Keyset values (datetimes are stored as ISO strings)
+
+    Returns:
+        str: URL-safe cursor
+    """
+    payload = {
+        key: value.isoformat() if isinstance(value, datetime) else value
+        for key, value in values.items()
+    }
+    raw = json.dumps(payload, separators=(',', ':'), sort_keys=True).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor, fields=None):
+    """
+    Decode an opaque cursor string back into keyset values
+
+    Args:
+        cursor (str): Cursor produced by encode_cursor
+        fields (dict): Expected keys and their types (int, float or
+            datetime); datetimes are parsed back from ISO strings
+
+    Returns:
+        dict: Keyset values
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or does not have the
+            expected keys and types
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError(f'Invalid cursor: {str(e)}')
+    if not isinstance(values, dict):
+        raise InvalidCursorError('Cursor payload must be an object')
+
+    for key, expected in (fields or {}).items():
+        value = values.get(key)
+        if expected is datetime:
+            try:
+                values[key] = datetime.fromisoformat(value)
+            except (ValueError, TypeError):
+                raise InvalidCursorError(f'Invalid cursor: {key} must be an ISO datetime')
+        elif expected is float:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise InvalidCursorError(f'Invalid cursor: {key} must be a number')
+            values[key] = float(value)
+        elif isinstance(value, bool) or not isinstance(value, expected):
+            raise InvalidCursorError(f'Invalid cursor: {key} must be of type {expected.__name__}')
+    return values
+
+
+def parse_datetime(value):
+    """
+    Parse a date filter value into a naive UTC datetime
+
+    Args:
+        value: datetime, or ISO 8601 date or datetime string (a date alone
+            means midnight; offsets are converted to UTC)
+
+    Returns:
+        datetime: Naive UTC datetime, None if the value is invalid
+    """
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.strip())
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
@@ -0,0 +1,65 @@
+import json
+
+
+def plan_nodes(plan):
+    """
+    Yield every node of a PostgreSQL JSON plan tree
+
+    Args:
+        plan (dict): Plan node, as returned by explain
+
+    Yields:
+        dict: The node and all its descendants
+    """
+    yield plan
+    for child in plan.get('Plans', []):
+        yield from plan_nodes(child)
+
+
+def explain(connection, statement):
+    """
+    Run EXPLAIN (FORMAT JSON) on a statement
+
+    Args:
+        connection: Connection on a PostgreSQL database
+        statement: SQLAlchemy statement, compiled with its parameters inlined
+
+    Returns:
+        dict: Root plan node
+    """
+    sql = statement.compile(connection, compile_kwargs={'literal_binds': True})
+    plan = connection.exec_driver_sql(f'EXPLAIN (FORMAT JSON) {sql}').scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]['Plan']
+
+
+def describe(plan):
+    """
+    Summarize the scans of a plan
+
+    Args:
+        plan (dict): Root plan node
+
+    Returns:
+        str: Node type (and index) of every scan node
+    """
+    return ', '.join(
+        f"{node['Node Type']}" + (f" on {node['Index Name']}" if 'Index Name' in node else '')
+        for node in plan_nodes(plan)
+        if 'Scan' in node['Node Type']
+    )
+
+
+def uses_index(plan, index_name):
+    """
+    Tell whether a plan scans an index
+
+    Args:
+        plan (dict): Root plan node
+        index_name (str): Index name
+
+    Returns:
+        bool: Whether a node of the plan uses the index
+    """
+    return any(node.get('Index Name') == index_name for node in plan_nodes(plan))
@@ -0,0 +1,67 @@
+"""
+Gunicorn configuration
+
+Usage:
+    gunicorn -c gunicorn.conf.py "app:create_app()"
+"""
+
+import os
+import shutil
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+workers = int(os.getenv('GUNICORN_WORKERS', 4))
+# More than one thread selects gthread workers, which serve requests
+# concurrently: admission control only sheds on pool waits and requests in
+# flight with them (or in ASGI mode), a sync worker serving one at a time
+threads = int(os.getenv('GUNICORN_THREADS', 1))
+
+# Import and build the app once in the master; workers share it copy-on-write
+preload_app = os.getenv('GUNICORN_PRELOAD', 'true').lower() == 'true'
+
+if preload_app:
+    # Threads do not survive fork: each worker starts them in post_worker_init
+    os.environ['START_BACKGROUND_SERVICES'] = 'false'
+
+
+def reset_multiproc_dir():
+    """Start from an empty Prometheus multiprocess directory"""
+    multiproc_dir = os.getenv('PROMETHEUS_MULTIPROC_DIR')
+    if not multiproc_dir:
+        return
+
+    # Samples of a previous run would otherwise be aggregated again
+    shutil.rmtree(multiproc_dir, ignore_errors=True)
+    os.makedirs(multiproc_dir, exist_ok=True)
+
+
+# Done when the configuration is read: a preloaded app writes metric files
+# while it is imported, before on_starting runs
+reset_multiproc_dir()
+
+
+def on_starting(server):
+    """Warn when metrics cannot be aggregated across workers"""
+    if not os.getenv('PROMETHEUS_MULTIPROC_DIR'):
+        server.log.warning("PROMETHEUS_MULTIPROC_DIR is not set; /metrics will only show one worker")
+    if server.cfg.worker_class_str == 'sync':
+        server.log.info("Sync workers serve one request at a time: admission control only "
+                        "applies the per-client rate limit (set GUNICORN_THREADS to shed load)")
+
+
+def post_worker_init(worker):
+    """Start the background services of a preloaded app in each worker"""
+    if not preload_app:
+        return
+
+    from app import start_background_services
+
+    # In ASGI mode (app.asgi) the Flask app is held by the Starlette app
+    state = getattr(worker.wsgi, 'state', None)
+    start_background_services(getattr(state, 'flask_app', worker.wsgi))
+
+
+def child_exit(server, worker):
+    """Drop the live gauge samples of an exited worker"""
+    if os.getenv('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
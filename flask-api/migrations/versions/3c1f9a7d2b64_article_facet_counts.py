@@ -0,0 +1,35 @@
+"""Facet summary: article_facet_counts
+
+The table is filled by the API: the first worker to start rebuilds it from
+the articles when it is empty.
+
+Revision ID: 3c1f9a7d2b64
+Revises: e5708fc5b243
+Create Date: 2026-10-17 06:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c1f9a7d2b64'
+down_revision = 'e5708fc5b243'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'article_facet_counts',
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('category', sa.String(length=50), nullable=False),
+        sa.Column('author', sa.String(length=100), nullable=False),
+        sa.Column('tag', sa.Text(), nullable=False),
+        sa.Column('article_count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('status', 'category', 'author', 'tag')
+    )
+
+
+def downgrade():
+    op.drop_table('article_facet_counts')
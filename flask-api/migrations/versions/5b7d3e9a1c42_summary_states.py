@@ -0,0 +1,33 @@
+"""Summary rebuild markers: summary_states
+
+One row per summary table (article_facets) with the time of its last
+completed rebuild. A summary without a row is not complete yet: it is
+filled by the first rebuild, which a single worker runs.
+
+Revision ID: 5b7d3e9a1c42
+Revises: 8a4e2c6f1d35
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b7d3e9a1c42'
+down_revision = '8a4e2c6f1d35'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'summary_states',
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('rebuilt_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade():
+    op.drop_table('summary_states')
@@ -0,0 +1,32 @@
+"""Trending ranking: article_view_buckets
+
+Revision ID: 8a4e2c6f1d35
+Revises: 3c1f9a7d2b64
+Create Date: 2026-10-17 07:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8a4e2c6f1d35'
+down_revision = '3c1f9a7d2b64'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'article_view_buckets',
+        sa.Column('article_id', sa.Integer(), nullable=False),
+        sa.Column('bucket_start', sa.DateTime(), nullable=False),
+        sa.Column('views', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('article_id', 'bucket_start')
+    )
+    op.create_index('idx_article_view_buckets_bucket_start', 'article_view_buckets', ['bucket_start'])
+
+
+def downgrade():
+    op.drop_index('idx_article_view_buckets_bucket_start', table_name='article_view_buckets')
+    op.drop_table('article_view_buckets')
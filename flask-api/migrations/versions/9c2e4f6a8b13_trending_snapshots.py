@@ -0,0 +1,33 @@
+"""Trending ranking: trending_snapshots
+
+Holds the rankings computed by the worker elected to refresh them, so that
+the other workers load them instead of computing their own.
+
+Revision ID: 9c2e4f6a8b13
+Revises: 5b7d3e9a1c42
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c2e4f6a8b13'
+down_revision = '5b7d3e9a1c42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'trending_snapshots',
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('refreshed_at', sa.DateTime(), nullable=False),
+        sa.Column('rankings', sa.JSON(), nullable=False),
+        sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade():
+    op.drop_table('trending_snapshots')
@@ -0,0 +1,105 @@
+"""Initial schema: articles and outbox_events
+
+Databases initialized by the former database/init-db1.sql already have these
+tables: only the missing tables and indexes are created, so this revision
+also serves as the baseline for them.
+
+Revision ID: e5708fc5b243
+Revises:
+Create Date: 2026-10-17 04:00:00.000000
+
+"""
+from alembic import context, op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5708fc5b243'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _inspector():
+    """Inspector of the target database, None when generating SQL offline"""
+    return None if context.is_offline_mode() else sa.inspect(op.get_bind())
+
+
+def _has_table(table_name):
+    """Check whether a table exists (never, when generating SQL offline)"""
+    inspector = _inspector()
+    return inspector is not None and inspector.has_table(table_name)
+
+
+def _create_missing_indexes(table_name, indexes):
+    """Create the indexes of a table that do not exist yet"""
+    inspector = _inspector()
+    existing = set()
+    if inspector is not None and inspector.has_table(table_name):
+        existing = {index['name'] for index in inspector.get_indexes(table_name)}
+    for name, columns, options in indexes:
+        if name not in existing:
+            op.create_index(name, table_name, columns, **options)
+
+
+def upgrade():
+    is_postgresql = op.get_context().dialect.name == 'postgresql'
+
+    if not _has_table('articles'):
+        op.create_table(
+            'articles',
+            sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+            sa.Column('title', sa.String(length=200), nullable=False),
+            sa.Column('content', sa.Text(), nullable=False),
+            sa.Column('author', sa.String(length=100), nullable=False),
+            sa.Column('category', sa.String(length=50), server_default='general', nullable=True),
+            sa.Column('tags', sa.JSON().with_variant(postgresql.JSONB(), 'postgresql'),
+                      server_default='[]', nullable=True),
+            sa.Column('status', sa.String(length=20), server_default='draft', nullable=False),
+            sa.Column('views_count', sa.Integer(), server_default='0', nullable=True),
+            sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+            sa.Column('published_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('id'),
+            sa.CheckConstraint("status IN ('draft', 'published', 'archived')", name='chk_status')
+        )
+
+    _create_missing_indexes('articles', [
+        ('idx_articles_status', ['status'], {}),
+        ('idx_articles_author', ['author'], {}),
+        ('idx_articles_category', ['category'], {}),
+        ('idx_articles_created_at', [sa.text('created_at DESC')], {}),
+        ('idx_articles_updated_at', [sa.text('updated_at DESC')], {}),
+        ('idx_articles_published_at', [sa.text('published_at DESC')], {
+            'postgresql_where': sa.text('published_at IS NOT NULL'),
+            'sqlite_where': sa.text('published_at IS NOT NULL')
+        }),
+    ])
+
+    if is_postgresql:
+        # GIN indexes for tag containment and full-text search; the
+        # expression must stay identical to ArticleService._fulltext_clauses
+        _create_missing_indexes('articles', [
+            ('idx_articles_tags', ['tags'], {'postgresql_using': 'gin'}),
+            ('idx_articles_title_content_fts', [
+                sa.text("to_tsvector('english', coalesce(title, '') || ' ' || coalesce(content, ''))")
+            ], {'postgresql_using': 'gin'}),
+        ])
+
+    if not _has_table('outbox_events'):
+        op.create_table(
+            'outbox_events',
+            sa.Column('id', sa.BigInteger().with_variant(sa.Integer(), 'sqlite'),
+                      autoincrement=True, nullable=False),
+            sa.Column('event_type', sa.String(length=50), nullable=False),
+            sa.Column('aggregate_id', sa.Integer(), nullable=False),
+            sa.Column('payload', sa.JSON(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+            sa.PrimaryKeyConstraint('id')
+        )
+
+
+def downgrade():
+    op.drop_table('outbox_events')
+    op.drop_table('articles')
@@ -0,0 +1,46 @@
+import pytest
+from sqlalchemy import event
+from app import create_app
+from app.models.article import db
+
+
+@pytest.fixture
+def app():
+    """Application on an in-memory SQLite database with the schema created"""
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def service(app):
+    """The application's ArticleService"""
+    return app.article_service
+
+
+@pytest.fixture
+def make_article(client):
+    """Create an article through the API and return its JSON"""
+    def make(**fields):
+        data = {'title': 'Article', 'content': 'Content', 'author': 'Author', **fields}
+        response = client.post('/api/v1/articles', json=data)
+        assert response.status_code == 201, response.json
+        return response.json
+
+    return make
+
+
+@pytest.fixture
+def statements(app):
+    """SQL statements run on the engine during the test"""
+    recorded = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        recorded.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', record)
+    yield recorded
+    event.remove(db.engine, 'before_cursor_execute', record)
@@ -0,0 +1,55 @@
+import threading
+
+from flask import jsonify
+
+from app.utils.admission import AdmissionController, TrustedProxies, client_identity
+
+
+def test_forwarded_for_is_only_believed_from_trusted_proxies():
+    proxies = TrustedProxies(['10.0.0.0/8', 'localhost'])
+
+    assert client_identity('203.0.113.9', '198.51.100.1', proxies) == '203.0.113.9'
+    assert client_identity('10.0.0.5', '198.51.100.1', proxies) == '198.51.100.1'
+    # Spoofed entries left of the last untrusted hop are ignored
+    assert client_identity('10.0.0.5', '192.0.2.1, 198.51.100.1, 10.0.0.7', proxies) == '198.51.100.1'
+    # Host names are resolved
+    assert client_identity('127.0.0.1', '198.51.100.2', proxies) == '198.51.100.2'
+    # A trusted proxy that forwards no client is not rate limited per client
+    assert client_identity('10.0.0.5', None, proxies) is None
+    assert client_identity('10.0.0.5', '198.51.100.1', TrustedProxies([])) == '10.0.0.5'
+
+
+def test_requests_are_shed_when_a_threaded_worker_is_busy(app):
+    # A gthread or ASGI worker serves requests concurrently: with one read
+    # in flight allowed, a second concurrent read is shed
+    controller = AdmissionController({
+        'read': {'max_wait': 10, 'max_in_flight': 1, 'retry_after': 5},
+        'write': {'max_wait': 10, 'max_in_flight': 2, 'retry_after': 2}
+    })
+    controller.init_app(app)
+
+    entered, release = threading.Event(), threading.Event()
+
+    def slow():
+        entered.set()
+        release.wait(5)
+        return jsonify({})
+
+    app.add_url_rule('/slow', 'slow', slow)
+
+    responses = []
+    worker = threading.Thread(target=lambda: responses.append(app.test_client().get('/slow')))
+    worker.start()
+    try:
+        assert entered.wait(5)
+        shed = app.test_client().get('/api/v1/articles')
+        health = app.test_client().get('/api/v1/health')
+    finally:
+        release.set()
+        worker.join(5)
+
+    assert shed.status_code == 503
+    assert shed.headers['Retry-After'] == '5'
+    assert health.status_code == 200
+    assert responses[0].status_code == 200
+    assert app.test_client().get('/api/v1/articles').status_code == 200
@@ -0,0 +1,24 @@
+import pytest
+
+from app.services.article_cache import ArticleCache
+
+
+class UnusedReplica:
+    """Replica router whose sessions must not be used"""
+
+    def read_session(self):
+        raise AssertionError('single article reads must use the primary')
+
+
+@pytest.mark.parametrize('cached', [False, True])
+def test_article_reads_use_the_primary_with_a_replica(service, make_article, cached):
+    article = make_article()
+    service.replica_router = UnusedReplica()
+    service.article_cache = ArticleCache(max_size=10, ttl=60) if cached else None
+
+    payload = service.get_article_payload(article['id'])
+
+    assert payload['id'] == article['id']
+    assert service.get_article_version(article['id']) == article['updated_at']
+    if cached:
+        assert service.article_cache.get(article['id']) is payload
@@ -0,0 +1,31 @@
+import pytest
+
+from app.services.article_counts import ArticleCounts
+from app.services.article_facets import ArticleFacets
+from app.utils.metrics import articles_by_category, articles_total
+
+
+def gauge_value(gauge, **labels):
+    return gauge.labels(**labels)._value.get()
+
+
+@pytest.mark.parametrize('use_facets', [False, True])
+def test_reconcile_exports_the_shared_counts(app, client, make_article, use_facets):
+    make_article(category='news')
+    published = make_article(category='news')
+    make_article(category='sports')
+    client.post(f"/api/v1/articles/{published['id']}/publish")
+
+    article_facets = None
+    if use_facets:
+        article_facets = ArticleFacets()
+        article_facets.init_app(app)
+        article_facets.rebuild()
+    counts = ArticleCounts(article_facets=article_facets)
+    counts.init_app(app)
+
+    assert counts.reconcile() == 3
+    assert gauge_value(articles_total, status='draft') == 2
+    assert gauge_value(articles_total, status='published') == 1
+    assert gauge_value(articles_by_category, category='news') == 2
+    assert gauge_value(articles_by_category, category='sports') == 1
@@ -0,0 +1,156 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.asgi import create_asgi_app
+from app.config import TestingConfig
+from app.models.article import db
+
+
+class Clients:
+    """The same requests sent to the Flask app and to the Starlette app"""
+
+    # Fields that differ between two articles created by identical requests
+    VOLATILE = {'id', 'created_at', 'updated_at', 'published_at'}
+
+    def __init__(self, asgi_app):
+        self.asgi_app = asgi_app
+        self.flask = asgi_app.state.flask_app.test_client()
+
+    def wsgi(self, method, path, **kwargs):
+        response = self.flask.open(path, method=method, **kwargs)
+        return response.status_code, response.get_json(silent=True), response.headers.get('ETag')
+
+    def asgi(self, method, path, **kwargs):
+        async def send():
+            transport = httpx.ASGITransport(app=self.asgi_app)
+            # httpx asks for gzip by default; the Flask test client does not
+            async with httpx.AsyncClient(transport=transport, base_url='http://localhost',
+                                         headers={'Accept-Encoding': 'identity'}) as client:
+                return await client.request(method, path, **kwargs)
+
+        response = asyncio.run(send())
+        body = response.json() if response.content else None
+        return response.status_code, body, response.headers.get('ETag')
+
+    def both(self, method, path, **kwargs):
+        return self.wsgi(method, path, **kwargs), self.asgi(method, path, **kwargs)
+
+    @classmethod
+    def stable(cls, body):
+        return {key: value for key, value in body.items() if key not in cls.VOLATILE}
+
+
+@pytest.fixture
+def clients(tmp_path, monkeypatch):
+    """Both serving modes on one SQLite file, which the sync and async engines share"""
+    monkeypatch.setattr(TestingConfig, 'SQLALCHEMY_DATABASE_URI', f"sqlite:///{tmp_path / 'parity.db'}")
+    asgi_app = create_asgi_app('testing')
+    flask_app = asgi_app.state.flask_app
+    with flask_app.app_context():
+        db.create_all()
+
+    clients = Clients(asgi_app)
+    for index in range(5):
+        clients.wsgi('POST', '/api/v1/articles', json={
+            'title': f'Parity {index}', 'content': f'Content {index}', 'author': 'Author',
+            'category': 'news' if index % 2 else 'tech', 'tags': ['python'] if index % 2 else ['rust']
+        })
+    for article_id in (2, 4, 5):
+        clients.wsgi('POST', f'/api/v1/articles/{article_id}/publish')
+
+    yield clients
+
+    asyncio.run(asgi_app.state.engine.dispose())
+    with flask_app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.mark.parametrize('path', [
+    '/api/v1/articles',
+    '/api/v1/articles?page=2&per_page=2',
+    '/api/v1/articles?per_page=0',
+    '/api/v1/articles?category=news&tags=python',
+    '/api/v1/articles?fields=id,title,excerpt',
+    '/api/v1/articles?cursor=&per_page=2',
+    '/api/v1/articles/feed?per_page=2',
+    '/api/v1/articles/feed?per_page=-1',
+    '/api/v1/articles/search?q=Parity&limit=2',
+    '/api/v1/articles?fields=password',
+    '/api/v1/articles?cursor=not-a-cursor',
+])
+def test_reads_match(clients, path):
+    wsgi, asgi = clients.both('GET', path)
+
+    assert wsgi[0] in (200, 400)
+    assert asgi == wsgi
+
+
+@pytest.mark.parametrize('path', [
+    '/api/v1/articles?per_page=2',
+    '/api/v1/articles/feed?per_page=2',
+    '/api/v1/articles/search?q=Parity&limit=2',
+])
+def test_cursor_pages_match(clients, path):
+    pages = 0
+    cursor = ''
+    while cursor is not None:
+        wsgi, asgi = clients.both('GET', f'{path}&cursor={cursor}')
+        assert asgi == wsgi
+        pages += 1
+        cursor = wsgi[1].get('page_info', wsgi[1])['next_cursor']
+
+    assert pages > 1
+
+
+def test_get_article_matches(clients):
+    # Every read counts a view, so the second mode sees one more
+    wsgi = clients.wsgi('GET', '/api/v1/articles/3')
+    asgi = clients.asgi('GET', '/api/v1/articles/3')
+
+    assert asgi[0] == wsgi[0] == 200
+    assert asgi[1] == {**wsgi[1], 'views_count': wsgi[1]['views_count'] + 1}
+    assert asgi[2] == wsgi[2]
+
+    assert clients.both('GET', '/api/v1/articles/999') == (
+        (404, {'error': 'Article not found'}, None),
+        (404, {'error': 'Article not found'}, None)
+    )
+
+
+@pytest.mark.parametrize('path', ['/api/v1/articles/3', '/api/v1/articles', '/api/v1/articles/feed'])
+def test_not_modified_matches(clients, path):
+    etag = clients.wsgi('GET', path)[2]
+
+    wsgi, asgi = clients.both('GET', path, headers={'If-None-Match': etag})
+
+    assert wsgi == asgi == (304, None, etag)
+
+
+def test_writes_match(clients):
+    data = {'title': 'Written', 'content': 'Body', 'author': 'Writer', 'tags': ['a', 'b']}
+    created = clients.both('POST', '/api/v1/articles', json=data)
+    assert [status for status, _, _ in created] == [201, 201]
+    assert Clients.stable(created[0][1]) == Clients.stable(created[1][1])
+    wsgi_id, asgi_id = created[0][1]['id'], created[1][1]['id']
+
+    for method, suffix, payload in [
+        ('PATCH', '', {'category': 'updated'}),
+        ('PUT', '', {'title': 'Rewritten'}),
+        ('POST', '/publish', None),
+        ('PATCH', '', {'status': 'not-a-status'}),
+    ]:
+        wsgi = clients.wsgi(method, f'/api/v1/articles/{wsgi_id}{suffix}', json=payload)
+        asgi = clients.asgi(method, f'/api/v1/articles/{asgi_id}{suffix}', json=payload)
+        assert asgi[0] == wsgi[0], (method, suffix)
+        assert Clients.stable(asgi[1]) == Clients.stable(wsgi[1]), (method, suffix)
+
+    assert clients.wsgi('POST', '/api/v1/articles', json={'title': ''}) == \
+        clients.asgi('POST', '/api/v1/articles', json={'title': ''})
+
+    assert clients.wsgi('DELETE', f'/api/v1/articles/{wsgi_id}')[:2] == \
+        clients.asgi('DELETE', f'/api/v1/articles/{asgi_id}')[:2]
+    assert clients.wsgi('GET', f'/api/v1/articles/{wsgi_id}')[0] == \
+        clients.asgi('GET', f'/api/v1/articles/{asgi_id}')[0] == 404
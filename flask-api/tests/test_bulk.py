@@ -0,0 +1,63 @@
+from sqlalchemy import event
+
+from app.models.article import db
+
+
+def capture_statements(engine):
+    """Start recording the SQL statements run on an engine"""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', record)
+    return statements, lambda: event.remove(engine, 'before_cursor_execute', record)
+
+
+def test_bulk_create_serializes_without_reloading(app, client):
+    items = [{'title': f'Article {i}', 'content': 'Content', 'author': 'Author'} for i in range(5)]
+
+    statements, stop = capture_statements(db.engine)
+    try:
+        response = client.post('/api/v1/articles/bulk', json=items)
+    finally:
+        stop()
+
+    assert response.status_code == 201, response.json
+    assert [article['title'] for article in response.json['created']] == [item['title'] for item in items]
+    assert all(article['id'] and article['created_at'] for article in response.json['created'])
+    selects = [statement for statement in statements if statement.lstrip().upper().startswith('SELECT')]
+    assert selects == []
+
+
+def test_bulk_apply_rejects_non_object_filters(client):
+    response = client.post('/api/v1/articles/bulk/archive', json={'filters': ['draft']})
+
+    assert response.status_code == 400
+    assert 'filters' in response.json['errors']
+
+
+def test_bulk_apply_reads_dry_run_as_a_boolean(client, make_article):
+    make_article(category='legacy')
+
+    response = client.post('/api/v1/articles/bulk/archive',
+                           json={'filters': {'category': 'legacy'}, 'dry_run': 'false'})
+
+    assert response.status_code == 200
+    assert response.json['dry_run'] is False
+    assert response.json['affected'] == 1
+
+
+def test_bulk_update_to_published_publishes(app, client, make_article):
+    article = make_article(category='news')
+    staged = []
+    app.article_service._stage_events = lambda event_type, events: staged.append((event_type, events))
+
+    response = client.post('/api/v1/articles/bulk/update',
+                           json={'filters': {'category': 'news'}, 'changes': {'status': 'published'}})
+
+    assert response.status_code == 200
+    published = client.get(f"/api/v1/articles/{article['id']}").json
+    assert published['status'] == 'published'
+    assert published['published_at'] is not None
+    assert [event_type for event_type, _ in staged] == ['article.published']
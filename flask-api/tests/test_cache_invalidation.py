@@ -0,0 +1,51 @@
+import time
+from app.services.article_cache import ArticleCache
+from app.services.article_service import ArticleService
+from app.services.cache_invalidation import CacheInvalidationListener, InMemoryEventBus
+
+
+def wait_for(condition, timeout=2.0):
+    """Poll a condition until it holds or the timeout expires"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+def test_listener_evicts_articles_from_every_worker_cache(app, make_article):
+    article_id = make_article()['id']
+    bus = InMemoryEventBus()
+
+    # Two workers, each with its own cache and listener on the shared topic
+    workers = []
+    for _ in range(2):
+        service = ArticleService(article_cache=ArticleCache())
+        # Subscribed before publishing, as a consumer at the latest offset would be
+        source = bus.subscribe()
+        listener = CacheInvalidationListener(lambda source=source: source, service, poll_timeout=0.05)
+        listener.start()
+        workers.append((service, listener))
+
+    try:
+        for service, _ in workers:
+            assert service.get_article_payload(article_id)['id'] == article_id
+            assert service.article_cache.get(article_id) is not None
+
+        bus.publish({'event_type': 'article.updated', 'data': {'id': article_id}})
+
+        for service, _ in workers:
+            assert wait_for(lambda: service.article_cache.get(article_id) is None)
+    finally:
+        for _, listener in workers:
+            listener.stop()
+
+
+def test_listener_ignores_events_without_article_id(app):
+    service = ArticleService(article_cache=ArticleCache())
+    service.article_cache.set(1, {'id': 1})
+    listener = CacheInvalidationListener(InMemoryEventBus().subscribe, service)
+
+    assert listener.handle_event({'event_type': 'article.updated', 'data': {}}) is False
+    assert service.article_cache.get(1) == {'id': 1}
@@ -0,0 +1,28 @@
+import gzip
+import json
+from app.utils.compression import ResponseCompressor
+
+
+def test_compressed_article_follows_views_count(client, make_article):
+    article_id = make_article(content='Lorem ipsum dolor sit amet. ' * 100)['id']
+
+    views = []
+    for _ in range(3):
+        response = client.get(f'/api/v1/articles/{article_id}', headers={'Accept-Encoding': 'gzip'})
+        assert response.headers['Content-Encoding'] == 'gzip'
+        views.append(json.loads(gzip.decompress(response.data))['views_count'])
+
+    plain = client.get(f'/api/v1/articles/{article_id}').json
+    assert views == [0, 1, 2]
+    assert plain['views_count'] == 3
+
+
+def test_compressor_reuses_only_identical_bodies():
+    compressor = ResponseCompressor(min_size=1)
+    first = b'{"id": 1, "views_count": 0}'
+    second = b'{"id": 1, "views_count": 1}'
+
+    assert gzip.decompress(compressor.compress(first, 'gzip', cacheable=True)) == first
+    assert gzip.decompress(compressor.compress(second, 'gzip', cacheable=True)) == second
+    assert compressor.body_cache.get(compressor.body_cache.key(first, 'gzip')) is not None
+    assert len(compressor.body_cache._entries) == 2
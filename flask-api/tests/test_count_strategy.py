@@ -0,0 +1,53 @@
+from app.services.count_strategy import CachedCountStrategy
+
+
+class FakeCounts:
+    """Fallback strategy returning a fixed total and counting its calls"""
+
+    def __init__(self, total=7):
+        self.total = total
+        self.calls = 0
+
+    def count(self, query, filters=None):
+        self.calls += 1
+        return self.total, True
+
+
+def test_cached_count_is_reused_until_it_expires():
+    fallback = FakeCounts()
+    strategy = CachedCountStrategy(ttl=30, fallback=fallback)
+
+    assert strategy.count(None, {'author': 'a'}) == (7, True)
+    assert strategy.count(None, {'author': 'a'}) == (7, False)
+    assert fallback.calls == 1
+
+
+def test_expired_entries_are_evicted_on_read():
+    fallback = FakeCounts()
+    strategy = CachedCountStrategy(ttl=0, fallback=fallback)
+
+    strategy.count(None, {'author': 'a'})
+    strategy.count(None, {'author': 'a'})
+
+    assert fallback.calls == 2
+    assert len(strategy._cache) == 1
+
+
+def test_cache_keeps_the_most_recently_used_filters():
+    strategy = CachedCountStrategy(ttl=30, fallback=FakeCounts(), max_size=3)
+
+    for author in ('a', 'b', 'c'):
+        strategy.count(None, {'author': author})
+    strategy.count(None, {'author': 'a'})
+    strategy.count(None, {'author': 'd'})
+
+    assert list(strategy._cache) == [strategy._cache_key({'author': author}) for author in ('c', 'a', 'd')]
+
+
+def test_cache_size_is_bounded():
+    strategy = CachedCountStrategy(ttl=30, fallback=FakeCounts(), max_size=10)
+
+    for author in range(1000):
+        strategy.count(None, {'author': str(author)})
+
+    assert len(strategy._cache) == 10
@@ -0,0 +1,76 @@
+import logging
+
+import pytest
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.exc import OperationalError
+
+from app.models.article import Article, db
+from app.utils.db_instrumentation import instrument_engine
+
+
+@pytest.fixture
+def queries_route(app):
+    """Route running the number of article queries given in the URL"""
+    def run(count):
+        for _ in range(count):
+            db.session.execute(select(Article.id)).all()
+        return {'ran': count}
+
+    app.add_url_rule('/_test/queries/<int:count>', 'test_queries', run)
+    return '/_test/queries'
+
+
+def test_slow_queries_are_logged(caplog):
+    engine = create_engine('sqlite://')
+    instrument_engine(engine, slow_query_ms=1e-6)
+
+    with caplog.at_level(logging.WARNING, logger='app.utils.db_instrumentation'):
+        with engine.connect() as connection:
+            connection.execute(text('SELECT 1 WHERE 1 = 1'))
+
+    assert len(caplog.records) == 1
+    assert caplog.records[0].getMessage().startswith('Slow query (')
+    # Literals are normalized out of the logged statement
+    assert caplog.records[0].getMessage().endswith('SELECT ? WHERE ? = ?')
+
+
+def test_fast_queries_are_not_logged(caplog):
+    engine = create_engine('sqlite://')
+    instrument_engine(engine, slow_query_ms=10000)
+
+    with caplog.at_level(logging.WARNING, logger='app.utils.db_instrumentation'):
+        with engine.connect() as connection:
+            connection.execute(text('SELECT 1'))
+
+    assert caplog.records == []
+
+
+def test_failed_statement_leaves_no_start_time(caplog):
+    engine = create_engine('sqlite://')
+    instrument_engine(engine, slow_query_ms=10000)
+
+    with engine.connect() as connection:
+        with pytest.raises(OperationalError):
+            connection.execute(text('SELECT * FROM missing_table'))
+        connection.execute(text('SELECT 1'))
+
+        assert 'query_start_time' not in connection.info
+
+
+def test_n_plus_one_is_logged(client, queries_route, caplog):
+    with caplog.at_level(logging.WARNING, logger='app.utils.db_instrumentation'):
+        response = client.get(f'{queries_route}/11')
+
+    assert response.status_code == 200
+    warnings = [record.getMessage() for record in caplog.records if 'Possible N+1' in record.getMessage()]
+    assert warnings == [
+        f"Possible N+1: GET {queries_route}/11 ran 11 queries on table 'articles' (11 queries in total)"
+    ]
+
+
+def test_query_counts_are_per_request(client, queries_route, caplog):
+    with caplog.at_level(logging.WARNING, logger='app.utils.db_instrumentation'):
+        client.get(f'{queries_route}/6')
+        client.get(f'{queries_route}/6')
+
+    assert not any('Possible N+1' in record.getMessage() for record in caplog.records)
@@ -0,0 +1,44 @@
+import json
+from datetime import datetime
+import pytest
+from app.models.article import Article, ArticleStatus, db
+from app.schemas.article_schema import ArticleResponseSchema, ArticleSummarySchema
+from app.schemas.fast_serializer import SPARSE_FIELDS, dumps, get_serializer, serialize_articles
+
+
+@pytest.fixture
+def articles(app):
+    """Articles covering empty, missing and non-ASCII values"""
+    db.session.add_all([
+        Article(title='Introduction à Flask', content='Contenu ' * 60, author='Zoé', category='tech',
+                tags=['python', 'flask'], status=ArticleStatus.published, views_count=12,
+                created_at=datetime(2024, 1, 15, 10, 30, 0, 123456),
+                updated_at=datetime(2024, 1, 16, 8, 0), published_at=datetime(2024, 1, 16, 8, 0)),
+        Article(title='Draft', content='x', author='a', category=None, tags=[],
+                status=ArticleStatus.draft, created_at=datetime(2024, 2, 1)),
+        Article(title='Archived', content='"quoted" \\ text\n', author='b', tags=None,
+                status=ArticleStatus.archived, views_count=0, created_at=datetime(2024, 3, 1)),
+    ])
+    db.session.commit()
+    db.session.expire_all()
+    return Article.query.order_by(Article.id).all()
+
+
+def test_full_shape_matches_marshmallow(articles):
+    assert serialize_articles(articles) == ArticleResponseSchema(many=True).dump(articles)
+
+
+@pytest.mark.parametrize('fields', [
+    ['id', 'title'],
+    ['id', 'title', 'excerpt', 'published_at'],
+    sorted(SPARSE_FIELDS),
+])
+def test_sparse_fieldsets_match_marshmallow(articles, fields):
+    expected = ArticleSummarySchema(only=fields, many=True).dump(articles)
+    assert get_serializer(fields).serialize_many(articles) == expected
+
+
+def test_dumps_matches_json(articles):
+    payload = {'items': serialize_articles(articles), 'page_info': {'has_next': False, 'next_cursor': None}}
+    assert json.loads(dumps(payload)) == json.loads(json.dumps(payload))
+    assert dumps(payload).decode('utf-8').startswith('{"items":[{"author":"Zoé"')
@@ -0,0 +1,68 @@
+import os
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+
+from app.models.article import Article
+from app.utils.pagination import encode_cursor
+from app.utils.query_plan import describe, explain, uses_index
+
+# PostgreSQL database to plan on; nothing is written to it
+TEST_DATABASE_URL = os.getenv('TEST_DATABASE_URL', '')
+
+INDEX_NAME = 'idx_articles_published_at'
+
+
+def feed_cases():
+    now = datetime.utcnow()
+    return {
+        'first page': ({}, ''),
+        'following page': ({}, encode_cursor({'published_at': now - timedelta(days=3), 'id': 1000})),
+        'publication range': ({
+            'published_after': (now - timedelta(days=30)).isoformat(),
+            'published_before': (now - timedelta(days=7)).isoformat()
+        }, ''),
+        'category and created_after': ({
+            'category': 'technology',
+            'created_after': (now - timedelta(days=90)).isoformat()
+        }, ''),
+    }
+
+
+@pytest.fixture
+def postgresql():
+    """Connection with the articles table in a scratch schema, rolled back at the end"""
+    if not TEST_DATABASE_URL.startswith('postgresql'):
+        pytest.skip('TEST_DATABASE_URL does not point to a PostgreSQL database')
+
+    engine = create_engine(TEST_DATABASE_URL)
+    try:
+        connection = engine.connect()
+    except OperationalError as e:
+        engine.dispose()
+        pytest.skip(f'PostgreSQL unavailable: {e}')
+
+    try:
+        # DDL is transactional: the schema and the table go with the rollback
+        connection.exec_driver_sql('CREATE SCHEMA feed_plan_check')
+        connection.exec_driver_sql('SET LOCAL search_path TO feed_plan_check')
+        Article.__table__.create(connection)
+        # Plans that do not depend on the (empty) table size
+        connection.exec_driver_sql('SET LOCAL enable_seqscan = off')
+        connection.exec_driver_sql('SET LOCAL enable_bitmapscan = off')
+        yield connection
+    finally:
+        connection.rollback()
+        connection.close()
+        engine.dispose()
+
+
+@pytest.mark.parametrize('case', list(feed_cases()))
+def test_feed_queries_can_use_the_published_at_index(service, postgresql, case):
+    filters, cursor = feed_cases()[case]
+
+    plan = explain(postgresql, service._feed_statement(10, filters, cursor))
+
+    assert uses_index(plan, INDEX_NAME), describe(plan)
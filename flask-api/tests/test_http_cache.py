@@ -0,0 +1,56 @@
+def test_article_etag_is_weak_and_revalidates(client, make_article):
+    article_id = make_article()['id']
+
+    response = client.get(f'/api/v1/articles/{article_id}')
+    etag = response.headers['ETag']
+    assert etag.startswith('W/"')
+
+    # Views moved views_count but not updated_at: still equivalent
+    client.get(f'/api/v1/articles/{article_id}')
+    revalidated = client.get(f'/api/v1/articles/{article_id}', headers={'If-None-Match': etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers['ETag'] == etag
+
+
+def test_article_etag_changes_with_the_article(client, make_article):
+    article_id = make_article()['id']
+    etag = client.get(f'/api/v1/articles/{article_id}').headers['ETag']
+
+    client.patch(f'/api/v1/articles/{article_id}', json={'title': 'New title'})
+
+    response = client.get(f'/api/v1/articles/{article_id}', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.json['title'] == 'New title'
+    assert response.headers['ETag'] != etag
+
+
+def test_list_etag_is_weak(client, make_article):
+    make_article()
+
+    response = client.get('/api/v1/articles')
+    assert response.headers['ETag'].startswith('W/"')
+
+    revalidated = client.get('/api/v1/articles', headers={'If-None-Match': response.headers['ETag']})
+    assert revalidated.status_code == 304
+
+
+def test_list_revalidates_on_the_etag_only(client, make_article):
+    make_article(title='Kept')
+    deleted = make_article(title='Deleted')
+
+    response = client.get('/api/v1/articles')
+    assert 'Last-Modified' not in response.headers
+    etag = response.headers['ETag']
+
+    client.delete(f"/api/v1/articles/{deleted['id']}")
+
+    # The remaining item is unchanged, but the page lost one
+    response = client.get('/api/v1/articles', headers={
+        'If-None-Match': etag,
+        'If-Modified-Since': 'Fri, 01 Jan 2100 00:00:00 GMT'
+    })
+    assert response.status_code == 200
+    assert [article['title'] for article in response.json['items']] == ['Kept']
+    assert client.get('/api/v1/articles', headers={
+        'If-Modified-Since': 'Fri, 01 Jan 2100 00:00:00 GMT'
+    }).status_code == 200
@@ -0,0 +1,101 @@
+from app.models.article import db
+from app.models.outbox import OutboxEvent
+from app.services.kafka_producer import KafkaProducerService
+from app.services.outbox_relay import OutboxRelay
+
+
+class FakeProducer:
+    """Producer recording the events it is asked to send"""
+
+    build_event = staticmethod(KafkaProducerService.build_event)
+
+    def __init__(self, fail_on=()):
+        self.fail_on = set(fail_on)
+        self.batches = []
+
+    def send_events(self, events, timeout=10):
+        self.batches.append(events)
+        return [
+            (event['event_type'], event['data']['id']) not in self.fail_on
+            for event in events
+        ]
+
+    def sent(self):
+        return [(event['event_type'], event['data']['id']) for batch in self.batches for event in batch]
+
+
+def make_relay(app, producer, **options):
+    relay = OutboxRelay(producer, **options)
+    relay.init_app(app)
+    return relay
+
+
+def add_events(*events):
+    for event_type, article_id in events:
+        db.session.add(OutboxEvent(event_type=event_type, aggregate_id=article_id,
+                                   payload={'id': article_id}))
+    db.session.commit()
+
+
+def remaining():
+    db.session.expire_all()
+    return [(row.event_type, row.aggregate_id) for row in OutboxEvent.query.order_by(OutboxEvent.id)]
+
+
+def test_relay_sends_events_in_outbox_order(app):
+    events = [('article.created', 1), ('article.created', 2), ('article.published', 1), ('article.deleted', 2)]
+    add_events(*events)
+    producer = FakeProducer()
+
+    assert make_relay(app, producer).relay() == 4
+
+    assert producer.sent() == events
+    assert remaining() == []
+
+
+def test_relay_sends_in_batches(app):
+    add_events(*[('article.created', article_id) for article_id in range(1, 6)])
+    producer = FakeProducer()
+    relay = make_relay(app, producer, batch_size=2)
+
+    while relay.relay():
+        pass
+
+    assert [len(batch) for batch in producer.batches] == [2, 2, 1]
+    assert producer.sent() == [('article.created', article_id) for article_id in range(1, 6)]
+
+
+def test_relay_stops_at_the_first_failed_event(app):
+    add_events(('article.created', 1), ('article.created', 2), ('article.created', 3), ('article.created', 4))
+    producer = FakeProducer(fail_on={('article.created', 2)})
+
+    assert make_relay(app, producer).relay() == 1
+
+    # Event 3 was acknowledged but stays behind the failed one to keep the order
+    assert remaining() == [('article.created', 2), ('article.created', 3), ('article.created', 4)]
+
+    producer.fail_on.clear()
+    assert make_relay(app, producer).relay() == 3
+    assert remaining() == []
+
+
+def test_relay_coalesces_superseded_updates(app):
+    add_events(('article.updated', 1), ('article.updated', 2), ('article.updated', 1),
+               ('article.created', 2), ('article.deleted', 1))
+    producer = FakeProducer()
+
+    assert make_relay(app, producer).relay() == 5
+
+    # Both updates of article 1 are replaced by its deletion; a create does
+    # not supersede the update of article 2
+    assert producer.sent() == [('article.updated', 2), ('article.created', 2), ('article.deleted', 1)]
+    assert remaining() == []
+
+
+def test_relay_keeps_coalesced_events_behind_a_failure(app):
+    add_events(('article.created', 1), ('article.updated', 2), ('article.updated', 2))
+    producer = FakeProducer(fail_on={('article.created', 1)})
+
+    assert make_relay(app, producer).relay() == 0
+
+    assert remaining() == [('article.created', 1), ('article.updated', 2), ('article.updated', 2)]
@@ -0,0 +1,98 @@
+from datetime import datetime
+import pytest
+from app.utils.pagination import InvalidCursorError, decode_cursor, encode_cursor
+
+KEYSET = {'created_at': datetime, 'id': int}
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2024, 1, 15, 10, 30)
+    cursor = encode_cursor({'created_at': created_at, 'id': 42})
+    assert decode_cursor(cursor, KEYSET) == {'created_at': created_at, 'id': 42}
+
+
+@pytest.mark.parametrize('values', [
+    {'created_at': '2024-01-15T10:30:00'},
+    {'created_at': '2024-01-15T10:30:00', 'id': 'x'},
+    {'created_at': '2024-01-15T10:30:00', 'id': True},
+    {'created_at': '2024-01-15T10:30:00', 'id': 1.5},
+    {'created_at': 'yesterday', 'id': 1},
+    {'created_at': None, 'id': 1},
+])
+def test_cursor_with_wrong_shape_is_rejected(values):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(encode_cursor(values), KEYSET)
+
+
+@pytest.mark.parametrize('cursor', ['not base64!', 'WzEsMl0', '', 'eyJpZCI6'])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, KEYSET)
+
+
+@pytest.mark.parametrize('path', ['/api/v1/articles', '/api/v1/articles/feed'])
+def test_list_rejects_cursor_without_id(client, make_article, path):
+    make_article()
+    cursor = encode_cursor({'created_at': datetime.utcnow(), 'published_at': datetime.utcnow()})
+
+    response = client.get(f'{path}?cursor={cursor}')
+
+    assert response.status_code == 400
+    assert response.json == {'error': 'Invalid cursor'}
+
+
+def test_keyset_pages_cover_every_article(client, make_article):
+    created = {make_article(title=f'Article {i}')['id'] for i in range(5)}
+
+    seen, cursor = [], ''
+    while cursor is not None:
+        page = client.get(f'/api/v1/articles?per_page=2&cursor={cursor}').json
+        seen.extend(item['id'] for item in page['items'])
+        cursor = page['page_info']['next_cursor']
+
+    assert sorted(seen) == sorted(created)
+    assert len(seen) == len(created)
+
+
+@pytest.mark.parametrize('per_page', [0, -5])
+def test_list_clamps_per_page_to_one(client, make_article, per_page):
+    make_article(title='First')
+    make_article(title='Second')
+
+    response = client.get(f'/api/v1/articles?per_page={per_page}')
+
+    assert response.status_code == 200
+    assert len(response.json['items']) == 1
+    assert response.json['page_info']['per_page'] == 1
+    assert response.json['page_info']['total_pages'] == 2
+
+
+def test_keyset_page_accepts_empty_page(client, make_article):
+    make_article(title='Only')
+
+    response = client.get('/api/v1/articles?per_page=0&cursor=')
+
+    assert response.status_code == 200
+    assert len(response.json['items']) == 1
+
+
+def test_keyset_page_without_rows_has_no_cursor(app):
+    articles, page_info = app.article_service._keyset_page([object()], 0)
+
+    assert articles == []
+    assert page_info['has_next'] is False
+    assert page_info['next_cursor'] is None
+
+
+@pytest.mark.parametrize('per_page', [0, -5])
+def test_feed_clamps_per_page_to_one(client, make_article, per_page):
+    for title in ('First', 'Second'):
+        article = make_article(title=title)
+        client.post(f"/api/v1/articles/{article['id']}/publish")
+
+    response = client.get(f'/api/v1/articles/feed?per_page={per_page}')
+
+    assert response.status_code == 200
+    assert len(response.json['items']) == 1
+    assert response.json['page_info']['per_page'] == 1
+    assert response.json['page_info']['has_next'] is True
@@ -0,0 +1,57 @@
+import pytest
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.models.article import Article, db
+
+
+class FakeRouter:
+    """Router sending every read to the given replica session"""
+
+    def __init__(self, session):
+        self.session = session
+
+    def read_session(self):
+        return self.session
+
+
+@pytest.fixture
+def replica(app, make_article):
+    """Replica holding the articles as of their last event, views at zero"""
+    engine = create_engine('sqlite://', poolclass=StaticPool)
+    db.metadata.create_all(engine)
+    session = Session(engine)
+
+    article = make_article(title='Replicated')
+    session.add(Article(**{
+        column.name: getattr(db.session.get(Article, article['id']), column.name)
+        for column in Article.__table__.columns
+    }))
+    session.commit()
+
+    app.article_service.replica_router = FakeRouter(session)
+    yield article
+
+    session.close()
+    engine.dispose()
+
+
+def test_list_reads_views_from_the_primary(client, replica):
+    db.session.execute(update(Article).where(Article.id == replica['id']).values(views_count=7))
+    db.session.commit()
+
+    for path in ['/api/v1/articles', '/api/v1/articles?cursor=', '/api/v1/articles/search?q=Replicated']:
+        response = client.get(path)
+        items = response.json.get('items', response.json.get('results'))
+        assert [(article['title'], article['views_count']) for article in items] == [('Replicated', 7)], path
+
+
+def test_list_without_views_skips_the_primary(client, replica, statements):
+    statements.clear()
+
+    response = client.get('/api/v1/articles?fields=id,title')
+
+    assert response.json['items'] == [{'id': replica['id'], 'title': 'Replicated'}]
+    # The primary is not asked for view counts the response does not show
+    assert not any('views_count' in statement for statement in statements)
@@ -0,0 +1,39 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+from app.utils.pagination import encode_cursor
+
+
+def test_search_pages_cover_every_match(client, make_article):
+    matches = {make_article(title=f'Flask tips {i}')['id'] for i in range(5)}
+    make_article(title='Unrelated')
+
+    seen, cursor = [], ''
+    while cursor is not None:
+        page = client.get(f'/api/v1/articles/search?q=flask&limit=2&cursor={cursor}').json
+        assert page['count'] == 5
+        seen.extend(item['id'] for item in page['results'])
+        cursor = page['next_cursor']
+
+    assert sorted(seen) == sorted(matches)
+    assert len(seen) == len(matches)
+
+
+@pytest.mark.parametrize('values', [{}, {'id': 'x'}, {'rank': 0.5}])
+def test_search_rejects_malformed_cursor(client, make_article, values):
+    make_article(title='Flask tips')
+
+    response = client.get(f'/api/v1/articles/search?q=flask&cursor={encode_cursor(values)}')
+
+    assert response.status_code == 400
+    assert response.json == {'error': 'Invalid cursor'}
+
+
+def test_rank_cursor_compares_ranks_as_real(service):
+    _, rank = service._fulltext_clauses('flask')
+    condition = service._rank_seek_condition(rank, encode_cursor({'rank': 0.0607927, 'id': 3}))
+
+    sql = str(condition.compile(dialect=postgresql.dialect()))
+
+    # ts_rank is real: a float8 bound value would never equal the last rank
+    assert sql.count('CAST(%(param_1)s AS REAL)') == 2
+    assert 'articles.id < %(id_1)s' in sql
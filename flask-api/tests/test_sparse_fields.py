@@ -0,0 +1,65 @@
+import pytest
+
+from app.models.article import EXCERPT_LENGTH
+
+
+def selects(statements):
+    return [statement for statement in statements if statement.lstrip().upper().startswith('SELECT')]
+
+
+@pytest.mark.parametrize('path', ['/api/v1/articles', '/api/v1/articles?cursor=', '/api/v1/articles/feed'])
+def test_fields_limit_the_output(client, make_article, path):
+    article = make_article(title='Sparse')
+    client.post(f"/api/v1/articles/{article['id']}/publish")
+
+    response = client.get(f'{path}{"&" if "?" in path else "?"}fields=id,title')
+
+    assert response.status_code == 200
+    assert [set(article) for article in response.json['items']] == [{'id', 'title'}]
+
+
+def test_fields_limit_the_loaded_columns(client, make_article, statements):
+    make_article(content='Body ' * 100)
+    statements.clear()
+
+    response = client.get('/api/v1/articles?fields=id,title')
+
+    assert response.status_code == 200
+    page = selects(statements)[0]
+    assert 'articles.title' in page
+    assert 'articles.content' not in page
+    assert 'articles.author' not in page
+    assert 'substr' not in page.lower()
+
+
+def test_excerpt_is_computed_in_sql(client, make_article, statements):
+    content = 'x' * (EXCERPT_LENGTH + 50)
+    make_article(content=content)
+    statements.clear()
+
+    response = client.get('/api/v1/articles?fields=id,excerpt')
+
+    assert response.status_code == 200
+    assert response.json['items'] == [{'id': response.json['items'][0]['id'], 'excerpt': content[:EXCERPT_LENGTH]}]
+    page = selects(statements)[0]
+    assert 'substr' in page.lower()
+    assert 'articles.content AS' not in page
+
+
+def test_excerpt_is_deferred_without_fields(client, make_article, statements):
+    make_article()
+    statements.clear()
+
+    response = client.get('/api/v1/articles')
+
+    assert response.status_code == 200
+    assert 'excerpt' not in response.json['items'][0]
+    assert 'substr' not in selects(statements)[0].lower()
+
+
+@pytest.mark.parametrize('path', ['/api/v1/articles', '/api/v1/articles/feed', '/api/v1/articles/search?q=a'])
+def test_unknown_fields_are_rejected(client, path):
+    response = client.get(f'{path}{"&" if "?" in path else "?"}fields=id,password,secret')
+
+    assert response.status_code == 400
+    assert response.json['error'] == 'Unknown fields: password, secret'
@@ -0,0 +1,82 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.models.article import Article, TagsMatch
+
+
+@pytest.fixture
+def tagged(make_article):
+    """Articles titled after their tags"""
+    for tags in (['python'], ['python', 'flask'], ['rust'], []):
+        make_article(title='+'.join(tags) or 'untagged', tags=tags)
+
+
+def titles(response):
+    assert response.status_code == 200, response.json
+    return sorted(article['title'] for article in response.json['items'])
+
+
+@pytest.mark.parametrize('query, expected', [
+    ('tags=python', ['python', 'python+flask']),
+    ('tags=python,flask', ['python+flask']),
+    ('tags=python,rust', []),
+    ('any_tags=python,rust', ['python', 'python+flask', 'rust']),
+    ('any_tags=go', []),
+    ('tags=python&any_tags=flask,rust', ['python+flask']),
+    ('tags= python , ,python', ['python', 'python+flask']),
+])
+def test_list_filters_on_tags(client, tagged, query, expected):
+    assert titles(client.get(f'/api/v1/articles?{query}')) == expected
+    assert titles(client.get(f'/api/v1/articles?cursor=&{query}')) == expected
+
+
+@pytest.mark.parametrize('query', ['tags=', 'tags=,,', 'any_tags= , '])
+def test_list_ignores_blank_tag_lists(client, tagged, query):
+    assert titles(client.get(f'/api/v1/articles?{query}')) == ['python', 'python+flask', 'rust', 'untagged']
+
+
+def test_feed_filters_on_tags(client, make_article):
+    for tags in (['python'], ['rust']):
+        article = make_article(title=tags[0], tags=tags)
+        client.post(f"/api/v1/articles/{article['id']}/publish")
+
+    assert titles(client.get('/api/v1/articles/feed?any_tags=rust,go')) == ['rust']
+
+
+def test_bulk_filters_reject_blank_tag_lists(client, tagged):
+    response = client.post('/api/v1/articles/bulk/archive', json={'filters': {'tags': ' , '}, 'dry_run': True})
+
+    assert response.status_code == 400
+
+
+def test_bulk_filters_on_any_tags(client, tagged):
+    response = client.post('/api/v1/articles/bulk/archive',
+                           json={'filters': {'any_tags': ['flask', 'rust']}, 'dry_run': True})
+
+    assert response.status_code == 200
+    assert response.json['affected'] == 2
+
+
+def compile_condition(condition, dialect):
+    return str(select(Article.id).where(condition).compile(dialect=dialect))
+
+
+def test_tags_match_compiles_to_json_each_on_sqlite():
+    all_of = compile_condition(TagsMatch(Article.tags, ['a', 'b']), sqlite.dialect())
+    any_of = compile_condition(TagsMatch(Article.tags, ['a', 'b'], match_any=True), sqlite.dialect())
+
+    # One correlated lookup per tag for all-of, a single IN for any-of
+    assert all_of.count('json_each(articles.tags)') == 2
+    assert 'IN (' not in all_of
+    assert any_of.count('json_each(articles.tags)') == 1
+    assert 'IN (__[POSTCOMPILE_value_1])' in any_of
+
+
+def test_tags_match_compiles_to_jsonb_operators_on_postgresql():
+    all_of = compile_condition(TagsMatch(Article.tags, ['a', 'b']), postgresql.dialect())
+    any_of = compile_condition(TagsMatch(Article.tags, ['a', 'b'], match_any=True), postgresql.dialect())
+
+    assert 'articles.tags @> ' in all_of
+    assert 'articles.tags ?| ARRAY[' in any_of
+    assert 'json_each' not in all_of + any_of
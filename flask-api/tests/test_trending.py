@@ -0,0 +1,48 @@
+from datetime import datetime
+
+import pytest
+
+from app.models.article import db
+from app.models.views import ArticleViewBucket
+from app.services.trending import TrendingRanking, bucket_start
+
+
+def make_ranking(app):
+    ranking = TrendingRanking(windows=('24h',), top_k=5, refresh_interval=60, bucket_seconds=3600)
+    ranking.init_app(app)
+    return ranking
+
+
+@pytest.fixture
+def viewed_article(client, make_article):
+    article = make_article(category='news')
+    client.post(f"/api/v1/articles/{article['id']}/publish")
+    db.session.add(ArticleViewBucket(article_id=article['id'], bucket_start=bucket_start(datetime.utcnow(), 3600),
+                                     views=7))
+    db.session.commit()
+    return article
+
+
+def test_requests_get_an_empty_ranking_before_the_first_refresh(app, viewed_article):
+    ranking = make_ranking(app)
+
+    result = ranking.get('24h')
+
+    assert result['items'] == []
+    assert result['refreshed_at'] is None
+
+
+def test_other_workers_load_the_stored_rankings(app, viewed_article):
+    refresher = make_ranking(app)
+    refresher.refresh()
+
+    worker = make_ranking(app)
+    worker._compute = lambda connection, now: pytest.fail('the rankings are fresh: load them')
+    worker.refresh()
+
+    for sort in ('trending', 'views'):
+        for category in (None, 'news'):
+            expected = refresher.get('24h', category=category, sort=sort)
+            assert worker.get('24h', category=category, sort=sort) == expected
+            assert [item['id'] for item in expected['items']] == [viewed_article['id']]
+    assert worker.get('24h', sort='views')['items'][0]['window_views'] == 7
@@ -0,0 +1,105 @@
+from app.models.article import Article, db
+from app.services.view_counter import ViewCounter
+
+
+def make_counter(app, **options):
+    counter = ViewCounter(**options)
+    counter.init_app(app)
+    return counter
+
+
+def views_count(article_id):
+    db.session.expire_all()
+    return db.session.get(Article, article_id).views_count
+
+
+def test_flush_writes_views_in_one_batch(app, make_article):
+    first, second = make_article(title='First'), make_article(title='Second')
+    counter = make_counter(app)
+    batches = []
+    write_batch = counter._write_batch
+    counter._write_batch = lambda batch: (batches.append(dict(batch)), write_batch(batch))
+
+    for _ in range(3):
+        counter.record(first['id'])
+    counter.record(second['id'], count=2)
+
+    assert counter.flush() == 5
+    assert batches == [{first['id']: 3, second['id']: 2}]
+    assert views_count(first['id']) == 3
+    assert views_count(second['id']) == 2
+    assert counter.pending(first['id']) == 0
+    assert counter.flush() == 0
+
+
+def test_flush_keeps_updated_at(app, make_article):
+    article = make_article()
+    updated_at = db.session.get(Article, article['id']).updated_at
+    counter = make_counter(app)
+
+    counter.record(article['id'])
+    counter.flush()
+
+    db.session.expire_all()
+    assert db.session.get(Article, article['id']).updated_at == updated_at
+
+
+def test_record_drops_new_articles_when_full(app):
+    counter = make_counter(app, max_pending=2)
+
+    assert counter.record(1)
+    assert counter.record(2)
+    assert not counter.record(3)
+    # Articles already pending are still counted
+    assert counter.record(1)
+    assert counter.pending(1) == 2
+    assert counter.pending(3) == 0
+
+
+def test_failed_flush_requeues_up_to_max_pending(app):
+    counter = make_counter(app, max_pending=3)
+
+    def fail(batch):
+        # New views arrive while the batch is being written
+        counter.record(10)
+        counter.record(11)
+        raise RuntimeError('database unavailable')
+
+    counter._write_batch = fail
+    counter.record(1, count=4)
+    counter.record(2, count=5)
+
+    assert counter.flush() == 0
+    # Article 1 fits back under the bound, article 2 is dropped
+    assert counter.pending(10) == 1
+    assert counter.pending(11) == 1
+    assert counter.pending(1) == 4
+    assert counter.pending(2) == 0
+
+
+def test_failed_flush_merges_with_pending_views(app):
+    counter = make_counter(app)
+
+    def fail(batch):
+        counter.record(1)
+        raise RuntimeError('database unavailable')
+
+    counter._write_batch = fail
+    counter.record(1, count=2)
+    counter.flush()
+
+    assert counter.pending(1) == 3
+    assert counter._pending_total == 3
+
+
+def test_stop_flushes_pending_views(app, make_article):
+    article = make_article()
+    counter = make_counter(app, flush_interval=60)
+    counter.start()
+
+    counter.record(article['id'], count=4)
+    counter.stop()
+
+    assert not counter._thread.is_alive()
+    assert counter.pending(article['id']) == 0
+    assert views_count(article['id']) == 4
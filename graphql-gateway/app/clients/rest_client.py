@@ -1,10 +1,15 @@
 import httpx
 import logging
+from contextvars import ContextVar
 from typing import Optional, Dict, List
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 logger = logging.getLogger(__name__)
 
+# X-Forwarded-For of the GraphQL request being resolved, sent with the REST
+# calls so that the API rate limits the gateway's clients, not the gateway
+forwarded_for: ContextVar[Optional[str]] = ContextVar('forwarded_for', default=None)
+
 
 class RestApiError(Exception):
     """Custom exception for REST API errors"""
@@ -67,11 +72,13 @@ class RestApiClient:
         try:
             logger.debug(f"{method} {url} - params: {params}, json: {json}")
 
+            client_chain = forwarded_for.get()
             response = await self.client.request(
                 method=method,
                 url=url,
                 params=params,
-                json=json
+                json=json,
+                headers={'X-Forwarded-For': client_chain} if client_chain else None
             )
 
             # Check for HTTP errors
@@ -206,15 +213,17 @@ class RestApiClient:
                 return None
             raise
 
-    async def search_articles(self, query: str) -> List[Dict]:
+    async def search_articles(self, query: str, limit: int = 20) -> List[Dict]:
         """
         Search articles
 
         Args:
             query: Search query
+            limit: Maximum number of results
 
         Returns:
             List of matching articles
         """
-        result = await self._make_request('GET', '/api/v1/articles/search', params={'q': query})
+        params = {'q': query, 'limit': limit}
+        result = await self._make_request('GET', '/api/v1/articles/search', params=params)
         return result.get('results', [])
@@ -96,6 +96,13 @@ async def get_articles(page: int, per_page: int, filter_input):
                 filters['category'] = filter_input.category
             if filter_input.author:
                 filters['author'] = filter_input.author
+            if filter_input.tags:
+                filters['tags'] = ','.join(filter_input.tags)
+            if filter_input.any_tags:
+                filters['any_tags'] = ','.join(filter_input.any_tags)
+            for key in ('published_after', 'published_before', 'created_after'):
+                if getattr(filter_input, key):
+                    filters[key] = getattr(filter_input, key).isoformat()
 
         # Fetch from REST API
         data = await rest_client.list_articles(page=page, per_page=per_page, filters=filters)
@@ -111,7 +118,8 @@ async def get_articles(page: int, per_page: int, filter_input):
             per_page=page_info_data.get('per_page', per_page),
             total_items=page_info_data.get('total_items', 0),
             has_next=page_info_data.get('has_next', False),
-            has_prev=page_info_data.get('has_prev', False)
+            has_prev=page_info_data.get('has_prev', False),
+            total_exact=page_info_data.get('total_exact', True)
         )
 
         return ArticleConnection(items=articles, page_info=page_info)
@@ -121,18 +129,19 @@ async def get_articles(page: int, per_page: int, filter_input):
         raise Exception(f"Failed to fetch articles: {e.message}")
 
 
-async def search_articles(query: str):
+async def search_articles(query: str, limit: int = 20):
     """
     Search articles by query string
 
     Args:
         query: Search query
+        limit: Maximum number of results
 
     Returns:
         List of matching articles
     """
     try:
-        results = await rest_client.search_articles(query)
+        results = await rest_client.search_articles(query, limit=limit)
         return [_parse_article(item) for item in results]
 
     except RestApiError as e:
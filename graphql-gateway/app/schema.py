@@ -48,6 +48,7 @@ class PageInfo:
     total_items: int
     has_next: bool
     has_prev: bool
+    total_exact: bool = True
 
 
 @strawberry.type
@@ -84,6 +85,13 @@ class ArticleFilterInput:
     status: Optional[ArticleStatus] = None
     category: Optional[str] = None
     author: Optional[str] = None
+    # Articles having all of tags, and at least one of any_tags
+    tags: Optional[List[str]] = None
+    any_tags: Optional[List[str]] = None
+    # Publication and creation date ranges (after inclusive, before exclusive)
+    published_after: Optional[datetime] = None
+    published_before: Optional[datetime] = None
+    created_after: Optional[datetime] = None
 
 
 @strawberry.type
@@ -124,17 +132,18 @@ class Query:
         return await get_articles(page, per_page, filter)
 
     @strawberry.field
-    async def search_articles(self, query: str) -> List[Article]:
+    async def search_articles(self, query: str, limit: int = 20) -> List[Article]:
         """
         Search articles by query string
 
         Args:
             query: Search query
+            limit: Maximum number of results (default: 20, max: 100)
 
         Returns:
             List of matching articles
         """
-        return await search_articles(query)
+        return await search_articles(query, limit)
 
 
 @strawberry.type
@@ -1,7 +1,8 @@
 import os
 import logging
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from strawberry.fastapi import GraphQLRouter
+from app.clients.rest_client import forwarded_for
 from app.schema import schema
 
 # Configure logging
@@ -18,6 +19,18 @@ app = FastAPI(
     version="1.0.0"
 )
 
+
+@app.middleware("http")
+async def forward_client_address(request: Request, call_next):
+    """Pass the caller's address on to the REST API calls made for this request"""
+    hops = [request.headers.get('x-forwarded-for'), request.client.host if request.client else None]
+    token = forwarded_for.set(', '.join(hop for hop in hops if hop) or None)
+    try:
+        return await call_next(request)
+    finally:
+        forwarded_for.reset(token)
+
+
 # Create GraphQL router
 graphql_router = GraphQLRouter(schema, path="/graphql")
 
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark of the sync (WSGI) and async (ASGI) serving modes
+
+Starts the API twice with gunicorn and the same number of workers, once with
+the default sync workers ("app:create_app()") and once with uvicorn workers
+("app.asgi:create_asgi_app()"), seeds a few articles through the API and
+drives both with the same concurrent mix of reads. Requests per second and
+latency percentiles are printed for each mode.
+
+The database in DATABASE_URL is shared by both runs (the docker-compose
+PostgreSQL on localhost:5432 by default). Kafka does not need to be up:
+events then wait in the outbox.
+
+Usage (from the repository root):
+    python scripts/bench_asgi.py [--workers 4] [--concurrency 64] [--duration 20]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import signal
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+FLASK_API = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'flask-api')
+
+MODES = {
+    'sync (gunicorn sync)': ['app:create_app()'],
+    'async (uvicorn)': ['-k', 'uvicorn.workers.UvicornWorker', 'app.asgi:create_asgi_app()'],
+}
+
+
+def start_server(args, app_args, port):
+    """Start gunicorn for one mode and wait until it answers"""
+    env = dict(os.environ, GUNICORN_BIND=f'127.0.0.1:{port}', GUNICORN_WORKERS=str(args.workers))
+    env.pop('PROMETHEUS_MULTIPROC_DIR', None)
+    process = subprocess.Popen(
+        ['gunicorn', '-c', 'gunicorn.conf.py', *app_args],
+        cwd=FLASK_API, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f'http://127.0.0.1:{port}/api/v1/health', timeout=1).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            pass
+        if process.poll() is not None:
+            sys.exit(f'gunicorn exited with code {process.returncode}')
+        time.sleep(0.5)
+
+    process.kill()
+    sys.exit('Server did not start within 60s')
+
+
+def stop_server(process):
+    """Stop gunicorn gracefully"""
+    process.send_signal(signal.SIGTERM)
+    try:
+        process.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+def seed(base_url, count):
+    """Create articles to read and return their ids"""
+    ids = []
+    with httpx.Client(base_url=base_url, timeout=10) as client:
+        for i in range(count):
+            response = client.post('/api/v1/articles', json={
+                'title': f'Benchmark article {i}',
+                'content': 'Lorem ipsum dolor sit amet, consectetur adipiscing elit. ' * 40,
+                'author': 'Jane Doe',
+                'category': random.choice(['technology', 'science', 'sports']),
+                'tags': ['benchmark']
+            })
+            response.raise_for_status()
+            ids.append(response.json()['id'])
+    return ids
+
+
+def request_mix(ids):
+    """Pick the next request: mostly single reads, some lists and searches"""
+    roll = random.random()
+    if roll < 0.6:
+        return f'/api/v1/articles/{random.choice(ids)}'
+    if roll < 0.85:
+        return f'/api/v1/articles?per_page=20&page={random.randint(1, 5)}'
+    if roll < 0.95:
+        return '/api/v1/articles?per_page=20&cursor=&fields=id,title,excerpt'
+    return '/api/v1/articles/search?q=lorem&limit=10'
+
+
+async def drive(base_url, ids, concurrency, duration):
+    """Send requests from concurrent clients and collect latencies"""
+    latencies = []
+    errors = 0
+    deadline = time.monotonic() + duration
+
+    async def client_loop(client):
+        nonlocal errors
+        while time.monotonic() < deadline:
+            started = time.perf_counter()
+            try:
+                response = await client.get(request_mix(ids))
+                if response.status_code >= 500:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        started = time.monotonic()
+        await asyncio.gather(*(client_loop(client) for _ in range(concurrency)))
+        elapsed = time.monotonic() - started
+
+    return latencies, errors, elapsed
+
+
+def report(name, latencies, errors, elapsed):
+    """Print throughput and latency percentiles"""
+    if not latencies:
+        print(f'{name:<26} no successful requests ({errors} errors)')
+        return
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f'{name:<26} {len(latencies) / elapsed:8.0f} req/s  '
+        f'p50 {quantiles[49] * 1000:7.1f} ms  p99 {quantiles[98] * 1000:7.1f} ms  '
+        f'errors {errors}'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, default=4, help='gunicorn workers for both modes')
+    parser.add_argument('--concurrency', type=int, default=64, help='Concurrent client connections')
+    parser.add_argument('--duration', type=float, default=20, help='Seconds of load per mode')
+    parser.add_argument('--articles', type=int, default=200, help='Articles seeded before the runs')
+    parser.add_argument('--port', type=int, default=5050, help='First port used by the servers')
+    args = parser.parse_args()
+
+    print(f'{args.workers} workers, {args.concurrency} connections, {args.duration:.0f}s per mode')
+    ids = None
+    for offset, (name, app_args) in enumerate(MODES.items()):
+        port = args.port + offset
+        process = start_server(args, app_args, port)
+        try:
+            base_url = f'http://127.0.0.1:{port}'
+            if ids is None:
+                ids = seed(base_url, args.articles)
+            # Warm caches and pools before measuring
+            asyncio.run(drive(base_url, ids, args.concurrency, 2))
+            report(name, *asyncio.run(drive(base_url, ids, args.concurrency, args.duration)))
+        finally:
+            stop_server(process)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark of the Kafka producer settings
+
+Publishes synthetic article events to a local broker (the docker-compose
+Kafka exposed on localhost:29092, or any stand-in speaking the Kafka
+protocol such as Redpanda) with the former settings (one blocking send per
+event, no key, no linger, no compression) and with the keyed, batched
+configuration for each available compression codec.
+
+Usage (from the repository root, broker running):
+    python scripts/bench_kafka_producer.py [--bootstrap localhost:29092] [--events 5000]
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'flask-api'))
+
+from app.services.kafka_producer import COMPRESSION_CODECS, KafkaProducerService, codec_available  # noqa: E402
+
+
+def build_articles(count):
+    """Build article payloads shaped like Article.to_dict()"""
+    now = datetime.utcnow().isoformat()
+    return [
+        {
+            'id': i + 1,
+            'title': f'Benchmark article {i}',
+            'content': 'Lorem ipsum dolor sit amet, consectetur adipiscing elit. ' * 20,
+            'author': 'Jane Doe',
+            'category': 'technology',
+            'tags': ['python', 'kafka'],
+            'status': 'draft',
+            'views_count': 0,
+            'created_at': now,
+            'updated_at': now,
+            'published_at': None
+        }
+        for i in range(count)
+    ]
+
+
+def report(name, events, seconds, producer):
+    """Print throughput and the client's batching statistics"""
+    stats = producer.producer.metrics().get('producer-metrics', {})
+    print(
+        f"{name:<28} {events / seconds:10.0f} events/s  "
+        f"batch {stats.get('batch-size-avg', 0):8.0f} B  "
+        f"records/request {stats.get('records-per-request-avg', 0):6.1f}  "
+        f"compression {stats.get('compression-rate-avg', 1):5.2f}"
+    )
+
+
+def bench_blocking(args, articles):
+    """Former behaviour: unkeyed, uncompressed, one acknowledged send per event"""
+    producer = KafkaProducerService(args.bootstrap, args.topic, linger_ms=0,
+                                    compression_type='none', max_in_flight=1)
+    if not producer.connect():
+        sys.exit(f'Cannot connect to Kafka at {args.bootstrap}')
+
+    count = min(len(articles), args.blocking_events)
+    started = time.perf_counter()
+    for article in articles[:count]:
+        future = producer.producer.send(args.topic, value=producer.build_event('article.created', article))
+        future.get(timeout=10)
+    report('blocking (former)', count, time.perf_counter() - started, producer)
+    producer.close()
+
+
+def bench_batched(args, articles, compression):
+    """Keyed batches flushed once per chunk, as the outbox relay does"""
+    producer = KafkaProducerService(args.bootstrap, args.topic, linger_ms=args.linger_ms,
+                                    batch_size=args.batch_size, compression_type=compression,
+                                    max_in_flight=args.max_in_flight)
+    if not producer.connect():
+        sys.exit(f'Cannot connect to Kafka at {args.bootstrap}')
+
+    delivered = 0
+    started = time.perf_counter()
+    for start in range(0, len(articles), args.chunk):
+        delivered += producer.publish_events('article.created', articles[start:start + args.chunk])
+    elapsed = time.perf_counter() - started
+
+    if delivered != len(articles):
+        print(f'  warning: {len(articles) - delivered} events not acknowledged')
+    report(f'batched ({compression})', delivered, elapsed, producer)
+    producer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--bootstrap', default='localhost:29092', help='Kafka bootstrap servers')
+    parser.add_argument('--topic', default='article-events-bench', help='Benchmark topic (auto-created)')
+    parser.add_argument('--events', type=int, default=5000, help='Events per batched run')
+    parser.add_argument('--blocking-events', type=int, default=500, help='Events for the blocking run')
+    parser.add_argument('--chunk', type=int, default=100, help='Events per flush (OUTBOX_BATCH_SIZE)')
+    parser.add_argument('--linger-ms', type=int, default=5)
+    parser.add_argument('--batch-size', type=int, default=65536)
+    parser.add_argument('--max-in-flight', type=int, default=1)
+    args = parser.parse_args()
+
+    articles = build_articles(args.events)
+
+    bench_blocking(args, articles)
+    bench_batched(args, articles, 'none')
+    for compression in COMPRESSION_CODECS:
+        if codec_available(compression):
+            bench_batched(args, articles, compression)
+        else:
+            print(f"{'batched (' + compression + ')':<28} skipped, codec library not installed")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of the article serializers
+
+Checks that the precompiled serializer produces the same JSON as the
+marshmallow schemas, then times both on a page of articles.
+
+Usage (from the repository root):
+    python scripts/bench_serializer.py [--items 100] [--rounds 2000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'flask-api'))
+
+from app.models.article import Article, ArticleStatus  # noqa: E402
+from app.schemas.article_schema import ArticleResponseSchema, ArticleListSchema  # noqa: E402
+from app.schemas.fast_serializer import dumps, orjson, serialize_articles  # noqa: E402
+
+
+def build_articles(count):
+    """Build transient articles covering nulls, unicode and every status"""
+    now = datetime(2024, 1, 15, 10, 30, 0, 123456)
+    statuses = list(ArticleStatus)
+    articles = []
+    for i in range(count):
+        published = i % 3 == 0
+        articles.append(Article(
+            id=i + 1,
+            title=f'Article {i} — benchmark',
+            content='Lorem ipsum dolor sit amet. ' * 40,
+            author='Jane Doe' if i % 2 else 'José Núñez',
+            category=None if i % 7 == 0 else 'technology',
+            tags=['python', 'flask', 'api'][: i % 4],
+            status=statuses[i % len(statuses)],
+            views_count=i * 13,
+            created_at=now - timedelta(days=i),
+            updated_at=None if i % 5 == 0 else now,
+            published_at=now if published else None
+        ))
+    return articles
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--items', type=int, default=100, help='Articles per page')
+    parser.add_argument('--rounds', type=int, default=2000, help='Timed iterations')
+    args = parser.parse_args()
+
+    articles = build_articles(args.items)
+    page_info = {
+        'current_page': 1, 'total_pages': 5, 'per_page': args.items,
+        'total_items': args.items * 5, 'has_next': True, 'has_prev': False,
+        'total_exact': True
+    }
+
+    list_schema = ArticleListSchema()
+    item_schema = ArticleResponseSchema()
+
+    def marshmallow_list():
+        return json.dumps(list_schema.dump({'items': articles, 'page_info': page_info}),
+                          sort_keys=True, separators=(',', ':'))
+
+    def fast_list():
+        return dumps({'items': serialize_articles(articles), 'page_info': page_info})
+
+    # Parity: same decoded JSON, item by item and for the whole page
+    for article in articles:
+        expected = item_schema.dump(article)
+        actual = serialize_articles([article])[0]
+        assert actual == expected, f'Mismatch for article {article.id}: {actual} != {expected}'
+    assert json.loads(fast_list()) == json.loads(marshmallow_list()), 'List payload mismatch'
+    print(f'Parity OK ({args.items} articles, encoder: {"orjson" if orjson else "json"})')
+
+    for name, func in (('marshmallow + json', marshmallow_list), ('precompiled + fast json', fast_list)):
+        seconds = min(timeit.repeat(func, number=args.rounds, repeat=3))
+        per_call = seconds / args.rounds * 1e6
+        print(f'{name:<26} {per_call:10.1f} µs/page  {per_call / args.items:8.2f} µs/item')
+
+
+if __name__ == '__main__':
+    main()